@@ -0,0 +1,79 @@
+import asyncio
+
+import pyperf
+
+from ddtrace import config
+from ddtrace import tracer
+from ddtrace.contrib.asgi import TraceMiddleware
+from ddtrace.filters import TraceFilter
+
+
+VARIANTS = [
+    dict(fast_path=False, nchunks=1, nheaders=10),
+    dict(fast_path=True, nchunks=1, nheaders=10),
+    dict(fast_path=False, nchunks=100, nheaders=10),
+    dict(fast_path=True, nchunks=100, nheaders=10),
+    dict(fast_path=False, nchunks=1, nheaders=10, trace_headers=True),
+    dict(fast_path=True, nchunks=1, nheaders=10, trace_headers=True),
+]
+
+
+def make_app(nchunks):
+    async def app(scope, receive, send):
+        await receive()
+        await send({"type": "http.response.start", "status": 200, "headers": [(b"content-type", b"text/plain")]})
+        for _ in range(nchunks - 1):
+            await send({"type": "http.response.body", "body": b"*", "more_body": True})
+        await send({"type": "http.response.body", "body": b"*"})
+
+    return app
+
+
+async def receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+async def send(message):
+    pass
+
+
+def time_asgi_request(loops, variant):
+    config.asgi["fast_path"] = variant["fast_path"]
+    if variant.get("trace_headers"):
+        config.asgi.http.trace_headers(["header-0", "content-type"])
+
+    app = TraceMiddleware(make_app(variant["nchunks"]), tracer=tracer)
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "query_string": b"",
+        "scheme": "http",
+        "server": ("127.0.0.1", 8000),
+        "headers": [(("header-%d" % i).encode(), b"value") for i in range(variant["nheaders"])],
+    }
+
+    async def requests():
+        for _ in range(loops):
+            await app(scope, receive, send)
+
+    loop = asyncio.new_event_loop()
+    t0 = pyperf.perf_counter()
+    loop.run_until_complete(requests())
+    dt = pyperf.perf_counter() - t0
+    loop.close()
+    return dt
+
+
+# append a filter to drop traces so that no traces are encoded and sent to the agent
+class DropTraces(TraceFilter):
+    def process_trace(self, trace):
+        return
+
+
+if __name__ == "__main__":
+    runner = pyperf.Runner()
+    tracer.configure(settings={"FILTERS": [DropTraces()]})
+    for variant in VARIANTS:
+        name = "|".join(f"{k}:{v}" for (k, v) in variant.items())
+        runner.bench_time_func("scenario:asgi|" + name, time_asgi_request, variant)
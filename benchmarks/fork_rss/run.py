@@ -0,0 +1,86 @@
+"""Measure the memory copied by the workers forked from a preloaded application.
+
+The parent process loads the application, then forks workers that trace some work and collect the garbage. Each
+worker measures how much of the memory it shares with the parent it had to copy, from the growth of the private dirty
+memory reported in /proc/self/smaps_rollup. The average per worker is printed in kilobytes.
+"""
+import gc
+import os
+import sys
+
+
+WORKERS = 4
+
+
+def private_dirty_kb():
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith("Private_Dirty:"):
+                return int(line.split()[1])
+    raise RuntimeError("Private_Dirty not found in /proc/self/smaps_rollup")
+
+
+def load_application():
+    # Load a fair amount of code to stand for the application
+    import asyncio  # noqa
+    import decimal  # noqa
+    import email.mime.multipart  # noqa
+    import http.server  # noqa
+    import json  # noqa
+    import logging.handlers  # noqa
+    import sqlite3  # noqa
+    import xml.dom.minidom  # noqa
+
+    if os.getenv("DDTRACE") == "1":
+        import ddtrace
+
+        ddtrace.patch_all()
+
+
+def work():
+    if os.getenv("DDTRACE") == "1":
+        from ddtrace import tracer
+
+        for _ in range(100):
+            with tracer.trace("request", service="fork-rss"):
+                with tracer.trace("query"):
+                    pass
+    gc.collect()
+
+
+def main():
+    if os.getenv("FREEZE") == "1":
+        import ddtrace.preload
+
+        ddtrace.preload.disable_gc()
+
+    load_application()
+    if os.getenv("FREEZE") == "1":
+        import ddtrace.preload
+
+        ddtrace.preload.freeze()
+
+    pids = []
+    for _ in range(WORKERS):
+        r, w = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(r)
+            start = private_dirty_kb()
+            work()
+            os.write(w, str(private_dirty_kb() - start).encode())
+            os._exit(0)
+        os.close(w)
+        pids.append((pid, r))
+
+    growths = []
+    for pid, r in pids:
+        growths.append(int(os.read(r, 64)))
+        os.close(r)
+        os.waitpid(pid, 0)
+
+    sys.stdout.write("private dirty memory growth per worker: %d kB\n" % (sum(growths) / len(growths)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""Default settings of the integrations.
+
+The defaults are kept apart from the integrations so that ``patch_all()`` can register the settings of an integration
+without importing it: the integration itself is only imported when its library is first imported.
+"""
+from typing import Any
+from typing import Callable
+from typing import Dict
+
+from ..ext import mongo as mongox
+from ..settings import _config as config
+from ..utils.formats import asbool
+from ..utils.formats import get_env
+
+
+# DEV: <config name> => <function returning the default settings>
+# DEV: The settings are built when they are registered so that the environment is read at that time
+INTEGRATION_DEFAULTS = {
+    "aiohttp": lambda: dict(
+        distributed_tracing=True,
+    ),
+    "algoliasearch": lambda: dict(
+        _default_service="algoliasearch",
+        collect_query_text=False,
+    ),
+    "botocore": lambda: {
+        "distributed_tracing": get_env("botocore", "distributed_tracing", default=True),
+        "invoke_with_legacy_context": get_env("botocore", "invoke_with_legacy_context", default=False),
+    },
+    "bottle": lambda: dict(
+        distributed_tracing=asbool(get_env("bottle", "distributed_tracing", default=True)),
+    ),
+    "celery": lambda: {
+        "distributed_tracing": get_env("celery", "distributed_tracing", default=False),
+        "producer_service_name": get_env(
+            "celery", "producer_service_name", default=config._get_service(default="celery-producer")
+        ),
+        "worker_service_name": get_env(
+            "celery", "worker_service_name", default=config._get_service(default="celery-worker")
+        ),
+    },
+    "django": lambda: dict(
+        _default_service="django",
+        cache_service_name=get_env("django", "cache_service_name") or "django",
+        database_service_name_prefix=get_env("django", "database_service_name_prefix", default=""),
+        database_service_name=get_env("django", "database_service_name", default=""),
+        trace_fetch_methods=asbool(get_env("django", "trace_fetch_methods", default=False)),
+        distributed_tracing_enabled=True,
+        instrument_middleware=asbool(get_env("django", "instrument_middleware", default=True)),
+        middleware_tracing_mode=get_env("django", "middleware_tracing_mode", default="all"),
+        instrument_databases=True,
+        instrument_caches=True,
+        analytics_enabled=None,  # None allows the value to be overridden by the global config
+        analytics_sample_rate=None,
+        trace_query_string=None,  # Default to global config
+        include_user_name=True,
+        use_handler_resource_format=asbool(get_env("django", "use_handler_resource_format", default=False)),
+        use_legacy_resource_format=asbool(get_env("django", "use_legacy_resource_format", default=False)),
+        resource_name_cache=asbool(get_env("django", "resource_name_cache", default=True)),
+    ),
+    "falcon": lambda: dict(
+        distributed_tracing=asbool(get_env("falcon", "distributed_tracing", default=True)),
+    ),
+    "fastapi": lambda: dict(
+        _default_service="fastapi",
+        request_span_name="fastapi.request",
+        distributed_tracing=True,
+        aggregate_resources=True,
+    ),
+    "flask": lambda: dict(
+        # Flask service configuration
+        _default_service="flask",
+        app="flask",
+        collect_view_args=True,
+        distributed_tracing_enabled=True,
+        template_default_name="<memory>",
+        trace_signals=True,
+    ),
+    "futures": lambda: dict(
+        metrics_enabled=asbool(get_env("futures", "metrics_enabled", default=True)),
+    ),
+    "grpc": lambda: dict(
+        _default_service="grpc-client",
+        distributed_tracing_enabled=True,
+    ),
+    "grpc_server": lambda: dict(
+        _default_service="grpc-server",
+        distributed_tracing_enabled=True,
+    ),
+    "httplib": lambda: {
+        "distributed_tracing": asbool(get_env("httplib", "distributed_tracing", default=True)),
+    },
+    "jinja2": lambda: {
+        "service_name": get_env("jinja2", "service_name"),
+    },
+    "kombu": lambda: {
+        "service_name": config.service or get_env("kombu", "service_name", default="kombu"),
+    },
+    "logging": lambda: dict(
+        tracer=None,  # by default, override here for custom tracer
+        lazy=asbool(get_env("logs", "injection_lazy", default=False)),
+    ),
+    "mariadb": lambda: dict(
+        trace_fetch_methods=asbool(get_env("mariadb", "trace_fetch_methods", default=False)),
+        _default_service="mariadb",
+    ),
+    "molten": lambda: dict(
+        _default_service="molten",
+        app="molten",
+        distributed_tracing=asbool(get_env("molten", "distributed_tracing", default=True)),
+    ),
+    "mysql": lambda: dict(
+        _default_service="mysql",
+        trace_fetch_methods=asbool(get_env("mysql", "trace_fetch_methods", default=False)),
+    ),
+    "mysqldb": lambda: dict(
+        _default_service="mysql",
+        trace_fetch_methods=asbool(get_env("mysqldb", "trace_fetch_methods", default=False)),
+    ),
+    "psycopg": lambda: dict(
+        _default_service="postgres",
+        trace_fetch_methods=asbool(get_env("psycopg", "trace_fetch_methods", default=False)),
+    ),
+    "pylons": lambda: dict(
+        distributed_tracing=asbool(get_env("pylons", "distributed_tracing", default=True)),
+    ),
+    "pymongo": lambda: dict(
+        _default_service=mongox.SERVICE,
+    ),
+    "pymysql": lambda: dict(
+        # TODO[v1.0] this should be "mysql"
+        _default_service="pymysql",
+        trace_fetch_methods=asbool(get_env("pymysql", "trace_fetch_methods", default=False)),
+    ),
+    "pynamodb": lambda: {
+        "_default_service": "pynamodb",
+    },
+    "pyodbc": lambda: dict(
+        _default_service="pyodbc",
+        trace_fetch_methods=asbool(get_env("pyodbc", "trace_fetch_methods", default=False)),
+    ),
+    "pyramid": lambda: dict(
+        distributed_tracing=asbool(get_env("pyramid", "distributed_tracing", default=True)),
+    ),
+    "redis": lambda: dict(
+        _default_service="redis",
+    ),
+    "requests": lambda: {
+        "distributed_tracing": asbool(get_env("requests", "distributed_tracing", default=True)),
+        "split_by_domain": asbool(get_env("requests", "split_by_domain", default=False)),
+        "_default_service": "requests",
+    },
+    "sanic": lambda: dict(
+        _default_service="sanic",
+        distributed_tracing=True,
+    ),
+    "sqlite": lambda: dict(
+        _default_service="sqlite",
+        trace_fetch_methods=asbool(get_env("sqlite", "trace_fetch_methods", default=False)),
+    ),
+    "starlette": lambda: dict(
+        _default_service="starlette",
+        request_span_name="starlette.request",
+        distributed_tracing=True,
+        aggregate_resources=True,
+    ),
+    "urllib3": lambda: {
+        "_default_service": "urllib3",
+        "distributed_tracing": asbool(get_env("urllib3", "distributed_tracing", default=True)),
+        "split_by_domain": asbool(get_env("urllib3", "split_by_domain", default=False)),
+    },
+    "vertica": lambda: {
+        "_default_service": "vertica",
+        "app": "vertica",
+    },
+}  # type: Dict[str, Callable[[], Dict[str, Any]]]
+
+# The integrations whose configs are not named after the integration
+# DEV: <contrib name> => <list of config names>
+_CONFIGS_FOR_CONTRIB = {
+    "grpc": ("grpc", "grpc_server"),
+    "sqlite3": ("sqlite",),
+}
+
+
+def add_config(name):
+    # type: (str) -> None
+    """Register the default settings of the ``name`` config, keeping the settings already set."""
+    config._add(name, INTEGRATION_DEFAULTS[name]())
+
+
+def add_contrib_configs(contrib):
+    # type: (str) -> None
+    """Register the default settings of the configs of the ``contrib`` integration."""
+    for name in _CONFIGS_FOR_CONTRIB.get(contrib, (contrib,)):
+        if name in INTEGRATION_DEFAULTS:
+            add_config(name)
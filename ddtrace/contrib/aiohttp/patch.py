@@ -3,6 +3,7 @@ from ddtrace.vendor import wrapt
 
 from ...pin import Pin
 from ...utils.wrappers import unwrap
+from .._defaults import add_config
 
 
 try:
@@ -16,12 +17,7 @@ except ImportError:
     template_module = False
 
 
-config._add(
-    "aiohttp",
-    dict(
-        distributed_tracing=True,
-    ),
-)
+add_config("aiohttp")
 
 
 def patch():
@@ -6,6 +6,7 @@ from ddtrace.vendor.wrapt import wrap_function_wrapper as _w
 
 from .. import trace_utils
 from ...constants import SPAN_MEASURED_KEY
+from .._defaults import add_config
 
 
 DD_PATCH_ATTR = "_datadog_patch"
@@ -20,7 +21,7 @@ try:
     algoliasearch_version = tuple([int(i) for i in VERSION.split(".")])
 
     # Default configuration
-    config._add("algoliasearch", dict(_default_service=SERVICE_NAME, collect_query_text=False))
+    add_config("algoliasearch")
 except ImportError:
     algoliasearch_version = (0, 0)
 
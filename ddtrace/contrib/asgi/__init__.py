@@ -39,6 +39,17 @@ Configuration
 
    Default: ``True``
 
+.. py:data:: ddtrace.config.asgi['fast_path']
+
+   Whether to use the lower overhead mode of the middleware. In this mode only the distributed tracing headers of
+   the requests are decoded, the raw headers are matched against the traced headers, and the messages sent by the
+   application after the start of the response are passed through without any processing, which benefits streaming
+   responses.
+
+   Can also be enabled with the ``DD_ASGI_FAST_PATH`` environment variable.
+
+   Default: ``False``
+
 .. py:data:: ddtrace.config.asgi['service_name']
 
    The service name reported for your ASGI app.
@@ -5,6 +5,8 @@ from ddtrace import config
 from ddtrace.constants import ANALYTICS_SAMPLE_RATE_KEY
 from ddtrace.ext import SpanTypes
 from ddtrace.ext import http
+from ddtrace.utils.formats import asbool
+from ddtrace.utils.formats import get_env
 
 from .. import trace_utils
 from ...internal.compat import reraise
@@ -16,7 +18,12 @@ log = get_logger(__name__)
 
 config._add(
     "asgi",
-    dict(service_name=config._get_service(default="asgi"), request_span_name="asgi.request", distributed_tracing=True),
+    dict(
+        service_name=config._get_service(default="asgi"),
+        request_span_name="asgi.request",
+        distributed_tracing=True,
+        fast_path=asbool(get_env("asgi", "fast_path", default=False)),
+    ),
 )
 
 ASGI_VERSION = "asgi.version"
@@ -53,6 +60,15 @@ def _extract_headers(scope):
     return {}
 
 
+def _extract_propagation_headers(scope):
+    """Decode only the distributed tracing headers of the raw headers of a scope."""
+    headers = scope.get("headers")
+    if headers:
+        # ASGI header names are lowercased
+        return dict((k.decode("latin-1"), v.decode("latin-1")) for (k, v) in headers if k.startswith(b"x-datadog-"))
+    return {}
+
+
 def _default_handle_exception_span(exc, span):
     """Default handler for exception for span"""
     span.set_tag(http.STATUS_CODE, 500)
@@ -85,10 +101,16 @@ class TraceMiddleware:
         if scope["type"] != "http":
             return await self.app(scope, receive, send)
 
-        headers = _extract_headers(scope)
+        fast_path = self.integration_config.get("fast_path", config.asgi.fast_path)
+        if fast_path:
+            # The raw headers are tagged as is, only the propagation headers are decoded
+            headers = scope.get("headers")
+            propagation_headers = _extract_propagation_headers(scope)
+        else:
+            headers = propagation_headers = _extract_headers(scope)
 
         trace_utils.activate_distributed_headers(
-            self.tracer, int_config=self.integration_config, request_headers=headers
+            self.tracer, int_config=self.integration_config, request_headers=propagation_headers
         )
 
         resource = "{} {}".format(scope["method"], scope["path"])
@@ -131,22 +153,40 @@ class TraceMiddleware:
         tags = _extract_versions_from_scope(scope, self.integration_config)
         span.set_tags(tags)
 
-        async def wrapped_send(message):
-            if span and message.get("type") == "http.response.start" and "status" in message:
-                status_code = message["status"]
-            else:
-                status_code = None
+        if fast_path:
+            response_started = []
+
+            def wrapped_send(message):
+                # Only the response start message is tagged: return the awaitable of the original send to avoid an
+                # extra coroutine for each body chunk of streaming responses.
+                if not response_started and message.get("type") == "http.response.start":
+                    response_started.append(True)
+                    trace_utils.set_http_meta(
+                        span,
+                        self.integration_config,
+                        status_code=message.get("status"),
+                        response_headers=message.get("headers"),
+                    )
+                return send(message)
+
+        else:
+
+            async def wrapped_send(message):
+                if span and message.get("type") == "http.response.start" and "status" in message:
+                    status_code = message["status"]
+                else:
+                    status_code = None
 
-            if "headers" in message:
-                response_headers = message["headers"]
-            else:
-                response_headers = None
+                if "headers" in message:
+                    response_headers = message["headers"]
+                else:
+                    response_headers = None
 
-            trace_utils.set_http_meta(
-                span, self.integration_config, status_code=status_code, response_headers=response_headers
-            )
+                trace_utils.set_http_meta(
+                    span, self.integration_config, status_code=status_code, response_headers=response_headers
+                )
 
-            return await send(message)
+                return await send(message)
 
         try:
             return await self.app(scope, receive, wrapped_send)
@@ -37,6 +37,29 @@ threads:
     * ``create_task(coro)``: creates a new asyncio ``Task`` that inherits the
       current active ``Context`` so that generated traces in the new task are
       attached to the main trace
+
+The health of an event loop can be monitored with a ``LoopMonitor``. It measures
+the lag of the loop, i.e. how late it runs a periodic callback, counts the
+pending tasks and, optionally, reports the callbacks that block the loop for
+longer than a threshold. The measures are sent with the runtime metrics, which
+must be enabled::
+
+    from ddtrace.contrib.asyncio import LoopMonitor
+
+    monitor = LoopMonitor(interval=1.0, slow_callback_threshold=0.1, tag_root_span=True)
+    monitor.start(loop)
+
+The following distributions are reported:
+
+    * ``runtime.python.asyncio.loop.lag``: the lag of the loop, in seconds
+    * ``runtime.python.asyncio.task_count``: the number of pending tasks
+    * ``runtime.python.asyncio.slow_callback``: the duration of the slow
+      callbacks, in seconds
+
+With ``tag_root_span=True``, the total duration (in nanoseconds) and the
+number of the slow callbacks run for a trace are set on its root span as the
+``asyncio.slow_callback.duration`` and ``asyncio.slow_callback.count``
+metrics. This requires Python 3.7 or later.
 """
 from ...utils.importlib import require_modules
 
@@ -57,6 +80,7 @@ with require_modules(required_modules) as missing_modules:
         from .helpers import ensure_future
         from .helpers import run_in_executor
         from .helpers import set_call_context
+        from .monitor import LoopMonitor
         from .patch import patch
 
-        __all__ = ["context_provider", "set_call_context", "ensure_future", "run_in_executor", "patch"]
+        __all__ = ["context_provider", "set_call_context", "ensure_future", "run_in_executor", "patch", "LoopMonitor"]
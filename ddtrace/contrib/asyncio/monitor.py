@@ -0,0 +1,168 @@
+"""Event loop health monitoring.
+
+A :class:`LoopMonitor` measures how late the event loop runs a periodic callback, which is the time any callback
+waits before being run, and counts the pending tasks. It can also time the callbacks run by the loop to find the ones
+that block it for longer than a threshold.
+
+The measures are reported by the runtime metrics as distributions.
+"""
+import asyncio
+import threading
+import time
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+from ...internal.logger import get_logger
+from ...internal.runtime.constants import ASYNCIO_LOOP_LAG
+from ...internal.runtime.constants import ASYNCIO_SLOW_CALLBACK
+from ...internal.runtime.constants import ASYNCIO_TASK_COUNT
+from ...provider import _DD_CONTEXTVAR
+from ...span import Span
+
+
+log = get_logger(__name__)
+
+# Metrics set on the root spans with the total duration (in nanoseconds) and the number of the slow callbacks run for
+# them
+SPAN_SLOW_CALLBACK_DURATION = "asyncio.slow_callback.duration"
+SPAN_SLOW_CALLBACK_COUNT = "asyncio.slow_callback.count"
+
+_monitors = {}  # type: Dict[asyncio.AbstractEventLoop, LoopMonitor]
+_lock = threading.Lock()
+_handle_run = asyncio.events.Handle._run
+
+
+def _all_tasks(loop):
+    try:
+        return asyncio.all_tasks(loop)
+    except AttributeError:
+        # Python < 3.7
+        return {t for t in asyncio.Task.all_tasks(loop) if not t.done()}
+
+
+def _timed_handle_run(self):
+    monitor = _monitors.get(self._loop)
+    if monitor is None or monitor.slow_callback_threshold is None:
+        return _handle_run(self)
+
+    start = time.monotonic()
+    try:
+        return _handle_run(self)
+    finally:
+        duration = time.monotonic() - start
+        if duration >= monitor.slow_callback_threshold:
+            monitor._on_slow_callback(self, duration)
+
+
+class LoopMonitor(object):
+    """Monitor the health of an event loop.
+
+    :param interval: The interval in seconds at which the loop lag and the pending tasks are measured.
+    :param slow_callback_threshold: The duration in seconds above which a callback is reported as slow. The
+        callbacks are not timed if ``None``.
+    :param tag_root_span: Whether to add the slow callbacks to the root span of the trace they ran for. Only
+        available on Python ≥ 3.7.
+    """
+
+    # Bound the memory used if the metrics are not collected
+    MAX_SAMPLES = 10000
+
+    def __init__(self, interval=1.0, slow_callback_threshold=None, tag_root_span=False):
+        # type: (float, Optional[float], bool) -> None
+        self.interval = interval
+        self.slow_callback_threshold = slow_callback_threshold
+        self.tag_root_span = tag_root_span
+        self._loop = None  # type: Optional[asyncio.AbstractEventLoop]
+        self._timer = None  # type: Optional[asyncio.TimerHandle]
+        self._expected = 0.0
+        self._samples = []  # type: List[Tuple[str, float]]
+
+    def start(self, loop=None):
+        # type: (Optional[asyncio.AbstractEventLoop]) -> None
+        """Start monitoring the loop, the current event loop by default.
+
+        This can be called from any thread.
+        """
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        with _lock:
+            if loop in _monitors:
+                raise RuntimeError("The event loop is already monitored")
+            _monitors[loop] = self
+            if self.slow_callback_threshold is not None:
+                asyncio.events.Handle._run = _timed_handle_run
+        self._loop = loop
+        loop.call_soon_threadsafe(self._schedule)
+
+    def stop(self):
+        # type: () -> None
+        """Stop monitoring the loop."""
+        loop = self._loop
+        if loop is None:
+            return
+        with _lock:
+            _monitors.pop(loop, None)
+            if not any(m.slow_callback_threshold is not None for m in _monitors.values()):
+                asyncio.events.Handle._run = _handle_run
+        self._loop = None
+        if not loop.is_closed():
+            loop.call_soon_threadsafe(self._cancel)
+
+    def _cancel(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+    def _schedule(self):
+        if self._loop is None:
+            return
+        self._expected = self._loop.time() + self.interval
+        self._timer = self._loop.call_later(self.interval, self._tick)
+
+    def _add_sample(self, metric, value):
+        # type: (str, float) -> None
+        if len(self._samples) < self.MAX_SAMPLES:
+            self._samples.append((metric, value))
+
+    def _tick(self):
+        loop = self._loop
+        if loop is None:
+            return
+        self._add_sample(ASYNCIO_LOOP_LAG, max(0.0, loop.time() - self._expected))
+        self._add_sample(ASYNCIO_TASK_COUNT, len(_all_tasks(loop)))
+        self._schedule()
+
+    def _on_slow_callback(self, handle, duration):
+        # type: (asyncio.Handle, float) -> None
+        self._add_sample(ASYNCIO_SLOW_CALLBACK, duration)
+        log.debug("Slow asyncio callback %r took %.3f seconds", handle, duration)
+
+        # The context of the handles is only available on Python ≥ 3.7
+        context = getattr(handle, "_context", None)
+        if not self.tag_root_span or context is None:
+            return
+        span = context.get(_DD_CONTEXTVAR)
+        if not isinstance(span, Span):
+            return
+        root = span._local_root
+        if root is None or root.finished:
+            return
+        duration_ns = int(duration * 1e9)
+        root.metrics[SPAN_SLOW_CALLBACK_DURATION] = root.metrics.get(SPAN_SLOW_CALLBACK_DURATION, 0) + duration_ns
+        root.metrics[SPAN_SLOW_CALLBACK_COUNT] = root.metrics.get(SPAN_SLOW_CALLBACK_COUNT, 0) + 1
+
+    def collect(self):
+        # type: () -> List[Tuple[str, float]]
+        """Return and forget the measures taken since the last call."""
+        samples, self._samples = self._samples, []
+        return samples
+
+
+def collect():
+    # type: () -> List[Tuple[str, float]]
+    """Return and forget the measures taken by all the monitors since the last call."""
+    with _lock:
+        monitors = list(_monitors.values())
+    return [sample for monitor in monitors for sample in monitor.collect()]
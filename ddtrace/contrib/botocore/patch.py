@@ -20,8 +20,8 @@ from ...internal.logger import get_logger
 from ...pin import Pin
 from ...propagation.http import HTTPPropagator
 from ...utils.formats import deep_getattr
-from ...utils.formats import get_env
 from ...utils.wrappers import unwrap
+from .._defaults import add_config
 
 
 # Original botocore client class
@@ -33,13 +33,7 @@ TRACED_ARGS = {"params", "path", "verb"}
 log = get_logger(__name__)
 
 # Botocore default settings
-config._add(
-    "botocore",
-    {
-        "distributed_tracing": get_env("botocore", "distributed_tracing", default=True),
-        "invoke_with_legacy_context": get_env("botocore", "invoke_with_legacy_context", default=False),
-    },
-)
+add_config("botocore")
 
 
 def inject_trace_data_to_message_attributes(trace_data, entry):
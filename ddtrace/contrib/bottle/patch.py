@@ -3,18 +3,12 @@ import bottle
 from ddtrace import config
 from ddtrace.vendor import wrapt
 
-from ...utils.formats import asbool
-from ...utils.formats import get_env
+from .._defaults import add_config
 from .trace import TracePlugin
 
 
 # Configure default configuration
-config._add(
-    "bottle",
-    dict(
-        distributed_tracing=asbool(get_env("bottle", "distributed_tracing", default=True)),
-    ),
-)
+add_config("bottle")
 
 
 def patch():
@@ -1,23 +1,12 @@
 import celery
 
-from ddtrace import config
-
-from ...utils.formats import get_env
+from .._defaults import add_config
 from .app import patch_app
 from .app import unpatch_app
-from .constants import PRODUCER_SERVICE
-from .constants import WORKER_SERVICE
 
 
 # Celery default settings
-config._add(
-    "celery",
-    {
-        "distributed_tracing": get_env("celery", "distributed_tracing", default=False),
-        "producer_service_name": get_env("celery", "producer_service_name", default=PRODUCER_SERVICE),
-        "worker_service_name": get_env("celery", "worker_service_name", default=WORKER_SERVICE),
-    },
-)
+add_config("celery")
 
 
 def patch():
@@ -9,8 +9,11 @@ from ...constants import ANALYTICS_SAMPLE_RATE_KEY
 from ...constants import SPAN_MEASURED_KEY
 from ...ext import SpanTypes
 from ...ext import sql
+from ...internal.compat import time_ns
 from ...internal.logger import get_logger
+from ...internal.sql import obfuscate_query
 from ...pin import Pin
+from ...utils.formats import get_env
 from ...vendor import wrapt
 from ..trace_utils import ext_service
 from ..trace_utils import iswrapped
@@ -24,10 +27,53 @@ config._add(
     dict(
         _default_service="db",
         trace_fetch_methods=None,  # Part of the API. Should be implemented at the integration level.
+        # Number of fetch calls traced individually for each query before the next ones are aggregated in one span.
+        # 0 disables the aggregation.
+        fetch_aggregation_threshold=int(get_env("dbapi", "fetch_aggregation_threshold", default=0)),
     ),
 )
 
 
+class _FetchAggregate(object):
+    """Statistics of the fetch calls of a cursor that are reported in a single span."""
+
+    __slots__ = (
+        "parent",
+        "name",
+        "resource",
+        "start_ns",
+        "end_ns",
+        "count",
+        "rows",
+        "min_duration_ns",
+        "max_duration_ns",
+        "total_duration_ns",
+    )
+
+    def __init__(self, parent, name, resource, start_ns):
+        self.parent = parent
+        self.name = name
+        self.resource = resource
+        self.start_ns = start_ns
+        self.end_ns = start_ns
+        self.count = 0
+        self.rows = 0
+        self.min_duration_ns = None
+        self.max_duration_ns = 0
+        self.total_duration_ns = 0
+
+    def add(self, start_ns, end_ns, rows):
+        duration_ns = end_ns - start_ns
+        self.end_ns = end_ns
+        self.count += 1
+        self.rows += rows
+        self.total_duration_ns += duration_ns
+        if self.min_duration_ns is None or duration_ns < self.min_duration_ns:
+            self.min_duration_ns = duration_ns
+        if duration_ns > self.max_duration_ns:
+            self.max_duration_ns = duration_ns
+
+
 class TracedCursor(wrapt.ObjectProxy):
     """TracedCursor wraps a psql cursor and traces its queries."""
 
@@ -38,13 +84,16 @@ class TracedCursor(wrapt.ObjectProxy):
         self._self_datadog_name = "{}.query".format(name)
         self._self_last_execute_operation = None
         self._self_config = cfg or config.dbapi2
+        self._self_fetch_calls = 0
+        self._self_fetch_aggregate = None
 
     def _trace_method(self, method, name, resource, extra_tags, *args, **kwargs):
         """
         Internal function to trace the call to the underlying cursor method
         :param method: The callable to be wrapped
         :param name: The name of the resulting span.
-        :param resource: The sql query. Sql queries are obfuscated on the agent side.
+        :param resource: The sql query. Sql queries are obfuscated on the agent side, or here when
+        ``config.sql_obfuscation`` is enabled.
         :param extra_tags: A dict of tags to store into the span's meta
         :param args: The args that will be passed as positional args to the wrapped method
         :param kwargs: The args that will be passed as kwargs to the wrapped method
@@ -54,6 +103,8 @@ class TracedCursor(wrapt.ObjectProxy):
         if not pin or not pin.enabled():
             return method(*args, **kwargs)
         measured = name == self._self_datadog_name
+        if config.sql_obfuscation and isinstance(resource, six.string_types):
+            resource = obfuscate_query(resource, pin.app)
 
         with pin.tracer.trace(
             name, service=ext_service(pin, self._self_config), resource=resource, span_type=SpanTypes.SQL
@@ -84,6 +135,7 @@ class TracedCursor(wrapt.ObjectProxy):
 
     def executemany(self, query, *args, **kwargs):
         """Wraps the cursor.executemany method"""
+        self._reset_fetch_calls()
         self._self_last_execute_operation = query
         # Always return the result as-is
         # DEV: Some libraries return `None`, others `int`, and others the cursor objects
@@ -102,6 +154,7 @@ class TracedCursor(wrapt.ObjectProxy):
 
     def execute(self, query, *args, **kwargs):
         """Wraps the cursor.execute method"""
+        self._reset_fetch_calls()
         self._self_last_execute_operation = query
 
         # Always return the result as-is
@@ -111,9 +164,13 @@ class TracedCursor(wrapt.ObjectProxy):
 
     def callproc(self, proc, *args):
         """Wraps the cursor.callproc method"""
+        self._reset_fetch_calls()
         self._self_last_execute_operation = proc
         return self._trace_method(self.__wrapped__.callproc, self._self_datadog_name, proc, {}, proc, *args)
 
+    def _reset_fetch_calls(self):
+        pass
+
     def __enter__(self):
         # previous versions of the dbapi didn't support context managers. let's
         # reference the func that would be called to ensure that errors
@@ -129,21 +186,102 @@ class FetchTracedCursor(TracedCursor):
     Sub-class of :class:`TracedCursor` that also instruments `fetchone`, `fetchall`, and `fetchmany` methods.
 
     We do not trace these functions by default since they can get very noisy (e.g. `fetchone` with 100k rows).
+
+    When the ``fetch_aggregation_threshold`` setting is greater than 0, only that many fetch calls are traced for
+    each query. The following ones are reported in a single ``<name>.fetch`` span with the number of calls, the
+    number of rows and the distribution of the durations of the calls as metrics. That span is finished when the
+    rows are exhausted, when another query is executed, when the cursor is closed or when the parent span finishes.
     """
 
+    def _trace_fetch_method(self, method, name, extra_tags, single_row, *args, **kwargs):
+        threshold = self._self_config.get("fetch_aggregation_threshold", config.dbapi2.fetch_aggregation_threshold)
+        if not threshold or self._self_fetch_calls < threshold:
+            self._self_fetch_calls += 1
+            return self._trace_method(method, name, self._self_last_execute_operation, extra_tags, *args, **kwargs)
+
+        pin = Pin.get_from(self)
+        if not pin or not pin.enabled():
+            return method(*args, **kwargs)
+
+        start_ns = time_ns()
+        if self._self_fetch_aggregate is None:
+            parent = pin.tracer.current_span()
+            aggregate = self._self_fetch_aggregate = _FetchAggregate(
+                parent,
+                "{}.{}".format(self._self_datadog_name, "fetch"),
+                self._self_last_execute_operation,
+                start_ns,
+            )
+            if parent is not None:
+                # Cursors are not always closed (or are pooled): report the aggregated span at the latest when its
+                # parent finishes, before the tracer gets a chance to flush the trace.
+                def _on_parent_finish(span):
+                    if self._self_fetch_aggregate is aggregate:
+                        self._finish_fetch_aggregate()
+
+                parent._on_finish_callbacks.insert(0, _on_parent_finish)
+        result = method(*args, **kwargs)
+        if single_row:
+            rows = 0 if result is None else 1
+        else:
+            rows = len(result) if result else 0
+        self._self_fetch_aggregate.add(start_ns, time_ns(), rows)
+        if not rows:
+            # The rows are exhausted
+            self._finish_fetch_aggregate()
+        return result
+
+    def _finish_fetch_aggregate(self):
+        aggregate = self._self_fetch_aggregate
+        if aggregate is None:
+            return
+        self._self_fetch_aggregate = None
+
+        pin = Pin.get_from(self)
+        if not pin or not pin.enabled():
+            return
+
+        resource = aggregate.resource
+        if config.sql_obfuscation and isinstance(resource, six.string_types):
+            resource = obfuscate_query(resource, pin.app)
+        span = pin.tracer.start_span(
+            aggregate.name,
+            child_of=aggregate.parent,
+            service=ext_service(pin, self._self_config),
+            resource=resource,
+            span_type=SpanTypes.SQL,
+        )
+        span.start_ns = aggregate.start_ns
+        span.set_tags(pin.tags)
+        span.set_metric("db.fetch.count", aggregate.count)
+        span.set_metric("db.fetch.rows", aggregate.rows)
+        span.set_metric("db.fetch.duration.min", aggregate.min_duration_ns)
+        span.set_metric("db.fetch.duration.max", aggregate.max_duration_ns)
+        span.set_metric("db.fetch.duration.avg", aggregate.total_duration_ns // aggregate.count)
+        span.finish(aggregate.end_ns / 1e9)
+
+    def _reset_fetch_calls(self):
+        self._finish_fetch_aggregate()
+        self._self_fetch_calls = 0
+
+    def close(self, *args, **kwargs):
+        """Wraps the cursor.close method"""
+        self._finish_fetch_aggregate()
+        return self.__wrapped__.close(*args, **kwargs)
+
+    def __exit__(self, *args, **kwargs):
+        self._finish_fetch_aggregate()
+        return self.__wrapped__.__exit__(*args, **kwargs)
+
     def fetchone(self, *args, **kwargs):
         """Wraps the cursor.fetchone method"""
         span_name = "{}.{}".format(self._self_datadog_name, "fetchone")
-        return self._trace_method(
-            self.__wrapped__.fetchone, span_name, self._self_last_execute_operation, {}, *args, **kwargs
-        )
+        return self._trace_fetch_method(self.__wrapped__.fetchone, span_name, {}, True, *args, **kwargs)
 
     def fetchall(self, *args, **kwargs):
         """Wraps the cursor.fetchall method"""
         span_name = "{}.{}".format(self._self_datadog_name, "fetchall")
-        return self._trace_method(
-            self.__wrapped__.fetchall, span_name, self._self_last_execute_operation, {}, *args, **kwargs
-        )
+        return self._trace_fetch_method(self.__wrapped__.fetchall, span_name, {}, False, *args, **kwargs)
 
     def fetchmany(self, *args, **kwargs):
         """Wraps the cursor.fetchmany method"""
@@ -159,9 +297,7 @@ class FetchTracedCursor(TracedCursor):
             default_array_size = getattr(self.__wrapped__, "arraysize", None)
             extra_tags = {size_tag_key: default_array_size} if default_array_size else {}
 
-        return self._trace_method(
-            self.__wrapped__.fetchmany, span_name, self._self_last_execute_operation, extra_tags, *args, **kwargs
-        )
+        return self._trace_fetch_method(self.__wrapped__.fetchmany, span_name, extra_tags, False, *args, **kwargs)
 
 
 class TracedConnection(wrapt.ObjectProxy):
@@ -87,6 +87,20 @@ Configuration
 
    Default: ``True``
 
+.. py:data:: ddtrace.config.django['middleware_tracing_mode']
+
+   How the middleware are traced when ``instrument_middleware`` is enabled:
+
+   - ``"all"``: a ``django.middleware`` span is created for each middleware hook.
+   - ``"sampled"``: the ``django.middleware`` spans are only created for the sampled traces.
+   - ``"aggregate"``: a single ``django.middleware`` span is created for each request, with a
+     ``<middleware hook>.duration`` metric in nanoseconds for each middleware hook. The durations
+     of the ``__call__`` hooks include the durations of the following middleware and of the view.
+
+   Can also be set with the ``DD_DJANGO_MIDDLEWARE_TRACING_MODE`` environment variable.
+
+   Default: ``"all"``
+
 .. py:data:: ddtrace.config.django['instrument_databases']
 
    Whether or not to instrument databases.
@@ -121,6 +135,14 @@ Configuration
 
    Default: ``False``
 
+.. py:data:: ddtrace.config.django['resource_name_cache']
+
+   Whether or not to cache the handler names and the URL patterns used for the
+   resource names of the views instead of computing them on every request. Can
+   also be set with the ``DD_DJANGO_RESOURCE_NAME_CACHE`` environment variable.
+
+   Default: ``True``
+
 .. py:data:: ddtrace.config.django['use_legacy_resource_format']
 
    Whether or not to use the legacy resource format `"{handler}"`. Can also be
@@ -29,38 +29,19 @@ except ImportError:
 from ddtrace.ext import SpanTypes
 from ddtrace.ext import http
 from ddtrace.ext import sql as sqlx
+from ddtrace.internal import compat
 from ddtrace.internal.compat import maybe_stringify
 from ddtrace.internal.logger import get_logger
-from ddtrace.utils.formats import asbool
-from ddtrace.utils.formats import get_env
 from ddtrace.vendor import wrapt
 
 from . import utils
 from .. import trace_utils
+from .._defaults import add_config
 
 
 log = get_logger(__name__)
 
-config._add(
-    "django",
-    dict(
-        _default_service="django",
-        cache_service_name=get_env("django", "cache_service_name") or "django",
-        database_service_name_prefix=get_env("django", "database_service_name_prefix", default=""),
-        database_service_name=get_env("django", "database_service_name", default=""),
-        trace_fetch_methods=asbool(get_env("django", "trace_fetch_methods", default=False)),
-        distributed_tracing_enabled=True,
-        instrument_middleware=asbool(get_env("django", "instrument_middleware", default=True)),
-        instrument_databases=True,
-        instrument_caches=True,
-        analytics_enabled=None,  # None allows the value to be overridden by the global config
-        analytics_sample_rate=None,
-        trace_query_string=None,  # Default to global config
-        include_user_name=True,
-        use_handler_resource_format=asbool(get_env("django", "use_handler_resource_format", default=False)),
-        use_legacy_resource_format=asbool(get_env("django", "use_legacy_resource_format", default=False)),
-    ),
-)
+add_config("django")
 
 
 def patch_conn(django, conn):
@@ -227,6 +208,48 @@ def traced_process_exception(django, name, resource=None):
     return trace_utils.with_traced_module(wrapped)(django)
 
 
+def _is_sampled(tracer):
+    """Return whether the active trace is kept, defaulting to ``True`` when the decision is not made yet."""
+    ctx = tracer.current_trace_context()
+    if ctx is not None and ctx.sampling_priority is not None and ctx.sampling_priority <= 0:
+        return False
+    root = tracer.current_root_span()
+    return root is None or root.sampled
+
+
+def traced_middleware(django, resource, process_exception=False):
+    """Returns a function to trace a middleware hook according to ``config.django.middleware_tracing_mode``.
+
+    - ``"all"``: a ``django.middleware`` span is created for each call of the hook.
+    - ``"sampled"``: the spans are only created when the trace is sampled.
+    - ``"aggregate"``: no span is created, the duration of the hook is added to the ``django.middleware`` span of
+      the request instead.
+    """
+    trace_hook = (traced_process_exception if process_exception else traced_func)(
+        django, "django.middleware", resource=resource
+    )
+    duration_key = "{}.duration".format(resource)
+
+    def wrapped(django, pin, func, instance, args, kwargs):
+        mode = config.django.middleware_tracing_mode
+        if mode == "aggregate":
+            request = args[0] if args else kwargs.get("request")
+            durations = getattr(request, "_datadog_middleware_durations", None)
+            if durations is None:
+                return func(*args, **kwargs)
+            start_ns = compat.monotonic_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                durations[duration_key] = durations.get(duration_key, 0) + compat.monotonic_ns() - start_ns
+        elif mode == "sampled":
+            if not _is_sampled(pin.tracer):
+                return func(*args, **kwargs)
+        return trace_hook(func, instance, args, kwargs)
+
+    return trace_utils.with_traced_module(wrapped)(django)
+
+
 @trace_utils.with_traced_module
 def traced_load_middleware(django, pin, func, instance, args, kwargs):
     """Patches django.core.handlers.base.BaseHandler.load_middleware to instrument all middlewares."""
@@ -257,7 +280,7 @@ def traced_load_middleware(django, pin, func, instance, args, kwargs):
                 # r is the middleware handler function returned from the factory
                 r = func(*args, **kwargs)
                 if r:
-                    return wrapt.FunctionWrapper(r, traced_func(django, "django.middleware", resource=mw_path))
+                    return wrapt.FunctionWrapper(r, traced_middleware(django, mw_path))
                 # If r is an empty middleware function (i.e. returns None), don't wrap since NoneType cannot be called
                 else:
                     return r
@@ -274,15 +297,11 @@ def traced_load_middleware(django, pin, func, instance, args, kwargs):
                 "__call__",
             ]:
                 if hasattr(mw, hook) and not trace_utils.iswrapped(mw, hook):
-                    trace_utils.wrap(
-                        mw, hook, traced_func(django, "django.middleware", resource=mw_path + ".{0}".format(hook))
-                    )
+                    trace_utils.wrap(mw, hook, traced_middleware(django, mw_path + ".{0}".format(hook)))
             # Do a little extra for `process_exception`
             if hasattr(mw, "process_exception") and not trace_utils.iswrapped(mw, "process_exception"):
                 res = mw_path + ".{0}".format("process_exception")
-                trace_utils.wrap(
-                    mw, "process_exception", traced_process_exception(django, "django.middleware", resource=res)
-                )
+                trace_utils.wrap(mw, "process_exception", traced_middleware(django, res, process_exception=True))
 
     return func(*args, **kwargs)
 
@@ -311,7 +330,21 @@ def traced_get_response(django, pin, func, instance, args, kwargs):
     ) as span:
         utils._before_request_tags(pin, span, request)
         span.metrics[SPAN_MEASURED_KEY] = 1
-        response = func(*args, **kwargs)
+
+        middleware_span = None
+        if config.django.instrument_middleware and config.django.middleware_tracing_mode == "aggregate":
+            # The middleware hooks add their durations to this dict instead of creating a span each
+            middleware_span = pin.tracer.start_span(
+                "django.middleware", child_of=span, service=span.service, resource="django.middleware"
+            )
+            request._datadog_middleware_durations = {}
+
+        try:
+            response = func(*args, **kwargs)
+        finally:
+            if middleware_span is not None:
+                middleware_span.set_metrics(request.__dict__.pop("_datadog_middleware_durations", {}))
+                middleware_span.finish()
         utils._after_request_tags(pin, span, request, response)
         return response
 
@@ -406,7 +439,9 @@ def traced_urls_path(django, pin, wrapped, instance, args, kwargs):
             args = tuple(args)
     except Exception:
         log.debug("Failed to instrument Django url path %r %r", args, kwargs, exc_info=True)
-    return wrapped(*args, **kwargs)
+    pattern = wrapped(*args, **kwargs)
+    utils.cache_url_pattern(pattern)
+    return pattern
 
 
 @trace_utils.with_traced_module
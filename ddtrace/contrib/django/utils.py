@@ -1,3 +1,9 @@
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
 from django.utils.functional import SimpleLazyObject
 import six
 
@@ -6,7 +12,6 @@ from ddtrace.constants import ANALYTICS_SAMPLE_RATE_KEY
 from ddtrace.constants import SPAN_MEASURED_KEY
 from ddtrace.contrib import func_name
 from ddtrace.ext import SpanTypes
-from ddtrace.propagation.utils import from_wsgi_header
 
 from .. import trace_utils
 from ...internal.logger import get_logger
@@ -21,6 +26,17 @@ log = get_logger(__name__)
 Resolver404 = None
 DJANGO22 = None
 
+# Handler name and route of the views, keyed on the resolved view callable and its route pattern
+_RESOURCE_NAMES = {}  # type: Dict[Tuple[Callable[..., Any], Optional[str]], Tuple[str, Optional[str]]]
+# The max number of routes cached, so that the URLconfs included dynamically do not grow the cache without limit
+_RESOURCE_NAMES_MAX_SIZE = 4096
+
+
+def _cache_resource_names(key, names):
+    # type: (Tuple[Callable[..., Any], Optional[str]], Tuple[str, Optional[str]]) -> None
+    if len(_RESOURCE_NAMES) < _RESOURCE_NAMES_MAX_SIZE:
+        _RESOURCE_NAMES[key] = names
+
 
 def resource_from_cache_prefix(resource, cache):
     """
@@ -67,6 +83,53 @@ def get_django_2_route(request, resolver_match):
     return None
 
 
+def _resolve_resource_names(request, resolver_match):
+    # type: (Any, Any) -> Tuple[str, Optional[str]]
+    # In Django >= 2.2.0 we can access the original route or regex pattern
+    route = get_django_2_route(request, resolver_match) if DJANGO22 else None
+    return func_name(resolver_match[0]), route
+
+
+def get_resource_names(request, resolver_match):
+    # type: (Any, Any) -> Tuple[str, Optional[str]]
+    """Return the handler name and the route of the view of a resolved request.
+
+    The names are cached for the views with a route, up to ``_RESOURCE_NAMES_MAX_SIZE`` routes: they only depend on
+    the view and the route.
+    """
+    view = resolver_match[0]
+    route = getattr(resolver_match, "route", None)
+    if not route or not config.django.resource_name_cache:
+        return _resolve_resource_names(request, resolver_match)
+
+    key = (view, route)
+    try:
+        return _RESOURCE_NAMES[key]
+    except KeyError:
+        names = _resolve_resource_names(request, resolver_match)
+        _cache_resource_names(key, names)
+        return names
+    except TypeError:
+        # The view is not hashable
+        return _resolve_resource_names(request, resolver_match)
+
+
+def cache_url_pattern(pattern):
+    # type: (Any) -> None
+    """Cache the resource names of the view of a URL pattern when it is created."""
+    view = getattr(pattern, "callback", None)
+    url_pattern = getattr(pattern, "pattern", None)
+    if view is None or url_pattern is None or not config.django.resource_name_cache:
+        return
+    # The route of a match is the string of the pattern for the top level URL patterns. Patterns nested with
+    # include() resolve to a route prefixed with the one of the resolver and are cached on their first request.
+    route = str(url_pattern)
+    try:
+        _cache_resource_names((view, route), (func_name(view), route))
+    except TypeError:
+        pass
+
+
 def set_tag_array(span, prefix, value):
     """Helper to set a span tag as a single value or an array"""
     if not value:
@@ -157,7 +220,7 @@ def _before_request_tags(pin, span, request):
             # The request quite likely failed (e.g. 404) so we do the resolution anyway.
             resolver = get_resolver(getattr(request, "urlconf", None))
             resolver_match = resolver.resolve(request.path_info)
-        handler = func_name(resolver_match[0])
+        handler, route = get_resource_names(request, resolver_match)
 
         if config.django.use_handler_resource_format:
             span.resource = " ".join((span.resource, handler))
@@ -167,8 +230,6 @@ def _before_request_tags(pin, span, request):
             # In Django >= 2.2.0 we can access the original route or regex pattern
             # TODO: Validate if `resolver.pattern.regex.pattern` is available on django<2.2
             if DJANGO22:
-                # Determine the resolver and resource name for this request
-                route = get_django_2_route(request, resolver_match)
                 if route:
                     span.resource = " ".join((request.method, route))
                     span._set_str_tag("http.route", route)
@@ -253,15 +314,6 @@ def _after_request_tags(pin, span, request, response):
 
         url = get_request_uri(request)
 
-        if DJANGO22:
-            request_headers = request.headers
-        else:
-            request_headers = {}
-            for header, value in request.META.items():
-                name = from_wsgi_header(header)
-                if name:
-                    request_headers[name] = value
-
         response_headers = dict(response.items())
         trace_utils.set_http_meta(
             span,
@@ -270,6 +322,6 @@ def _after_request_tags(pin, span, request, response):
             url=url,
             status_code=status,
             query=request.META.get("QUERY_STRING", None),
-            request_headers=request_headers,
             response_headers=response_headers,
         )
+        trace_utils._store_wsgi_request_headers(request.META, span, config.django)
@@ -4,21 +4,15 @@ from ddtrace import config
 from ddtrace import tracer
 from ddtrace.vendor import wrapt
 
-from ...utils.formats import asbool
-from ...utils.formats import get_env
 from ...utils.version import parse_version
+from .._defaults import add_config
 from .middleware import TraceMiddleware
 
 
 FALCON_VERSION = parse_version(falcon.__version__)
 
 
-config._add(
-    "falcon",
-    dict(
-        distributed_tracing=asbool(get_env("falcon", "distributed_tracing", default=True)),
-    ),
-)
+add_config("falcon")
 
 
 def patch():
@@ -8,18 +8,12 @@ from ddtrace.internal.logger import get_logger
 from ddtrace.utils.wrappers import unwrap as _u
 from ddtrace.vendor.wrapt import wrap_function_wrapper as _w
 
+from .._defaults import add_config
+
 
 log = get_logger(__name__)
 
-config._add(
-    "fastapi",
-    dict(
-        _default_service="fastapi",
-        request_span_name="fastapi.request",
-        distributed_tracing=True,
-        aggregate_resources=True,
-    ),
-)
+add_config("fastapi")
 
 
 def span_modifier(span, scope):
@@ -14,6 +14,7 @@ from ...internal.logger import get_logger
 from ...utils import get_argument_value
 from ...utils.version import parse_version
 from ...utils.wrappers import unwrap as _u
+from .._defaults import add_config
 from .helpers import get_current_app
 from .helpers import simple_tracer
 from .helpers import with_instance_pin
@@ -29,18 +30,7 @@ FLASK_URL_RULE = "flask.url_rule"
 FLASK_VERSION = "flask.version"
 
 # Configure default configuration
-config._add(
-    "flask",
-    dict(
-        # Flask service configuration
-        _default_service="flask",
-        app="flask",
-        collect_view_args=True,
-        distributed_tracing_enabled=True,
-        template_default_name="<memory>",
-        trace_signals=True,
-    ),
-)
+add_config("flask")
 
 
 # Extract flask version into a tuple e.g. (0, 12, 1) or (1, 0, 2)
@@ -14,6 +14,33 @@ Or use :ref:`patch()<patch>` to manually enable the integration::
 
     from ddtrace import patch
     patch(futures=True)
+
+
+Global Configuration
+~~~~~~~~~~~~~~~~~~~~
+
+.. py:data:: ddtrace.config.futures["metrics_enabled"]
+
+   Measure the thread pool executors when the runtime metrics are enabled.
+   The following distributions are reported with the runtime metrics:
+
+   * ``runtime.python.futures.queue.wait``: the time the tasks waited in the
+     queue of the executor before being executed, in seconds
+   * ``runtime.python.futures.execution.time``: the execution time of the
+     tasks, in seconds
+   * ``runtime.python.futures.queue.size``: the number of tasks queued when a
+     task is submitted
+   * ``runtime.python.futures.saturation``: the number of tasks queued divided
+     by the maximum number of workers of the executor when a task is submitted
+
+   The time spent waiting for the results of the futures is also added to the
+   active span as the ``futures.wait`` metric, in nanoseconds, when the runtime
+   metrics are enabled.
+
+   This option can also be set with the ``DD_FUTURES_METRICS_ENABLED``
+   environment variable.
+
+   Default: ``True``
 """
 from ...utils.importlib import require_modules
 
@@ -3,9 +3,14 @@ from concurrent import futures
 from ddtrace.vendor.wrapt import wrap_function_wrapper as _w
 
 from ...utils.wrappers import unwrap as _u
+from .._defaults import add_config
+from .threading import _wrap_result
 from .threading import _wrap_submit
 
 
+add_config("futures")
+
+
 def patch():
     """Enables Context Propagation between threads"""
     if getattr(futures, "__datadog_patch", False):
@@ -13,6 +18,7 @@ def patch():
     setattr(futures, "__datadog_patch", True)
 
     _w("concurrent.futures", "ThreadPoolExecutor.submit", _wrap_submit)
+    _w("concurrent.futures", "Future.result", _wrap_result)
 
 
 def unpatch():
@@ -22,3 +28,4 @@ def unpatch():
     setattr(futures, "__datadog_patch", False)
 
     _u(futures.ThreadPoolExecutor, "submit")
+    _u(futures.Future, "result")
@@ -1,4 +1,43 @@
+import threading
+from typing import List
+from typing import Tuple
+
 import ddtrace
+from ddtrace import config
+
+from ...internal.compat import monotonic
+from ...internal.runtime.constants import FUTURES_EXECUTION_TIME
+from ...internal.runtime.constants import FUTURES_QUEUE_SIZE
+from ...internal.runtime.constants import FUTURES_QUEUE_WAIT
+from ...internal.runtime.constants import FUTURES_SATURATION
+from ...internal.runtime.runtime_metrics import RuntimeWorker
+
+
+# Metric set on the spans with the total time (in nanoseconds) spent waiting for the results of futures
+SPAN_FUTURES_WAIT = "futures.wait"
+
+# Bound the memory used if the metrics are not collected
+MAX_SAMPLES = 10000
+
+_samples = []  # type: List[Tuple[str, float]]
+_samples_lock = threading.Lock()
+
+
+def _add_samples(*samples):
+    # type: (Tuple[str, float]) -> None
+    with _samples_lock:
+        if len(_samples) < MAX_SAMPLES:
+            _samples.extend(samples)
+
+
+def collect():
+    # type: () -> List[Tuple[str, float]]
+    """Return and forget the executor measures taken since the last call."""
+    global _samples
+
+    with _samples_lock:
+        samples, _samples = _samples, []
+    return samples
 
 
 def _wrap_submit(func, instance, args, kwargs):
@@ -25,7 +64,19 @@ def _wrap_submit(func, instance, args, kwargs):
     # a new thread and the `target` arguments
     fn = args[0]
     fn_args = args[1:]
-    return func(_wrap_execution, current_ctx, fn, fn_args, kwargs)
+
+    # The measures are only taken when they are reported
+    if not (config.futures.metrics_enabled and RuntimeWorker.enabled):
+        return func(_wrap_execution, current_ctx, fn, fn_args, kwargs)
+
+    future = func(_wrap_timed_execution, current_ctx, monotonic(), fn, fn_args, kwargs)
+    # The queue of the executor includes the work item just submitted if no worker picked it up yet
+    work_queue = getattr(instance, "_work_queue", None)
+    max_workers = getattr(instance, "_max_workers", None)
+    if work_queue is not None and max_workers:
+        queued = work_queue.qsize()
+        _add_samples((FUTURES_QUEUE_SIZE, queued), (FUTURES_SATURATION, float(queued) / max_workers))
+    return future
 
 
 def _wrap_execution(ctx, fn, args, kwargs):
@@ -39,3 +90,35 @@ def _wrap_execution(ctx, fn, args, kwargs):
     if ctx is not None:
         ddtrace.tracer.context_provider.activate(ctx)
     return fn(*args, **kwargs)
+
+
+def _wrap_timed_execution(ctx, submitted, fn, args, kwargs):
+    """
+    Same as `_wrap_execution`, also measuring how long the work waited in
+    the queue of the executor and how long it took to execute.
+    """
+    start = monotonic()
+    try:
+        return _wrap_execution(ctx, fn, args, kwargs)
+    finally:
+        _add_samples((FUTURES_QUEUE_WAIT, start - submitted), (FUTURES_EXECUTION_TIME, monotonic() - start))
+
+
+def _wrap_result(func, instance, args, kwargs):
+    """
+    Wrap `Future.result` to add the time spent waiting for the result to
+    the active span.
+    """
+    # Nothing to measure if the result is already available
+    if not (config.futures.metrics_enabled and RuntimeWorker.enabled) or instance.done():
+        return func(*args, **kwargs)
+
+    span = ddtrace.tracer.current_span()
+    if span is None:
+        return func(*args, **kwargs)
+
+    start = monotonic()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        span.metrics[SPAN_FUTURES_WAIT] = span.metrics.get(SPAN_FUTURES_WAIT, 0) + int((monotonic() - start) * 1e9)
@@ -1,35 +1,23 @@
 import grpc
 
 from ddtrace import Pin
-from ddtrace import config
 from ddtrace.vendor.wrapt import wrap_function_wrapper as _w
 
 from . import constants
 from . import utils
 from ...utils.wrappers import unwrap as _u
+from .._defaults import add_config
 from .client_interceptor import create_client_interceptor
 from .client_interceptor import intercept_channel
 from .server_interceptor import create_server_interceptor
 
 
-config._add(
-    "grpc_server",
-    dict(
-        _default_service=constants.GRPC_SERVICE_SERVER,
-        distributed_tracing_enabled=True,
-    ),
-)
+add_config("grpc_server")
 
 
 # TODO[tbutt]: keeping name for client config unchanged to maintain backwards
 # compatibility but should change in future
-config._add(
-    "grpc",
-    dict(
-        _default_service=constants.GRPC_SERVICE_CLIENT,
-        distributed_tracing_enabled=True,
-    ),
-)
+add_config("grpc")
 
 
 def patch():
@@ -14,9 +14,8 @@ from ...internal.compat import parse
 from ...internal.logger import get_logger
 from ...pin import Pin
 from ...propagation.http import HTTPPropagator
-from ...utils.formats import asbool
-from ...utils.formats import get_env
 from ...utils.wrappers import unwrap as _u
+from .._defaults import add_config
 
 
 span_name = "httplib.request" if PY2 else "http.client.request"
@@ -24,12 +23,7 @@ span_name = "httplib.request" if PY2 else "http.client.request"
 log = get_logger(__name__)
 
 
-config._add(
-    "httplib",
-    {
-        "distributed_tracing": asbool(get_env("httplib", "distributed_tracing", default=True)),
-    },
-)
+add_config("httplib")
 
 
 def _wrap_init(func, instance, args, kwargs):
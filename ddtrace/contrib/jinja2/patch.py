@@ -6,18 +6,13 @@ from ddtrace.vendor.wrapt import wrap_function_wrapper as _w
 from ...constants import SPAN_MEASURED_KEY
 from ...ext import SpanTypes
 from ...pin import Pin
-from ...utils.formats import get_env
 from ...utils.wrappers import unwrap as _u
+from .._defaults import add_config
 from .constants import DEFAULT_TEMPLATE_NAME
 
 
 # default settings
-config._add(
-    "jinja2",
-    {
-        "service_name": get_env("jinja2", "service_name"),
-    },
-)
+add_config("jinja2")
 
 
 def patch():
@@ -14,6 +14,7 @@ from ...pin import Pin
 from ...propagation.http import HTTPPropagator
 from ...utils.formats import get_env
 from ...utils.wrappers import unwrap
+from .._defaults import add_config
 from .constants import DEFAULT_SERVICE
 from .utils import HEADER_POS
 from .utils import extract_conn_tags
@@ -24,12 +25,7 @@ from .utils import get_routing_key_from_args
 
 # kombu default settings
 
-config._add(
-    "kombu",
-    {
-        "service_name": config.service or get_env("kombu", "service_name", default=DEFAULT_SERVICE),
-    },
-)
+add_config("kombu")
 
 propagator = HTTPPropagator
 
@@ -61,6 +61,46 @@ Make sure that your log format exactly matches the following::
         log.info('Hello, World!')
 
     hello()
+
+JSON Format
+-----------
+
+:class:`JSONFormatter<ddtrace.contrib.logging.JSONFormatter>` formats the
+records as JSON objects including the trace information, with ``orjson`` if it
+is installed (``pip install ddtrace[orjson]``)::
+
+    import logging
+    from ddtrace.contrib.logging import JSONFormatter
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(JSONFormatter(extra_attrs=("user_id",)))
+    logging.getLogger().addHandler(handler)
+
+It can also be configured with ``logging.config.dictConfig``::
+
+    "formatters": {
+        "json": {
+            "()": "ddtrace.contrib.logging.JSONFormatter",
+            "extra_attrs": ["user_id"],
+        },
+    },
+
+Lazy Mode
+---------
+
+By default, the trace information is added to every log record when it is
+created. Set ``DD_LOGS_INJECTION_LAZY=true``, or
+``config.logging.lazy = True`` before patching, to only keep the ids of the
+current span when a record is created, and add the trace information to the
+records formatted by a handler, once per record, when the formatter may read
+it: the base ``logging.Formatter`` only reads it if its format references
+``dd.`` fields. The fields are computed once per span and shared by the records
+logged for the same span. The records formatted later or in another thread,
+e.g. by the target of a ``MemoryHandler`` or by a ``QueueListener``, get the
+trace information of the span they were logged for.
+
+In lazy mode the trace information is not available to the log filters, nor to
+the handlers which do not format the records.
 """
 
 from ...utils.importlib import require_modules
@@ -70,7 +110,8 @@ required_modules = ["logging"]
 
 with require_modules(required_modules) as missing_modules:
     if not missing_modules:
+        from .formatter import JSONFormatter
         from .patch import patch
         from .patch import unpatch
 
-        __all__ = ["patch", "unpatch"]
+        __all__ = ["patch", "unpatch", "JSONFormatter"]
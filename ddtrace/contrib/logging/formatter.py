@@ -0,0 +1,89 @@
+import logging
+from typing import Any
+from typing import Dict
+from typing import Optional
+from typing import Tuple
+
+from ...internal.compat import PY2
+from ...internal.encoding import json_dumps
+from .patch import RECORD_ATTR_ENV
+from .patch import RECORD_ATTR_SERVICE
+from .patch import RECORD_ATTR_SPAN_ID
+from .patch import RECORD_ATTR_TRACE_ID
+from .patch import RECORD_ATTR_VERSION
+from .patch import _get_record_correlation_fields
+
+
+_CORRELATION_ATTRS = (
+    RECORD_ATTR_TRACE_ID,
+    RECORD_ATTR_SPAN_ID,
+    RECORD_ATTR_SERVICE,
+    RECORD_ATTR_ENV,
+    RECORD_ATTR_VERSION,
+)
+
+
+class JSONFormatter(logging.Formatter):
+    """Format the log records as JSON objects, one per line, with the trace information.
+
+    The objects have the ``timestamp`` (in milliseconds since the epoch), ``level``, ``logger`` and ``message`` keys,
+    the ``error.kind``, ``error.message`` and ``error.stack`` keys if an exception is logged, and the
+    ``dd.trace_id``, ``dd.span_id``, ``dd.service``, ``dd.env`` and ``dd.version`` keys. The trace information is
+    computed for the current span if the ``logging`` integration did not add it to the record.
+
+    The objects are serialized with ``orjson`` if it is installed.
+
+    The formatter takes the same arguments as ``logging.Formatter`` so that it can be used with
+    ``logging.config.dictConfig``. The format string is not used.
+
+    :param datefmt: The format of the ``date`` key added to the objects, none by default.
+    :param extra_attrs: The attributes of the records to add to the objects, e.g. the ones passed with ``extra``.
+    """
+
+    def __init__(self, fmt=None, datefmt=None, style="%", extra_attrs=()):
+        # type: (Optional[str], Optional[str], str, Tuple[str, ...]) -> None
+        if PY2:
+            super(JSONFormatter, self).__init__(fmt, datefmt)
+        else:
+            super(JSONFormatter, self).__init__(fmt, datefmt, style)
+        self.extra_attrs = tuple(extra_attrs)
+
+    def format(self, record):
+        # type: (logging.LogRecord) -> str
+        record_dict = record.__dict__
+        if RECORD_ATTR_TRACE_ID in record_dict:
+            correlation = {attr: record_dict.get(attr, "") for attr in _CORRELATION_ATTRS}  # type: Dict[str, str]
+        else:
+            correlation = _get_record_correlation_fields(record)
+
+        obj = {
+            "timestamp": int(record.created * 1000),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }  # type: Dict[str, Any]
+        if self.datefmt:
+            obj["date"] = self.formatTime(record, self.datefmt)
+        obj.update(correlation)
+
+        if record.exc_info:
+            obj["error.kind"] = record.exc_info[0].__name__ if record.exc_info[0] else ""
+            obj["error.message"] = str(record.exc_info[1])
+            # Cache the formatted exception like the base formatter
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            obj["error.stack"] = record.exc_text
+
+        for attr in self.extra_attrs:
+            if attr in record_dict:
+                obj[attr] = record_dict[attr]
+
+        try:
+            return json_dumps(obj)
+        except (TypeError, ValueError):
+            # Do not lose the record because of an extra attribute that cannot be serialized
+            for attr in self.extra_attrs:
+                if attr in obj:
+                    obj[attr] = repr(obj[attr])
+            return json_dumps(obj)
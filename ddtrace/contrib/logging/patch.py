@@ -1,4 +1,7 @@
 import logging
+from typing import Dict
+from typing import Optional
+from typing import Tuple
 
 import attr
 
@@ -6,6 +9,7 @@ import ddtrace
 
 from ...utils.wrappers import unwrap as _u
 from ...vendor.wrapt import wrap_function_wrapper as _w
+from .._defaults import add_config
 
 
 RECORD_ATTR_TRACE_ID = "dd.trace_id"
@@ -15,13 +19,13 @@ RECORD_ATTR_VERSION = "dd.version"
 RECORD_ATTR_SERVICE = "dd.service"
 RECORD_ATTR_VALUE_ZERO = "0"
 RECORD_ATTR_VALUE_EMPTY = ""
+# Lazy mode: the ids of the span a record was logged for, kept until a handler formats the record
+_RECORD_ATTR_SPAN_IDS = "_dd.span_ids"
 
-ddtrace.config._add(
-    "logging",
-    dict(
-        tracer=None,
-    ),
-)  # by default, override here for custom tracer
+add_config("logging")
+
+# The correlation fields of the last span logged for, with the span and the configuration they were computed for
+_last_correlation = None  # type: Optional[Tuple[Tuple[Optional[Tuple[int, int]], str, str, str], Dict[str, str]]]
 
 
 @attr.s(slots=True)
@@ -44,30 +48,86 @@ def _get_current_span(tracer=None):
     return tracer.current_span()
 
 
+def _get_record_span(record):
+    # type: (logging.LogRecord) -> Optional[ddtrace.Span]
+    # logs from internal logger may explicitly pass the current span to
+    # avoid deadlocks in getting the current span while already in locked code.
+    span_from_log = record.__dict__.get(ddtrace.constants.LOG_SPAN_KEY)
+    if isinstance(span_from_log, ddtrace.Span):
+        return span_from_log
+    return _get_current_span(tracer=ddtrace.config.logging.tracer)
+
+
+def _get_record_span_ids(record):
+    # type: (logging.LogRecord) -> Optional[Tuple[int, int]]
+    span = _get_record_span(record)
+    if span is None:
+        return None
+    return span.trace_id, span.span_id
+
+
+def _get_correlation_fields(span_ids):
+    # type: (Optional[Tuple[int, int]]) -> Dict[str, str]
+    global _last_correlation
+
+    service = ddtrace.config.service or ""
+    version = ddtrace.config.version or ""
+    env = ddtrace.config.env or ""
+    key = (span_ids, service, version, env)
+
+    # Consecutive records are usually logged for the same span
+    last = _last_correlation
+    if last is not None and last[0] == key:
+        return last[1]
+
+    fields = {
+        RECORD_ATTR_VERSION: version,
+        RECORD_ATTR_ENV: env,
+        RECORD_ATTR_SERVICE: service,
+        RECORD_ATTR_TRACE_ID: str(span_ids[0]) if span_ids else RECORD_ATTR_VALUE_ZERO,
+        RECORD_ATTR_SPAN_ID: str(span_ids[1]) if span_ids else RECORD_ATTR_VALUE_ZERO,
+    }
+    _last_correlation = (key, fields)
+    return fields
+
+
+def _get_record_correlation_fields(record):
+    # type: (logging.LogRecord) -> Dict[str, str]
+    """Return the correlation fields of the span the record was logged for."""
+    record_dict = record.__dict__
+    if _RECORD_ATTR_SPAN_IDS in record_dict:
+        return _get_correlation_fields(record_dict[_RECORD_ATTR_SPAN_IDS])
+    # The record was not created by a patched logger, e.g. with logging.makeLogRecord
+    return _get_correlation_fields(_get_record_span_ids(record))
+
+
 def _w_makeRecord(func, instance, args, kwargs):
     # Get the LogRecord instance for this log
     record = func(*args, **kwargs)
+    record.__dict__.update(_get_correlation_fields(_get_record_span_ids(record)))
+    return record
 
-    setattr(record, RECORD_ATTR_VERSION, ddtrace.config.version or "")
-    setattr(record, RECORD_ATTR_ENV, ddtrace.config.env or "")
-    setattr(record, RECORD_ATTR_SERVICE, ddtrace.config.service or "")
 
-    # logs from internal logger may explicitly pass the current span to
-    # avoid deadlocks in getting the current span while already in locked code.
-    span_from_log = getattr(record, ddtrace.constants.LOG_SPAN_KEY, None)
-    if isinstance(span_from_log, ddtrace.Span):
-        span = span_from_log
-    else:
-        span = _get_current_span(tracer=ddtrace.config.logging.tracer)
+def _w_makeRecord_lazy(func, instance, args, kwargs):
+    # Lazy mode: only keep the ids of the span the record is logged for. The records may be formatted later and in
+    # another context, e.g. by a MemoryHandler target or a QueueListener.
+    record = func(*args, **kwargs)
+    record.__dict__[_RECORD_ATTR_SPAN_IDS] = _get_record_span_ids(record)
+    return record
 
-    if span:
-        setattr(record, RECORD_ATTR_TRACE_ID, str(span.trace_id))
-        setattr(record, RECORD_ATTR_SPAN_ID, str(span.span_id))
-    else:
-        setattr(record, RECORD_ATTR_TRACE_ID, RECORD_ATTR_VALUE_ZERO)
-        setattr(record, RECORD_ATTR_SPAN_ID, RECORD_ATTR_VALUE_ZERO)
 
-    return record
+def _w_Handler_format(func, instance, args, kwargs):
+    # Lazy mode: the correlation fields are only added to the records formatted by a handler, once per record.
+    record = kwargs.get("record", args[0])
+    record_dict = record.__dict__
+    if RECORD_ATTR_TRACE_ID not in record_dict:
+        formatter = instance.formatter or logging._defaultFormatter
+        # Formatters other than the base one may read the fields from the record, e.g. JSON formatters
+        if type(formatter) is not logging.Formatter or "dd." in (formatter._fmt or ""):
+            record_dict.update(_get_record_correlation_fields(record))
+            record_dict.pop(_RECORD_ATTR_SPAN_IDS, None)
+
+    return func(*args, **kwargs)
 
 
 def _w_StrFormatStyle_format(func, instance, args, kwargs):
@@ -99,13 +159,18 @@ def _w_StrFormatStyle_format(func, instance, args, kwargs):
 def patch():
     """
     Patch ``logging`` module in the Python Standard Library for injection of
-    tracer information by wrapping the base factory method ``Logger.makeRecord``
+    tracer information by wrapping the base factory method ``Logger.makeRecord``,
+    and ``Handler.format`` in lazy mode
     """
     if getattr(logging, "_datadog_patch", False):
         return
     setattr(logging, "_datadog_patch", True)
 
-    _w(logging.Logger, "makeRecord", _w_makeRecord)
+    if ddtrace.config.logging.lazy:
+        _w(logging.Logger, "makeRecord", _w_makeRecord_lazy)
+        _w(logging.Handler, "format", _w_Handler_format)
+    else:
+        _w(logging.Logger, "makeRecord", _w_makeRecord)
     if hasattr(logging, "StrFormatStyle"):
         if hasattr(logging.StrFormatStyle, "_format"):
             _w(logging.StrFormatStyle, "_format", _w_StrFormatStyle_format)
@@ -118,6 +183,7 @@ def unpatch():
         setattr(logging, "_datadog_patch", False)
 
         _u(logging.Logger, "makeRecord")
+        _u(logging.Handler, "format")
         if hasattr(logging, "StrFormatStyle"):
             if hasattr(logging.StrFormatStyle, "_format"):
                 _u(logging.StrFormatStyle, "_format")
@@ -5,19 +5,13 @@ from ddtrace import config
 from ddtrace.contrib.dbapi import TracedConnection
 from ddtrace.ext import db
 from ddtrace.ext import net
-from ddtrace.utils.formats import asbool
-from ddtrace.utils.formats import get_env
 from ddtrace.utils.wrappers import unwrap
 from ddtrace.vendor import wrapt
 
+from .._defaults import add_config
 
-config._add(
-    "mariadb",
-    dict(
-        trace_fetch_methods=asbool(get_env("mariadb", "trace_fetch_methods", default=False)),
-        _default_service="mariadb",
-    ),
-)
+
+add_config("mariadb")
 
 
 def patch():
@@ -10,11 +10,10 @@ from ...constants import ANALYTICS_SAMPLE_RATE_KEY
 from ...constants import SPAN_MEASURED_KEY
 from ...ext import SpanTypes
 from ...internal.compat import urlencode
-from ...utils.formats import asbool
-from ...utils.formats import get_env
 from ...utils.importlib import func_name
 from ...utils.version import parse_version
 from ...utils.wrappers import unwrap as _u
+from .._defaults import add_config
 from .wrappers import MOLTEN_ROUTE
 from .wrappers import WrapperComponent
 from .wrappers import WrapperMiddleware
@@ -25,14 +24,7 @@ from .wrappers import WrapperRouter
 MOLTEN_VERSION = parse_version(molten.__version__)
 
 # Configure default configuration
-config._add(
-    "molten",
-    dict(
-        _default_service="molten",
-        app="molten",
-        distributed_tracing=asbool(get_env("molten", "distributed_tracing", default=True)),
-    ),
-)
+add_config("molten")
 
 
 def patch():
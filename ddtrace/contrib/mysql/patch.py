@@ -7,17 +7,10 @@ from ddtrace.vendor import wrapt
 
 from ...ext import db
 from ...ext import net
-from ...utils.formats import asbool
-from ...utils.formats import get_env
+from .._defaults import add_config
 
 
-config._add(
-    "mysql",
-    dict(
-        _default_service="mysql",
-        trace_fetch_methods=asbool(get_env("mysql", "trace_fetch_methods", default=False)),
-    ),
-)
+add_config("mysql")
 
 CONN_ATTR_BY_TAG = {
     net.TARGET_HOST: "server_host",
@@ -9,18 +9,11 @@ from ddtrace.vendor.wrapt import wrap_function_wrapper as _w
 
 from ...ext import db
 from ...ext import net
-from ...utils.formats import asbool
-from ...utils.formats import get_env
 from ...utils.wrappers import unwrap as _u
+from .._defaults import add_config
 
 
-config._add(
-    "mysqldb",
-    dict(
-        _default_service="mysql",
-        trace_fetch_methods=asbool(get_env("mysqldb", "trace_fetch_methods", default=False)),
-    ),
-)
+add_config("mysqldb")
 
 KWPOS_BY_TAG = {
     net.TARGET_HOST: ("host", 0),
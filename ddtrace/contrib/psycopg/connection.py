@@ -8,12 +8,16 @@ import functools
 # 3p
 from psycopg2.extensions import connection
 from psycopg2.extensions import cursor
+import six
+
+from ddtrace import config
 
 from ...constants import SPAN_MEASURED_KEY
 from ...ext import SpanTypes
 from ...ext import db
 from ...ext import net
 from ...ext import sql
+from ...internal.sql import obfuscate_query
 from ...utils.deprecation import deprecated
 
 
@@ -52,7 +56,9 @@ class TracedCursor(cursor):
             if not s.sampled:
                 return super(TracedCursor, self).execute(query, vars)
 
-            s.resource = query
+            s.resource = (
+                obfuscate_query(query) if config.sql_obfuscation and isinstance(query, six.string_types) else query
+            )
             s.set_tags(self._datadog_tags)
             try:
                 return super(TracedCursor, self).execute(query, vars)
@@ -10,18 +10,11 @@ from ddtrace.ext import net
 from ddtrace.ext import sql
 from ddtrace.vendor import wrapt
 
-from ...utils.formats import asbool
-from ...utils.formats import get_env
 from ...utils.version import parse_version
+from .._defaults import add_config
 
 
-config._add(
-    "psycopg",
-    dict(
-        _default_service="postgres",
-        trace_fetch_methods=asbool(get_env("psycopg", "trace_fetch_methods", default=False)),
-    ),
-)
+add_config("psycopg")
 
 # Original connect method
 _connect = psycopg2.connect
@@ -5,18 +5,12 @@ from ddtrace import config
 from ddtrace import tracer
 from ddtrace.vendor import wrapt
 
-from ...utils.formats import asbool
-from ...utils.formats import get_env
 from ...utils.wrappers import unwrap as _u
+from .._defaults import add_config
 from .middleware import PylonsTraceMiddleware
 
 
-config._add(
-    "pylons",
-    dict(
-        distributed_tracing=asbool(get_env("pylons", "distributed_tracing", default=True)),
-    ),
-)
+add_config("pylons")
 
 
 def patch():
@@ -12,16 +12,12 @@ from ...ext import SpanTypes
 from ...ext import mongo as mongox
 from ...utils.deprecation import deprecated
 from ...utils.wrappers import unwrap as _u
+from .._defaults import add_config
 from .client import TracedMongoClient
 from .client import set_address_tags
 
 
-config._add(
-    "pymongo",
-    dict(
-        _default_service=mongox.SERVICE,
-    ),
-)
+add_config("pymongo")
 
 
 # Original Client class
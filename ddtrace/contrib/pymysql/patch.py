@@ -9,18 +9,10 @@ from ddtrace.vendor import wrapt
 
 from ...ext import db
 from ...ext import net
-from ...utils.formats import asbool
-from ...utils.formats import get_env
-
-
-config._add(
-    "pymysql",
-    dict(
-        # TODO[v1.0] this should be "mysql"
-        _default_service="pymysql",
-        trace_fetch_methods=asbool(get_env("pymysql", "trace_fetch_methods", default=False)),
-    ),
-)
+from .._defaults import add_config
+
+
+add_config("pymysql")
 
 CONN_ATTR_BY_TAG = {
     net.TARGET_HOST: "host",
@@ -14,17 +14,13 @@ from ...ext import SpanTypes
 from ...pin import Pin
 from ...utils.formats import deep_getattr
 from ...utils.wrappers import unwrap
+from .._defaults import add_config
 
 
 # Pynamodb connection class
 _PynamoDB_client = pynamodb.connection.base.Connection
 
-config._add(
-    "pynamodb",
-    {
-        "_default_service": "pynamodb",
-    },
-)
+add_config("pynamodb")
 
 
 def patch():
@@ -2,21 +2,14 @@ import pyodbc
 
 from ... import Pin
 from ... import config
-from ...utils.formats import asbool
-from ...utils.formats import get_env
+from .._defaults import add_config
 from ..dbapi import TracedConnection
 from ..dbapi import TracedCursor
 from ..trace_utils import unwrap
 from ..trace_utils import wrap
 
 
-config._add(
-    "pyodbc",
-    dict(
-        _default_service="pyodbc",
-        trace_fetch_methods=asbool(get_env("pyodbc", "trace_fetch_methods", default=False)),
-    ),
-)
+add_config("pyodbc")
 
 
 def patch():
@@ -8,6 +8,7 @@ from ddtrace.vendor import wrapt
 
 from ...utils.formats import asbool
 from ...utils.formats import get_env
+from .._defaults import add_config
 from .constants import SETTINGS_ANALYTICS_ENABLED
 from .constants import SETTINGS_ANALYTICS_SAMPLE_RATE
 from .constants import SETTINGS_DISTRIBUTED_TRACING
@@ -16,12 +17,7 @@ from .trace import DD_TWEEN_NAME
 from .trace import trace_pyramid
 
 
-config._add(
-    "pyramid",
-    dict(
-        distributed_tracing=asbool(get_env("pyramid", "distributed_tracing", default=True)),
-    ),
-)
+add_config("pyramid")
 
 DD_PATCH = "_datadog_patch"
 
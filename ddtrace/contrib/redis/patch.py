@@ -10,11 +10,12 @@ from ...ext import SpanTypes
 from ...ext import redis as redisx
 from ...pin import Pin
 from ...utils.wrappers import unwrap
+from .._defaults import add_config
+from .util import LazyCommandResource
 from .util import _extract_conn_tags
-from .util import format_command_args
 
 
-config._add("redis", dict(_default_service="redis"))
+add_config("redis")
 
 
 def patch():
@@ -72,9 +73,7 @@ def traced_execute_command(func, instance, args, kwargs):
         redisx.CMD, service=trace_utils.ext_service(pin, config.redis, pin), span_type=SpanTypes.REDIS
     ) as s:
         s.set_tag(SPAN_MEASURED_KEY)
-        query = format_command_args(args)
-        s.resource = query
-        s.set_tag(redisx.RAWCMD, query)
+        s._lazy_resource = LazyCommandResource((args,))
         if pin.tags:
             s.set_tags(pin.tags)
         s.set_tags(_get_tags(instance))
@@ -98,18 +97,16 @@ def traced_execute_pipeline(func, instance, args, kwargs):
     if not pin or not pin.enabled():
         return func(*args, **kwargs)
 
-    # FIXME[matt] done in the agent. worth it?
-    cmds = [format_command_args(c) for c, _ in instance.command_stack]
-    resource = "\n".join(cmds)
+    # The command stack is reset after the execution: keep a reference to the arguments of the commands
+    lazy_resource = LazyCommandResource([c for c, _ in instance.command_stack])
     tracer = pin.tracer
     with tracer.trace(
         redisx.CMD,
-        resource=resource,
         service=trace_utils.ext_service(pin, config.redis),
         span_type=SpanTypes.REDIS,
     ) as s:
+        s._lazy_resource = lazy_resource
         s.set_tag(SPAN_MEASURED_KEY)
-        s.set_tag(redisx.RAWCMD, resource)
         s.set_tags(_get_tags(instance))
         s.set_metric(redisx.PIPELINE_LEN, len(instance.command_stack))
 
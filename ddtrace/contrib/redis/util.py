@@ -52,3 +52,21 @@ def format_command_args(args):
             break
 
     return " ".join(out)
+
+
+class LazyCommandResource(object):
+    """Resource of a redis span formatted from the arguments of its commands only when the trace is kept.
+
+    It is set as the lazy resource of the span and also sets the raw command tag of the span. The arguments are
+    referenced until the trace is flushed.
+    """
+
+    __slots__ = ("commands",)
+
+    def __init__(self, commands):
+        self.commands = commands
+
+    def __call__(self, span):
+        resource = "\n".join(format_command_args(args) for args in self.commands)
+        span.set_tag(redisx.RAWCMD, resource)
+        return resource
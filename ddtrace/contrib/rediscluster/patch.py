@@ -7,7 +7,7 @@ from ddtrace.constants import ANALYTICS_SAMPLE_RATE_KEY
 from ddtrace.constants import SPAN_MEASURED_KEY
 from ddtrace.contrib.redis.patch import traced_execute_command
 from ddtrace.contrib.redis.patch import traced_pipeline
-from ddtrace.contrib.redis.util import format_command_args
+from ddtrace.contrib.redis.util import LazyCommandResource
 from ddtrace.ext import SpanTypes
 from ddtrace.ext import redis as redisx
 from ddtrace.pin import Pin
@@ -63,12 +63,11 @@ def traced_execute_pipeline(func, instance, args, kwargs):
     if not pin or not pin.enabled():
         return func(*args, **kwargs)
 
-    cmds = [format_command_args(c.args) for c in instance.command_stack]
-    resource = "\n".join(cmds)
+    lazy_resource = LazyCommandResource([c.args for c in instance.command_stack])
     tracer = pin.tracer
-    with tracer.trace(redisx.CMD, resource=resource, service=pin.service, span_type=SpanTypes.REDIS) as s:
+    with tracer.trace(redisx.CMD, service=pin.service, span_type=SpanTypes.REDIS) as s:
+        s._lazy_resource = lazy_resource
         s.set_tag(SPAN_MEASURED_KEY)
-        s.set_tag(redisx.RAWCMD, resource)
         s.set_metric(redisx.PIPELINE_LEN, len(instance.command_stack))
 
         # set analytics sample rate if enabled
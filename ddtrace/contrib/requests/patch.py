@@ -4,23 +4,15 @@ from ddtrace import config
 from ddtrace.vendor.wrapt import wrap_function_wrapper as _w
 
 from ...pin import Pin
-from ...utils.formats import asbool
-from ...utils.formats import get_env
 from ...utils.wrappers import unwrap as _u
+from .._defaults import add_config
 from .connection import _wrap_send
 from .legacy import _distributed_tracing
 from .legacy import _distributed_tracing_setter
 
 
 # requests default settings
-config._add(
-    "requests",
-    {
-        "distributed_tracing": asbool(get_env("requests", "distributed_tracing", default=True)),
-        "split_by_domain": asbool(get_env("requests", "split_by_domain", default=False)),
-        "_default_service": "requests",
-    },
-)
+add_config("requests")
 
 
 def patch():
@@ -13,11 +13,12 @@ from ddtrace.vendor.wrapt import wrap_function_wrapper as _w
 
 from .. import trace_utils
 from ...internal.logger import get_logger
+from .._defaults import add_config
 
 
 log = get_logger(__name__)
 
-config._add("sanic", dict(_default_service="sanic", distributed_tracing=True))
+add_config("sanic")
 
 SANIC_PRE_21 = None
 
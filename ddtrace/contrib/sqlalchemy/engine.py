@@ -24,6 +24,7 @@ from ...constants import SPAN_MEASURED_KEY
 from ...ext import SpanTypes
 from ...ext import net as netx
 from ...ext import sql as sqlx
+from ...internal.sql import obfuscate_query
 from ...pin import Pin
 
 
@@ -81,6 +82,9 @@ class EngineTracer(object):
             # don't trace the execution
             return
 
+        if config.sql_obfuscation:
+            statement = obfuscate_query(statement, self.vendor)
+
         span = pin.tracer.trace(
             self.name,
             service=pin.service,
@@ -10,20 +10,13 @@ from ...contrib.dbapi import FetchTracedCursor
 from ...contrib.dbapi import TracedConnection
 from ...contrib.dbapi import TracedCursor
 from ...pin import Pin
-from ...utils.formats import asbool
-from ...utils.formats import get_env
+from .._defaults import add_config
 
 
 # Original connect method
 _connect = sqlite3.connect
 
-config._add(
-    "sqlite",
-    dict(
-        _default_service="sqlite",
-        trace_fetch_methods=asbool(get_env("sqlite", "trace_fetch_methods", default=False)),
-    ),
-)
+add_config("sqlite")
 
 
 def patch():
@@ -8,18 +8,12 @@ from ddtrace.internal.logger import get_logger
 from ddtrace.utils.wrappers import unwrap as _u
 from ddtrace.vendor.wrapt import wrap_function_wrapper as _w
 
+from .._defaults import add_config
+
 
 log = get_logger(__name__)
 
-config._add(
-    "starlette",
-    dict(
-        _default_service="starlette",
-        request_span_name="starlette.request",
-        distributed_tracing=True,
-        aggregate_resources=True,
-    ),
-)
+add_config("starlette")
 
 
 def get_resource(scope):
@@ -11,12 +11,16 @@ from typing import Iterator
 from typing import Optional
 from typing import TYPE_CHECKING
 from typing import Tuple
+from typing import Union
+
+import six
 
 from ddtrace import Pin
 from ddtrace import config
 from ddtrace.ext import http
 from ddtrace.internal.logger import get_logger
 from ddtrace.propagation.http import HTTPPropagator
+from ddtrace.propagation.utils import get_wsgi_header
 from ddtrace.utils.cache import cached
 from ddtrace.utils.http import normalize_header_name
 from ddtrace.utils.http import strip_query_string
@@ -28,6 +32,7 @@ if TYPE_CHECKING:
     from ddtrace import Span
     from ddtrace import Tracer
     from ddtrace.settings import IntegrationConfig
+    from ddtrace.settings.http import HttpConfig
 
 
 log = get_logger(__name__)
@@ -38,6 +43,7 @@ iswrapped = ddtrace.utils.wrappers.iswrapped
 
 REQUEST = "request"
 RESPONSE = "response"
+WSGI_REQUEST = "wsgi_request"
 
 # Tag normalization based on: https://docs.datadoghq.com/tagging/#defining-tags
 # With the exception of '.' in header names which are replaced with '_' to avoid
@@ -76,6 +82,44 @@ def _normalize_tag_name(request_or_response, header_name):
     return "http.{}.headers.{}".format(request_or_response, normalized_name)
 
 
+def _get_header_tags(integration_config, request_or_response):
+    # type: (IntegrationConfig, str) -> Dict[Union[str, bytes], str]
+    """Return the tag names of the traced headers of an integration, keyed by header name.
+
+    The integration whitelist takes precedence over the global one. The mapping is computed once per whitelist and
+    stored in the :class:`HttpConfig` it comes from. The headers are keyed by their normalized name, also as bytes for
+    ASGI, or by their WSGI environ key for ``WSGI_REQUEST``.
+    """
+    http_config = integration_config.http  # type: HttpConfig
+    if not http_config.is_header_tracing_configured:
+        global_config = getattr(integration_config, "global_config", None)
+        if global_config is None:
+            return {}
+        http_config = global_config.http
+
+    whitelist = http_config._whitelist_headers
+    cached_tags = http_config._header_tags.get(request_or_response)
+    # DEV: the whitelist set is replaced rather than updated when it is overridden
+    if cached_tags is not None and cached_tags[0] is whitelist:
+        return cached_tags[1]
+
+    tags = {}  # type: Dict[Union[str, bytes], str]
+    for header_name in whitelist:
+        if request_or_response == WSGI_REQUEST:
+            tag_name = _normalize_tag_name(REQUEST, header_name)
+            wsgi_header = get_wsgi_header(header_name)
+            tags[wsgi_header] = tag_name
+            # PEP 333 gives two headers which aren't prepended with HTTP_
+            if wsgi_header in ("HTTP_CONTENT_TYPE", "HTTP_CONTENT_LENGTH"):
+                tags[wsgi_header[5:]] = tag_name
+        else:
+            tag_name = _normalize_tag_name(request_or_response, header_name)
+            tags[header_name] = tag_name
+            tags[header_name.encode("latin-1", "replace")] = tag_name
+    http_config._header_tags[request_or_response] = (whitelist, tags)
+    return tags
+
+
 def _store_headers(headers, span, integration_config, request_or_response):
     # type: (Dict[str, str], Span, IntegrationConfig, str) -> None
     """
@@ -86,21 +130,50 @@ def _store_headers(headers, span, integration_config, request_or_response):
     :param integration_config: An integration specific config object.
     :type integration_config: ddtrace.settings.IntegrationConfig
     """
-    if not isinstance(headers, dict):
-        try:
-            headers = dict(headers)
-        except Exception:
-            return
-
     if integration_config is None:
         log.debug("Skipping headers tracing as no integration config was provided")
         return
 
-    for header_name, header_value in headers.items():
-        if not integration_config.header_is_traced(header_name):
-            continue
-        tag_name = _normalize_tag_name(request_or_response, header_name)
-        span.set_tag(tag_name, header_value)
+    tags = _get_header_tags(integration_config, request_or_response)
+    if not tags or not headers:
+        return
+
+    try:
+        items = headers.items() if hasattr(headers, "items") else headers
+        for header_name, header_value in items:
+            tag_name = tags.get(header_name)
+            if tag_name is None:
+                tag_name = tags.get(normalize_header_name(header_name))
+                if tag_name is None:
+                    continue
+            if six.PY3 and isinstance(header_value, bytes):
+                # ASGI headers are byte strings
+                header_value = header_value.decode("utf-8", "replace")
+            span.set_tag(tag_name, header_value)
+    except Exception:
+        log.debug("failed to store %s headers", request_or_response, exc_info=True)
+
+
+def _store_wsgi_request_headers(environ, span, integration_config):
+    # type: (Dict[str, Any], Span, IntegrationConfig) -> None
+    """
+    Store the request headers of a WSGI environ as a span's tags.
+
+    Only the whitelisted headers are looked up in the environ.
+    :param environ: The WSGI environ of the request
+    :type environ: dict
+    :param span: The Span instance where tags will be stored
+    :type span: ddtrace.Span
+    :param integration_config: An integration specific config object.
+    :type integration_config: ddtrace.settings.IntegrationConfig
+    """
+    if integration_config is None or not integration_config.is_header_tracing_configured:
+        return
+
+    for key, tag_name in _get_header_tags(integration_config, WSGI_REQUEST).items():
+        value = environ.get(key)
+        if value is not None:
+            span.set_tag(tag_name, value)
 
 
 def _store_request_headers(headers, span, integration_config):
@@ -11,23 +11,15 @@ from ...internal.compat import parse
 from ...propagation.http import HTTPPropagator
 from ...utils import ArgumentError
 from ...utils import get_argument_value
-from ...utils.formats import asbool
-from ...utils.formats import get_env
 from ...utils.wrappers import unwrap as _u
+from .._defaults import add_config
 
 
 # Ports which, if set, will not be used in hostnames/service names
 DROP_PORTS = (80, 443)
 
 # Initialize the default config vars
-config._add(
-    "urllib3",
-    {
-        "_default_service": "urllib3",
-        "distributed_tracing": asbool(get_env("urllib3", "distributed_tracing", default=True)),
-        "split_by_domain": asbool(get_env("urllib3", "split_by_domain", default=False)),
-    },
-)
+add_config("urllib3")
 
 
 def patch():
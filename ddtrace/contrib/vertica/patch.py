@@ -13,6 +13,7 @@ from ...ext import net
 from ...internal.logger import get_logger
 from ...pin import Pin
 from ...utils.wrappers import unwrap
+from .._defaults import add_config
 from .constants import APP
 
 
@@ -55,11 +56,10 @@ def cursor_span_end(instance, cursor, _, conf, *args, **kwargs):
 
 
 # tracing configuration
+add_config("vertica")
 config._add(
     "vertica",
     {
-        "_default_service": "vertica",
-        "app": "vertica",
         "patch": {
             "vertica_python.vertica.connection.Connection": {
                 "routines": {
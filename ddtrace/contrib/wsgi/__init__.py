@@ -32,6 +32,22 @@ Global Configuration
 
    Default: ``True``
 
+.. py:data:: ddtrace.config.wsgi["lazy"]
+
+   Trace the requests without running the iteration over the responses in a
+   generator of the middleware, and pass ``wsgi.file_wrapper`` responses
+   through to the server. The spans are finished when the server closes the
+   response, and the URL and the headers of the request are only tagged on
+   the sampled traces. As the middleware does not run while the response is
+   iterated over, the spans created by the application during the iteration
+   are not children of the request span, and the errors raised by the
+   iteration are not reported on the spans.
+
+   This option can also be set with the ``DD_WSGI_LAZY`` environment
+   variable.
+
+   Default: ``False``
+
 
 :ref:`All HTTP tags <http-tagging>` are supported for this integration.
 
@@ -22,6 +22,8 @@ from ddtrace.ext import SpanTypes
 from ddtrace.internal.logger import get_logger
 from ddtrace.propagation.http import HTTPPropagator
 from ddtrace.propagation.utils import from_wsgi_header
+from ddtrace.utils.formats import asbool
+from ddtrace.utils.formats import get_env
 
 from .. import trace_utils
 
@@ -35,6 +37,7 @@ config._add(
     dict(
         _default_service="wsgi",
         distributed_tracing=True,
+        lazy=asbool(get_env("wsgi", "lazy", default=False)),
     ),
 )
 
@@ -80,6 +83,31 @@ def default_wsgi_span_modifier(span, environ):
     span.resource = "{} {}".format(environ["REQUEST_METHOD"], environ["PATH_INFO"])
 
 
+def _is_sampled(span):
+    priority = span.context.sampling_priority
+    return span.sampled and (priority is None or priority > 0)
+
+
+class _TracedIterable(object):
+    """Response of a WSGI application that calls ``close`` when it is closed by the server.
+
+    Iterating over it iterates directly over the response of the application, without any frame of the middleware
+    for each chunk.
+    """
+
+    __slots__ = ("_result", "_close")
+
+    def __init__(self, result, close):
+        self._result = result
+        self._close = close
+
+    def __iter__(self):
+        return iter(self._result)
+
+    def close(self):
+        self._close()
+
+
 class DDWSGIMiddleware(object):
     """WSGI middleware providing tracing around an application.
 
@@ -95,6 +123,103 @@ class DDWSGIMiddleware(object):
         self.span_modifier = span_modifier
 
     def __call__(self, environ, start_response):
+        if config.wsgi.lazy:
+            return self._lazy_call(environ, start_response)
+        return self._call(environ, start_response)
+
+    def _lazy_call(self, environ, start_response):
+        """Trace a request without running the iteration over the response in a generator of the middleware.
+
+        The spans are finished when the response is closed by the server, and the URL and the headers of the request
+        are only tagged for the sampled traces.
+        """
+        tracer = self.tracer
+        service = trace_utils.int_service(None, config.wsgi)
+        previous = tracer.context_provider.active()
+
+        trace_utils.activate_distributed_headers(tracer, int_config=config.wsgi, request_headers=environ)
+
+        span = tracer.trace("wsgi.request", service=service, span_type=SpanTypes.WEB)
+        span._ignore_exception(generatorExit)
+
+        file_wrapper = environ.get("wsgi.file_wrapper")
+        wrap_files = file_wrapper is not None and not isinstance(file_wrapper, type)
+        files = []
+        if wrap_files:
+            # The file wrapper of some servers, like uWSGI, is a function: remember the objects it returns
+            def traced_file_wrapper(*args, **kwargs):
+                f = file_wrapper(*args, **kwargs)
+                files.append(f)
+                return f
+
+            environ["wsgi.file_wrapper"] = traced_file_wrapper
+
+        def intercept_start_response(status, response_headers, exc_info=None):
+            status_code, status_msg = status.split(" ", 1)
+            span.set_tag("http.status_msg", status_msg)
+            trace_utils.set_http_meta(span, config.wsgi, status_code=status_code, response_headers=response_headers)
+            with tracer.start_span("wsgi.start_response", child_of=span, service=service, span_type=SpanTypes.WEB):
+                return start_response(status, response_headers, exc_info)
+
+        def finish(resp_span=None, close_result=None):
+            try:
+                if close_result is not None:
+                    close_result()
+            except Exception:
+                span.set_exc_info(*sys.exc_info())
+                raise
+            finally:
+                if resp_span is not None:
+                    resp_span.finish()
+                if _is_sampled(span):
+                    url = construct_url(environ)
+                    method = environ.get("REQUEST_METHOD")
+                    query_string = environ.get("QUERY_STRING")
+                    trace_utils.set_http_meta(span, config.wsgi, method=method, url=url, query=query_string)
+                    trace_utils._store_wsgi_request_headers(environ, span, config.wsgi)
+                if self.span_modifier:
+                    self.span_modifier(span, environ)
+                span.finish()
+
+        try:
+            with tracer.trace("wsgi.application"):
+                result = self.app(environ, intercept_start_response)
+        except BaseException:
+            typ, val, tb = sys.exc_info()
+            span.set_exc_info(typ, val, tb)
+            finish()
+            six.reraise(typ, val, tb=tb)
+        finally:
+            if wrap_files:
+                environ["wsgi.file_wrapper"] = file_wrapper
+            # The response is iterated over after this call returns, possibly in another context
+            tracer.context_provider.activate(previous)
+
+        resp_span = tracer.start_span("wsgi.response", child_of=span, service=service)
+        resp_class = getattr(getattr(result, "__class__", None), "__name__", None)
+        if resp_class:
+            resp_span.meta["result_class"] = resp_class
+
+        close_result = getattr(result, "close", None)
+
+        def close():
+            finish(resp_span, close_result)
+
+        if wrap_files:
+            is_file = any(result is f for f in files)
+        else:
+            is_file = file_wrapper is not None and isinstance(result, file_wrapper)
+        if is_file:
+            # Return the file wrapper itself so that the server can still send the file efficiently
+            try:
+                result.close = close
+            except (AttributeError, TypeError):
+                close()
+            return result
+
+        return _TracedIterable(result, close)
+
+    def _call(self, environ, start_response):
         def intercept_start_response(status, response_headers, exc_info=None):
             span = self.tracer.current_root_span()
             if span is not None:
@@ -135,10 +260,8 @@ class DDWSGIMiddleware(object):
             url = construct_url(environ)
             method = environ.get("REQUEST_METHOD")
             query_string = environ.get("QUERY_STRING")
-            request_headers = get_request_headers(environ)
-            trace_utils.set_http_meta(
-                span, config.wsgi, method=method, url=url, query=query_string, request_headers=request_headers
-            )
+            trace_utils.set_http_meta(span, config.wsgi, method=method, url=url, query=query_string)
+            trace_utils._store_wsgi_request_headers(environ, span, config.wsgi)
 
             if self.span_modifier:
                 self.span_modifier(span, environ)
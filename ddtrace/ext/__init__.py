@@ -9,6 +9,7 @@ class SpanTypes(Enum):
     HTTP = "http"
     MONGODB = "mongodb"
     REDIS = "redis"
+    SERVERLESS = "serverless"
     SQL = "sql"
     TEMPLATE = "template"
     TEST = "test"
@@ -1,12 +1,104 @@
+from typing import Dict
+from typing import List
 from typing import Optional
+from typing import Tuple
 
+from ddtrace.internal import forksafe
 from ddtrace.internal.compat import parse
 from ddtrace.vendor.dogstatsd import DogStatsd
 from ddtrace.vendor.dogstatsd import base
 
 
+_MetricKey = Tuple[str, Optional[Tuple[str, ...]]]
+
+
+class AggregatingDogStatsd(DogStatsd):
+    """Thread-safe DogStatsd client sending the metrics in batches.
+
+    The counters, gauges and distributions are aggregated in process until :meth:`flush` is called: the counters are
+    summed, the gauges keep their last value and the values of the distributions are kept in order. They are then
+    sent in as few datagrams as the maximum payload size allows.
+
+    Recording a metric only holds a lock for a dictionary update, so the client can be shared by any number of
+    threads. The sample rates are ignored since all the values are kept.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(AggregatingDogStatsd, self).__init__(*args, **kwargs)
+        self._metrics_lock = forksafe.Lock()
+        self._counters = {}  # type: Dict[_MetricKey, float]
+        self._gauges = {}  # type: Dict[_MetricKey, float]
+        self._distributions = {}  # type: Dict[_MetricKey, List[float]]
+
+    def increment(self, metric, value=1, tags=None, sample_rate=None):
+        # type: (str, float, Optional[List[str]], Optional[float]) -> None
+        key = (metric, tuple(tags) if tags else None)
+        with self._metrics_lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def decrement(self, metric, value=1, tags=None, sample_rate=None):
+        # type: (str, float, Optional[List[str]], Optional[float]) -> None
+        self.increment(metric, -value, tags)
+
+    def gauge(self, metric, value, tags=None, sample_rate=None):
+        # type: (str, float, Optional[List[str]], Optional[float]) -> None
+        key = (metric, tuple(tags) if tags else None)
+        with self._metrics_lock:
+            self._gauges[key] = value
+
+    def distribution(self, metric, value, tags=None, sample_rate=None):
+        # type: (str, float, Optional[List[str]], Optional[float]) -> None
+        key = (metric, tuple(tags) if tags else None)
+        with self._metrics_lock:
+            values = self._distributions.get(key)
+            if values is None:
+                self._distributions[key] = [value]
+            else:
+                values.append(value)
+
+    def _serialize_metrics(self, metrics, metric_type):
+        # type: (Dict[_MetricKey, float], str) -> List[str]
+        return [
+            self._serialize_metric(metric, metric_type, value, self._add_constant_tags(list(tags) if tags else None))
+            for (metric, tags), value in metrics.items()
+        ]
+
+    def flush(self):
+        # type: () -> None
+        """Send all the aggregated metrics."""
+        with self._metrics_lock:
+            counters, self._counters = self._counters, {}
+            gauges, self._gauges = self._gauges, {}
+            distributions, self._distributions = self._distributions, {}
+
+        if not self._enabled:
+            return
+
+        packets = self._serialize_metrics(counters, "c") + self._serialize_metrics(gauges, "g")
+        for (metric, tags), values in distributions.items():
+            all_tags = self._add_constant_tags(list(tags) if tags else None)
+            packets.extend(self._serialize_metric(metric, "d", value, all_tags) for value in values)
+        if not packets:
+            return
+
+        if self._telemetry:
+            self.metrics_count += len(packets)
+
+        # Pack the metrics into datagrams of at most the maximum payload size
+        datagram = []  # type: List[str]
+        size = 0
+        for packet in packets:
+            if datagram and size + len(packet) > self._max_payload_size:
+                self._send_to_server("\n".join(datagram))
+                datagram = []
+                size = 0
+            datagram.append(packet)
+            size += len(packet) + 1
+        self._send_to_server("\n".join(datagram))
+
+
 def get_dogstatsd_client(url):
-    # type: (str) -> Optional[DogStatsd]
+    # type: (str) -> Optional[AggregatingDogStatsd]
     if not url:
         return None
 
@@ -20,8 +112,10 @@ def get_dogstatsd_client(url):
     parsed = parse.urlparse(url)
 
     if parsed.scheme == "unix":
-        return DogStatsd(socket_path=parsed.path)
+        return AggregatingDogStatsd(socket_path=parsed.path)
     elif parsed.scheme == "udp":
-        return DogStatsd(host=parsed.hostname, port=base.DEFAULT_PORT if parsed.port is None else parsed.port)
+        return AggregatingDogStatsd(
+            host=parsed.hostname, port=base.DEFAULT_PORT if parsed.port is None else parsed.port
+        )
 
     raise ValueError("Unknown scheme `%s` for DogStatsD URL `{}`".format(parsed.scheme))
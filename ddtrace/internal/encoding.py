@@ -15,6 +15,23 @@ if TYPE_CHECKING:
 
 log = get_logger(__name__)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+
+def json_dumps(obj):
+    # type: (Any) -> str
+    """Serialize the object to a JSON string, with orjson when it is installed."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj).decode("utf-8")
+        except TypeError:
+            # orjson only supports the integers of up to 64 bits and the string keys
+            log.debug("Failed to serialize %r with orjson", obj, exc_info=True)
+    return json.dumps(obj)
+
 
 class _EncoderBase(object):
     """
@@ -49,7 +66,7 @@ class JSONEncoder(_EncoderBase):
     @staticmethod
     def encode(obj):
         # type: (Any) -> str
-        return json.dumps(obj)
+        return json_dumps(obj)
 
 
 class JSONEncoderV2(JSONEncoder):
@@ -64,6 +81,17 @@ class JSONEncoderV2(JSONEncoder):
         normalized_traces = [[JSONEncoderV2._convert_span(span) for span in trace] for trace in traces]
         return self.encode({"traces": normalized_traces})
 
+    def encode_trace(self, trace):
+        # type: (List[Span]) -> str
+        """Encode a single trace, to be joined with other traces with :meth:`join_traces`."""
+        return self.encode([JSONEncoderV2._convert_span(span) for span in trace])
+
+    @staticmethod
+    def join_traces(encoded_traces):
+        # type: (List[str]) -> str
+        """Join the traces encoded with :meth:`encode_trace` in a payload like the one of :meth:`encode_traces`."""
+        return '{"traces": [%s]}' % ", ".join(encoded_traces)
+
     @staticmethod
     def _convert_span(span):
         # type: (Span) -> Dict[str, Any]
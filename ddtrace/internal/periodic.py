@@ -1,4 +1,6 @@
 # -*- encoding: utf-8 -*-
+import heapq
+import itertools
 import sys
 import threading
 import time
@@ -6,10 +8,17 @@ import typing
 
 import attr
 
+from ddtrace.internal import compat
 from ddtrace.internal import nogevent
 from ddtrace.internal import service
 
 from . import forksafe
+from ..utils.formats import asbool
+from ..utils.formats import get_env
+from .logger import get_logger
+
+
+log = get_logger(__name__)
 
 
 class PeriodicThread(threading.Thread):
@@ -166,6 +175,200 @@ def PeriodicRealThreadClass():
     return PeriodicThread
 
 
+# The scheduler of the periodic tasks
+DEFAULT_SCHEDULER = "default"
+# The scheduler of the periodic tasks doing network I/O, so that a slow endpoint does not delay the other tasks
+IO_SCHEDULER = "io"
+
+
+class PeriodicScheduler(threading.Thread):
+    """Thread running the periodic tasks of many services.
+
+    The tasks are kept in a heap ordered by deadline: the thread only wakes up when a task is due or when a task is
+    stopped. The tasks run one after the other, so a task that takes long delays the others.
+
+    """
+
+    _ddtrace_profiling_ignore = True
+
+    def __init__(self, name=DEFAULT_SCHEDULER):
+        # type: (str) -> None
+        super(PeriodicScheduler, self).__init__(name="%s:%s:%s" % (__name__, self.__class__.__name__, name))
+        self.daemon = True
+        self._cond = threading.Condition()
+        self._tasks = []  # type: typing.List[typing.Tuple[float, int, ScheduledPeriodicTask]]
+        self._stopping = []  # type: typing.List[ScheduledPeriodicTask]
+        self._counter = itertools.count()
+
+    def _push(self, task):
+        # type: (ScheduledPeriodicTask) -> None
+        heapq.heappush(self._tasks, (compat.monotonic() + task.interval, next(self._counter), task))
+
+    def schedule(self, task):
+        # type: (ScheduledPeriodicTask) -> None
+        """Run the task every ``task.interval`` seconds."""
+        with self._cond:
+            self._push(task)
+            self._cond.notify()
+
+    def unschedule(self, task):
+        # type: (ScheduledPeriodicTask) -> None
+        """Stop running the task and call its shutdown function."""
+        with self._cond:
+            self._stopping.append(task)
+            self._cond.notify()
+
+    def _next(self):
+        # type: (...) -> typing.Tuple[typing.List[ScheduledPeriodicTask], typing.Optional[ScheduledPeriodicTask]]
+        """Wait for tasks to stop or for the next task to be due."""
+        with self._cond:
+            while True:
+                if self._stopping:
+                    stopping, self._stopping = self._stopping, []
+                    return stopping, None
+
+                timeout = None
+                while self._tasks:
+                    deadline, _, task = self._tasks[0]
+                    if task.stopped:
+                        # The stopped tasks are removed lazily
+                        heapq.heappop(self._tasks)
+                        continue
+                    timeout = deadline - compat.monotonic()
+                    if timeout <= 0:
+                        heapq.heappop(self._tasks)
+                        return [], task
+                    break
+
+                self._cond.wait(timeout)
+
+    def run(self):
+        # type: (...) -> None
+        while True:
+            stopping, task = self._next()
+            for stopped_task in stopping:
+                stopped_task._shutdown()
+            if task is not None and task._run():
+                with self._cond:
+                    # The interval of the task might have changed, and the task might have been stopped while running
+                    if not task.stopped:
+                        self._push(task)
+
+
+_schedulers = {}  # type: typing.Dict[str, PeriodicScheduler]
+_scheduler_lock = forksafe.Lock()
+
+
+def get_scheduler(name=DEFAULT_SCHEDULER):
+    # type: (str) -> PeriodicScheduler
+    """Return the scheduler with the given name shared by the periodic services, starting it if needed.
+
+    A new scheduler is started in the child processes since the threads do not survive a fork.
+    """
+    with _scheduler_lock:
+        scheduler = _schedulers.get(name)
+        if scheduler is None or not scheduler.is_alive():
+            scheduler = _schedulers[name] = PeriodicScheduler(name)
+            scheduler.start()
+        return scheduler
+
+
+class ScheduledPeriodicTask(object):
+    """Periodic task run by the shared :class:`PeriodicScheduler`.
+
+    This class has the same interface as ``PeriodicThread``, without using a thread of its own.
+
+    """
+
+    def __init__(
+        self,
+        interval,  # type: float
+        target,  # type: typing.Callable[[], typing.Any]
+        name=None,  # type: typing.Optional[str]
+        on_shutdown=None,  # type: typing.Optional[typing.Callable[[], typing.Any]]
+        scheduler=DEFAULT_SCHEDULER,  # type: str
+    ):
+        # type: (...) -> None
+        """Create a periodic task.
+
+        :param interval: The interval in seconds to wait between execution of the periodic function.
+        :param target: The periodic function to execute every interval.
+        :param name: The name of the task.
+        :param on_shutdown: The function to call when the task is stopped.
+        :param scheduler: The name of the scheduler running the task.
+        """
+        self.interval = interval
+        self.name = name
+        self.stopped = False
+        self._scheduler_name = scheduler
+        self._target = target
+        self._on_shutdown = on_shutdown
+        self._scheduler = None  # type: typing.Optional[PeriodicScheduler]
+        self._done = threading.Event()
+
+    @property
+    def ident(self):
+        # type: (...) -> typing.Optional[int]
+        return self._scheduler.ident if self._scheduler is not None else None
+
+    @property
+    def native_id(self):
+        # type: (...) -> typing.Optional[int]
+        return getattr(self._scheduler, "native_id", None)
+
+    def start(self):
+        # type: (...) -> None
+        """Start the task."""
+        if self._scheduler is not None:
+            raise RuntimeError("tasks can only be started once")
+        self._scheduler = get_scheduler(self._scheduler_name)
+        self._scheduler.schedule(self)
+
+    def stop(self):
+        # type: (...) -> None
+        """Stop the task."""
+        if self._scheduler is None or self.stopped:
+            return
+        self.stopped = True
+        # The scheduler of the parent process does not run in a child process
+        if self._scheduler.is_alive():
+            self._scheduler.unschedule(self)
+        else:
+            self._done.set()
+
+    def is_alive(self):
+        # type: (...) -> bool
+        return self._scheduler is not None and self._scheduler.is_alive() and not self._done.is_set()
+
+    def join(self, timeout=None):
+        # type: (typing.Optional[float]) -> None
+        # Do not wait for the scheduler to be done with the task from the scheduler itself
+        if self.is_alive() and threading.current_thread() is not self._scheduler:
+            self._done.wait(timeout)
+
+    def _run(self):
+        # type: (...) -> bool
+        try:
+            self._target()
+        except Exception:
+            # Like a PeriodicThread, the task stops without calling its shutdown function
+            log.error("Periodic task %s failed", self.name, exc_info=True)
+            self.stopped = True
+            self._done.set()
+            return False
+        return True
+
+    def _shutdown(self):
+        # type: (...) -> None
+        try:
+            if self._on_shutdown is not None:
+                self._on_shutdown()
+        except Exception:
+            log.error("Shutdown of periodic task %s failed", self.name, exc_info=True)
+        finally:
+            self._done.set()
+
+
 @attr.s(eq=False)
 class PeriodicService(service.Service):
     """A service that runs periodically."""
@@ -176,6 +379,15 @@ class PeriodicService(service.Service):
     _real_thread = False
     "Class variable to override if the service should run in a real OS thread."
 
+    _shared_thread = asbool(get_env("trace", "periodic_shared_thread", default=True))
+    """Class variable to override if the service should run in the thread shared by the periodic services.
+
+    The services running in a real OS thread always have their own thread.
+    """
+
+    _scheduler_name = DEFAULT_SCHEDULER
+    "Class variable to override to run the service in the thread shared by the services doing network I/O."
+
     @property
     def interval(self):
         # type: (...) -> float
@@ -191,6 +403,23 @@ class PeriodicService(service.Service):
         if self._worker:
             self._worker.interval = value
 
+    def _create_worker(self):
+        # type: (...) -> typing.Union[PeriodicThread, ScheduledPeriodicTask]
+        name = "%s:%s" % (self.__class__.__module__, self.__class__.__name__)
+        if self._real_thread:
+            return PeriodicRealThreadClass()(
+                self.interval, target=self.periodic, name=name, on_shutdown=self.on_shutdown
+            )
+        if self._shared_thread:
+            return ScheduledPeriodicTask(
+                self.interval,
+                target=self.periodic,
+                name=name,
+                on_shutdown=self.on_shutdown,
+                scheduler=self._scheduler_name,
+            )
+        return PeriodicThread(self.interval, target=self.periodic, name=name, on_shutdown=self.on_shutdown)
+
     def _start_service(
         self,
         *args,  # type: typing.Any
@@ -198,13 +427,7 @@ class PeriodicService(service.Service):
     ):
         # type: (...) -> None
         """Start the periodic service."""
-        periodic_thread_class = PeriodicRealThreadClass() if self._real_thread else PeriodicThread
-        self._worker = periodic_thread_class(
-            self.interval,
-            target=self.periodic,
-            name="%s:%s" % (self.__class__.__module__, self.__class__.__name__),
-            on_shutdown=self.on_shutdown,
-        )
+        self._worker = self._create_worker()
         self._worker.start()
 
     def _stop_service(
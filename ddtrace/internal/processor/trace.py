@@ -86,6 +86,28 @@ class TraceTagsProcessor(TraceProcessor):
         return trace
 
 
+@attr.s
+class TraceLazyResourceProcessor(TraceProcessor):
+    """Processor that computes the resources of the spans that were deferred.
+
+    Integrations can set the private ``_lazy_resource`` attribute of a span to a callable taking the span as argument
+    when computing the resource is costly. The callable is only called for the traces that are kept, and can also set
+    the tags derived from the same data. Until then, the span keeps its default string resource.
+    """
+
+    def process_trace(self, trace):
+        # type: (List[Span]) -> Optional[List[Span]]
+        for span in trace:
+            lazy_resource = span._lazy_resource
+            if lazy_resource is not None:
+                span._lazy_resource = None
+                try:
+                    span.resource = lazy_resource(span)
+                except Exception:
+                    log.debug("failed to compute the resource of span %r", span, exc_info=True)
+        return trace
+
+
 @attr.s
 class SpanAggregator(SpanProcessor):
     """Processor that aggregates spans together by trace_id and writes the
@@ -42,6 +42,10 @@ class ValueCollector(object):
     def _on_modules_load(self):
         """Hook triggered after all required_modules have been successfully loaded."""
 
+    def close(self):
+        # type: () -> None
+        """Release the resources held by the collector once it is no longer used."""
+
     def _load_modules(self):
         modules = {}
         try:
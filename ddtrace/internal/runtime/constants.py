@@ -10,15 +10,56 @@ CPU_TIME_USER = "runtime.python.cpu.time.user"
 CPU_PERCENT = "runtime.python.cpu.percent"
 CTX_SWITCH_VOLUNTARY = "runtime.python.cpu.ctx_switch.voluntary"
 CTX_SWITCH_INVOLUNTARY = "runtime.python.cpu.ctx_switch.involuntary"
+FD_COUNT = "runtime.python.fd_count"
+
+# Distributions: one value is reported per thread or per collection since the last flush
+GC_PAUSE_GEN0 = "runtime.python.gc.pause.gen0"
+GC_PAUSE_GEN1 = "runtime.python.gc.pause.gen1"
+GC_PAUSE_GEN2 = "runtime.python.gc.pause.gen2"
+THREAD_CPU_TIME = "runtime.python.thread.cpu.time"
+ASYNCIO_LOOP_LAG = "runtime.python.asyncio.loop.lag"
+ASYNCIO_TASK_COUNT = "runtime.python.asyncio.task_count"
+ASYNCIO_SLOW_CALLBACK = "runtime.python.asyncio.slow_callback"
+FUTURES_QUEUE_WAIT = "runtime.python.futures.queue.wait"
+FUTURES_EXECUTION_TIME = "runtime.python.futures.execution.time"
+FUTURES_QUEUE_SIZE = "runtime.python.futures.queue.size"
+FUTURES_SATURATION = "runtime.python.futures.saturation"
 
 GC_RUNTIME_METRICS = set([GC_COUNT_GEN0, GC_COUNT_GEN1, GC_COUNT_GEN2])
 
 PSUTIL_RUNTIME_METRICS = set(
-    [THREAD_COUNT, MEM_RSS, CTX_SWITCH_VOLUNTARY, CTX_SWITCH_INVOLUNTARY, CPU_TIME_SYS, CPU_TIME_USER, CPU_PERCENT]
+    [
+        THREAD_COUNT,
+        MEM_RSS,
+        CTX_SWITCH_VOLUNTARY,
+        CTX_SWITCH_INVOLUNTARY,
+        CPU_TIME_SYS,
+        CPU_TIME_USER,
+        CPU_PERCENT,
+        FD_COUNT,
+    ]
 )
 
+# The /proc collector reports the same metrics as the psutil one
+PROC_RUNTIME_METRICS = PSUTIL_RUNTIME_METRICS
+
 DEFAULT_RUNTIME_METRICS = GC_RUNTIME_METRICS | PSUTIL_RUNTIME_METRICS
 
+GC_PAUSE_RUNTIME_METRICS = set([GC_PAUSE_GEN0, GC_PAUSE_GEN1, GC_PAUSE_GEN2])
+
+ASYNCIO_RUNTIME_METRICS = set([ASYNCIO_LOOP_LAG, ASYNCIO_TASK_COUNT, ASYNCIO_SLOW_CALLBACK])
+
+FUTURES_RUNTIME_METRICS = set([FUTURES_QUEUE_WAIT, FUTURES_EXECUTION_TIME, FUTURES_QUEUE_SIZE, FUTURES_SATURATION])
+
+DEFAULT_RUNTIME_DISTRIBUTIONS = (
+    GC_PAUSE_RUNTIME_METRICS | ASYNCIO_RUNTIME_METRICS | FUTURES_RUNTIME_METRICS | set([THREAD_CPU_TIME])
+)
+
+# Metrics set on the root spans with the total duration (in nanoseconds) and the number of the garbage collections
+# that happened while they were active
+SPAN_GC_PAUSE_DURATION = "gc.pause.gen%d.duration"
+SPAN_GC_PAUSE_COUNT = "gc.pause.gen%d.count"
+
 SERVICE = "service"
 ENV = "env"
 LANG_INTERPRETER = "lang_interpreter"
@@ -0,0 +1,77 @@
+"""Garbage collection pause instrumentation.
+
+The collections are timed with a callback registered in ``gc.callbacks``, which is only available on Python 3.
+The callback runs in the thread that triggered the collection, so the listeners can attribute the pause to the
+execution it stalled, e.g. the active span.
+"""
+import gc
+import threading
+from typing import Callable
+from typing import List
+from typing import Optional
+
+from ..compat import monotonic_ns
+from ..logger import get_logger
+
+
+log = get_logger(__name__)
+
+# A listener is called with the generation collected and the duration of the collection in nanoseconds
+GCPauseListener = Callable[[int, int], None]
+
+AVAILABLE = hasattr(gc, "callbacks")
+
+_listeners = []  # type: List[GCPauseListener]
+_lock = threading.Lock()
+_start = None  # type: Optional[int]
+
+
+def _on_gc(phase, info):
+    global _start
+
+    if phase == "start":
+        _start = monotonic_ns()
+        return
+
+    if _start is None:
+        return
+    duration = monotonic_ns() - _start
+    _start = None
+
+    generation = info["generation"]
+    for listener in _listeners:
+        try:
+            listener(generation, duration)
+        except Exception:
+            log.debug("Failed to call the garbage collection pause listener %r", listener, exc_info=True)
+
+
+def register(listener):
+    # type: (GCPauseListener) -> bool
+    """Call the listener after each garbage collection.
+
+    :return: ``False`` if the pauses cannot be measured on this version of Python.
+    """
+    global _listeners
+
+    if not AVAILABLE:
+        return False
+
+    with _lock:
+        if listener not in _listeners:
+            # Copy on write: the callback iterates over the listeners without holding the lock
+            _listeners = _listeners + [listener]
+        if _on_gc not in gc.callbacks:
+            gc.callbacks.append(_on_gc)
+    return True
+
+
+def unregister(listener):
+    # type: (GCPauseListener) -> None
+    """Stop calling the listener after each garbage collection."""
+    global _listeners
+
+    with _lock:
+        _listeners = [_ for _ in _listeners if _ != listener]
+        if not _listeners and AVAILABLE and _on_gc in gc.callbacks:
+            gc.callbacks.remove(_on_gc)
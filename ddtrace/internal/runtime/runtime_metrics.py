@@ -14,14 +14,23 @@ import attr
 import ddtrace
 from ddtrace.internal import forksafe
 
+from . import gc_pauses
 from .. import periodic
 from ...utils.formats import get_env
 from ..dogstatsd import get_dogstatsd_client
 from ..logger import get_logger
+from .constants import DEFAULT_RUNTIME_DISTRIBUTIONS
 from .constants import DEFAULT_RUNTIME_METRICS
 from .constants import DEFAULT_RUNTIME_TAGS
+from .constants import SPAN_GC_PAUSE_COUNT
+from .constants import SPAN_GC_PAUSE_DURATION
+from .metric_collectors import GCPauseRuntimeMetricCollector
 from .metric_collectors import GCRuntimeMetricCollector
+from .metric_collectors import IntegrationRuntimeMetricCollector
+from .metric_collectors import PROCFS_AVAILABLE
 from .metric_collectors import PSUtilRuntimeMetricCollector
+from .metric_collectors import ProcRuntimeMetricCollector
+from .metric_collectors import ThreadCPURuntimeMetricCollector
 from .tag_collectors import PlatformTagCollector
 from .tag_collectors import TracerTagCollector
 
@@ -39,6 +48,11 @@ class RuntimeCollectorsIterable(object):
         collected = (collector.collect(self._enabled) for collector in self._collectors)
         return itertools.chain.from_iterable(collected)
 
+    def close(self):
+        # type: () -> None
+        for collector in self._collectors:
+            collector.close()
+
     def __repr__(self):
         return "{}(enabled={})".format(
             self.__class__.__name__,
@@ -58,7 +72,17 @@ class RuntimeMetrics(RuntimeCollectorsIterable):
     ENABLED = DEFAULT_RUNTIME_METRICS
     COLLECTORS = [
         GCRuntimeMetricCollector,
-        PSUtilRuntimeMetricCollector,
+        # Reading /proc directly is much cheaper than going through psutil
+        ProcRuntimeMetricCollector if PROCFS_AVAILABLE else PSUtilRuntimeMetricCollector,
+    ]
+
+
+class RuntimeDistributions(RuntimeCollectorsIterable):
+    ENABLED = DEFAULT_RUNTIME_DISTRIBUTIONS
+    COLLECTORS = [
+        GCPauseRuntimeMetricCollector,
+        ThreadCPURuntimeMetricCollector,
+        IntegrationRuntimeMetricCollector,
     ]
 
 
@@ -77,6 +101,7 @@ class RuntimeWorker(periodic.PeriodicService):
     dogstatsd_url = attr.ib(type=Optional[str], default=None)
     _dogstatsd_client = attr.ib(init=False, repr=False)
     _runtime_metrics = attr.ib(factory=RuntimeMetrics, repr=False)
+    _runtime_distributions = attr.ib(factory=RuntimeDistributions, repr=False)
     _services = attr.ib(type=Set[str], init=False, factory=set)
 
     enabled = False
@@ -88,6 +113,7 @@ class RuntimeWorker(periodic.PeriodicService):
         self._dogstatsd_client = get_dogstatsd_client(self.dogstatsd_url or ddtrace.internal.agent.get_stats_url())
         self.tracer = self.tracer or ddtrace.tracer
         self.tracer.on_start_span(self._set_language_on_span)
+        gc_pauses.register(self._set_gc_pause_on_root_span)
 
     def _set_language_on_span(
         self,
@@ -99,6 +125,17 @@ class RuntimeWorker(periodic.PeriodicService):
         if span.parent_id is None and self.tracer._is_span_internal(span):
             span.meta["language"] = "python"
 
+    def _set_gc_pause_on_root_span(self, generation, duration):
+        # type: (int, int) -> None
+        # add the garbage collections to the root span of the execution they stalled
+        root = self.tracer.current_root_span()
+        if root is None or root.finished:
+            return
+        duration_key = SPAN_GC_PAUSE_DURATION % generation
+        count_key = SPAN_GC_PAUSE_COUNT % generation
+        root.metrics[duration_key] = root.metrics.get(duration_key, 0) + duration
+        root.metrics[count_key] = root.metrics.get(count_key, 0) + 1
+
     @classmethod
     def disable(cls):
         # type: () -> None
@@ -144,16 +181,19 @@ class RuntimeWorker(periodic.PeriodicService):
             self._services = self.tracer._services
             self.update_runtime_tags()
 
-        with self._dogstatsd_client:
-            for key, value in self._runtime_metrics:
-                log.debug("Writing metric %s:%s", key, value)
-                self._dogstatsd_client.gauge(key, value)
+        for key, value in self._runtime_metrics:
+            log.debug("Writing metric %s:%s", key, value)
+            self._dogstatsd_client.gauge(key, value)
+        for key, value in self._runtime_distributions:
+            self._dogstatsd_client.distribution(key, value)
+        self._dogstatsd_client.flush()
 
     def _stop_service(self):  # type: ignore[override]
         # type: (...) -> None
         # De-register span hook
         super(RuntimeWorker, self)._stop_service()
         self.tracer.deregister_on_start_span(self._set_language_on_span)
+        gc_pauses.unregister(self._set_gc_pause_on_root_span)
 
     def update_runtime_tags(self):
         # type: () -> None
@@ -162,5 +202,11 @@ class RuntimeWorker(periodic.PeriodicService):
         log.debug("Updating constant tags %s", tags)
         self._dogstatsd_client.constant_tags = tags
 
+    def _flush_and_close(self):
+        # type: () -> None
+        self.flush()
+        self._runtime_metrics.close()
+        self._runtime_distributions.close()
+
     periodic = flush
-    on_shutdown = flush
+    on_shutdown = _flush_and_close
@@ -0,0 +1,120 @@
+"""SQL statement obfuscation.
+
+The statements are obfuscated the same way the agent does it before using them as span resources: literals are
+replaced by ``?``, comments are removed, lists of literals are collapsed and whitespace is normalized. This keeps the
+cardinality of the resources low and reduces the size of the payloads sent to the agent.
+"""
+import re
+from typing import Optional
+from typing import Pattern
+from typing import Tuple
+
+from ddtrace.utils.cache import cached
+
+
+# The maximum number of distinct statements whose obfuscated form is retained
+CACHE_SIZE = 1024
+
+# The dialects where ``"..."`` is a string literal rather than a quoted identifier
+_DOUBLE_QUOTED_STRING_DIALECTS = frozenset(("mysql", "pymysql", "mariadb"))
+
+_TOKEN_PATTERN = r"""
+    (?P<string>%(string)s)
+    |(?P<quoted>%(quoted)s)
+    |(?P<comment>\s*(?:(?:--[^\n]*|/\*.*?\*/)\s*)+)
+    |(?P<number>(?<![\w$.:])[-+]?(?:0[xX][0-9a-fA-F]+|(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)(?![\w$.]))
+    |(?P<identifier>[A-Za-z_][\w$]*|\d[\w$]*)
+    |(?P<space>\s+)
+    |(?P<other>.)
+"""
+
+_SINGLE_QUOTED_STRING = r"'(?:[^'\\]|\\.|'')*'"
+
+_TOKEN_RE = re.compile(
+    _TOKEN_PATTERN % dict(string=_SINGLE_QUOTED_STRING, quoted=r'"(?:[^"]|"")*"|`[^`]*`'),
+    re.DOTALL | re.VERBOSE,
+)
+
+_DOUBLE_QUOTED_STRING_TOKEN_RE = re.compile(
+    _TOKEN_PATTERN % dict(string=_SINGLE_QUOTED_STRING + r'|"(?:[^"\\]|\\.|"")*"', quoted=r"`[^`]*`"),
+    re.DOTALL | re.VERBOSE,
+)
+
+_LIST_RE = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+
+# Lists of plain numbers or strings, collapsed before the cache lookup so that the statements that only differ by the
+# values of a list, e.g. ``IN (1, 2, 3)``, share their cache entry
+_LITERAL = r"(?:[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?|'[^'\\]*')"
+_LITERAL_LIST_RE = re.compile(r"\(\s*%s(?:\s*,\s*%s)+\s*\)" % (_LITERAL, _LITERAL))
+
+# The keywords that can be followed by a signed number, e.g. ``SELECT -1``
+_OPERAND_KEYWORDS = frozenset(
+    (
+        "AND",
+        "BETWEEN",
+        "BY",
+        "CASE",
+        "ELSE",
+        "HAVING",
+        "IN",
+        "IS",
+        "LIKE",
+        "LIMIT",
+        "NOT",
+        "OFFSET",
+        "ON",
+        "OR",
+        "RETURN",
+        "SELECT",
+        "SET",
+        "THEN",
+        "VALUES",
+        "WHEN",
+        "WHERE",
+    )
+)
+
+
+def _obfuscate(query, token_re):
+    # type: (str, Pattern[str]) -> str
+    # Whether the previous token is a value, in which case a sign before a number is a binary operator
+    after_value = [False]
+
+    def replace_token(match):
+        kind = match.lastgroup
+        token = match.group()
+        if kind in ("comment", "space"):
+            return " "
+        if kind == "number":
+            replacement = token[0] + "?" if after_value[0] and token[0] in "-+" else "?"
+            after_value[0] = True
+            return replacement
+        if kind == "string":
+            after_value[0] = True
+            return "?"
+        if kind == "identifier":
+            after_value[0] = token.upper() not in _OPERAND_KEYWORDS
+        else:
+            after_value[0] = kind == "quoted" or token in ")]"
+        return token
+
+    return _LIST_RE.sub("(?)", token_re.sub(replace_token, query)).strip()
+
+
+@cached(CACHE_SIZE)
+def _obfuscate_cached(key):
+    # type: (Tuple[str, bool]) -> str
+    query, double_quoted_strings = key
+    return _obfuscate(query, _DOUBLE_QUOTED_STRING_TOKEN_RE if double_quoted_strings else _TOKEN_RE)
+
+
+def obfuscate_query(query, dialect=None):
+    # type: (str, Optional[str]) -> str
+    """Return the obfuscated version of a SQL statement.
+
+    ``"..."`` is obfuscated as a string literal in the MySQL dialects and kept as a quoted identifier otherwise.
+
+    >>> obfuscate_query("SELECT * FROM users WHERE id IN (1, 2, 3) AND name = 'dog'")
+    'SELECT * FROM users WHERE id IN (?) AND name = ?'
+    """
+    return _obfuscate_cached((_LITERAL_LIST_RE.sub("(?)", query), dialect in _DOUBLE_QUOTED_STRING_DIALECTS))
@@ -4,6 +4,7 @@ from json import loads
 import logging
 import os
 import sys
+import threading
 from typing import List
 from typing import Optional
 from typing import TYPE_CHECKING
@@ -20,6 +21,7 @@ from . import compat
 from . import periodic
 from . import service
 from ..constants import KEEP_SPANS_RATE_KEY
+from ..ext import SpanTypes
 from ..sampler import BasePrioritySampler
 from ..sampler import BaseSampler
 from ..utils.formats import get_env
@@ -28,6 +30,7 @@ from ..utils.time import StopWatch
 from ._encoding import BufferFull
 from ._encoding import BufferItemTooLarge
 from .agent import get_connection
+from .dogstatsd import AggregatingDogStatsd
 from .encoding import Encoder
 from .encoding import JSONEncoderV2
 from .logger import get_logger
@@ -52,6 +55,8 @@ DEFAULT_SMA_WINDOW = 10
 DEFAULT_BUFFER_SIZE = 8 << 20  # 8 MB
 DEFAULT_MAX_PAYLOAD_SIZE = 8 << 20  # 8 MB
 DEFAULT_PROCESSING_INTERVAL = 1.0
+# The traces are not buffered by default. CloudWatch Logs limits the size of the log events to 256 KB.
+DEFAULT_LOG_WRITER_BUFFER_SIZE = 0
 
 
 def get_writer_buffer_size():
@@ -59,6 +64,12 @@ def get_writer_buffer_size():
     return int(get_env("trace", "writer_buffer_size_bytes", default=DEFAULT_BUFFER_SIZE))  # type: ignore[arg-type]
 
 
+def get_log_writer_buffer_size():
+    # type: () -> int
+    size = get_env("trace", "log_writer_buffer_size_bytes", default=DEFAULT_LOG_WRITER_BUFFER_SIZE)
+    return int(size)  # type: ignore[arg-type]
+
+
 def get_writer_max_payload_size():
     # type: () -> int
     return int(
@@ -171,19 +182,36 @@ class TraceWriter(six.with_metaclass(abc.ABCMeta)):
         # type: (Optional[List[Span]]) -> None
         pass
 
+    def flush_queue(self):
+        # type: () -> None
+        """Write the traces buffered, if any."""
+        pass
+
 
 class LogWriter(TraceWriter):
+    """Writer of the traces to a log output, the standard output by default.
+
+    With a buffer size, the traces are buffered until their size reaches it, the invocation span of an AWS Lambda
+    function finishes or :meth:`flush_queue` is called, and are then written with a single write. Otherwise each
+    trace is written as soon as it is finished.
+    """
+
     def __init__(
         self,
         out=sys.stdout,  # type: TextIO
         sampler=None,  # type: Optional[BaseSampler]
         priority_sampler=None,  # type: Optional[BasePrioritySampler]
+        buffer_size=0,  # type: int
     ):
         # type: (...) -> None
         self._sampler = sampler
         self._priority_sampler = priority_sampler
         self.encoder = JSONEncoderV2()
         self.out = out
+        self._buffer_size = buffer_size
+        self._buffer = []  # type: List[str]
+        self._buffered_size = 0
+        self._lock = threading.Lock()
 
     def recreate(self):
         # type: () -> LogWriter
@@ -192,22 +220,57 @@ class LogWriter(TraceWriter):
         :rtype: :class:`LogWriter`
         :returns: A new :class:`LogWriter` instance
         """
-        writer = self.__class__(out=self.out, sampler=self._sampler, priority_sampler=self._priority_sampler)
+        writer = self.__class__(
+            out=self.out,
+            sampler=self._sampler,
+            priority_sampler=self._priority_sampler,
+            buffer_size=self._buffer_size,
+        )
         return writer
 
     def stop(self, timeout=None):
         # type: (Optional[float]) -> None
-        return
+        self.flush_queue()
 
     def write(self, spans=None):
         # type: (Optional[List[Span]]) -> None
         if not spans:
             return
 
-        encoded = self.encoder.encode_traces([spans])
+        if not self._buffer_size:
+            encoded = self.encoder.encode_traces([spans])
+            self.out.write(encoded + "\n")
+            self.out.flush()
+            return
+
+        encoded = self.encoder.encode_trace(spans)
+        size = len(encoded.encode("utf-8"))
+        # The invocation span of an AWS Lambda function is the last one finished before the function is frozen. It is
+        # not always the root of its trace, e.g. when the trace is continued from the event of the invocation.
+        invocation_end = any(span.span_type == SpanTypes.SERVERLESS.value for span in spans)
+        with self._lock:
+            if self._buffer and self._buffered_size + size > self._buffer_size:
+                self._write_buffer()
+            self._buffer.append(encoded)
+            self._buffered_size += size
+            if invocation_end or self._buffered_size >= self._buffer_size:
+                self._write_buffer()
+
+    def _write_buffer(self):
+        # type: () -> None
+        if not self._buffer:
+            return
+        encoded = self.encoder.join_traces(self._buffer)
+        self._buffer = []
+        self._buffered_size = 0
         self.out.write(encoded + "\n")
         self.out.flush()
 
+    def flush_queue(self):
+        # type: () -> None
+        with self._lock:
+            self._write_buffer()
+
 
 class AgentWriter(periodic.PeriodicService, TraceWriter):
     """Writer to the Datadog Agent.
@@ -220,6 +283,9 @@ class AgentWriter(periodic.PeriodicService, TraceWriter):
 
     RETRY_ATTEMPTS = 3
 
+    # The traces are sent to the agent over the network
+    _scheduler_name = periodic.IO_SCHEDULER
+
     def __init__(
         self,
         agent_url,  # type: str
@@ -466,14 +532,13 @@ class AgentWriter(periodic.PeriodicService, TraceWriter):
                     log.error("failed to send traces to Datadog Agent at %s", self.agent_url, exc_info=True)
             finally:
                 if self._report_metrics and self.dogstatsd:
-                    # Note that we cannot use the batching functionality of dogstatsd because
-                    # it's not thread-safe.
-                    # https://github.com/DataDog/datadogpy/issues/439
-                    # This really isn't ideal as now we're going to do a ton of socket calls.
                     self.dogstatsd.distribution("datadog.tracer.http.sent.bytes", len(encoded))
                     self.dogstatsd.distribution("datadog.tracer.http.sent.traces", n_traces)
                     for name, metric in self._metrics.items():
                         self.dogstatsd.distribution("datadog.tracer.%s" % name, metric["count"], tags=metric["tags"])
+                    # Send all the metrics in as few datagrams as possible
+                    if isinstance(self.dogstatsd, AggregatingDogStatsd):
+                        self.dogstatsd.flush()
         finally:
             self._set_drop_rate()
             self._metrics_reset()
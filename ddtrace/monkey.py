@@ -8,15 +8,19 @@ using Pin. For that, check its documentation.
 """
 import importlib
 import os
+import pkgutil
 import sys
 import threading
 from typing import Any
 from typing import Callable
 from typing import Dict
 from typing import List
+from typing import Tuple
 
 from ddtrace.vendor.wrapt.importer import when_imported
 
+from .contrib._defaults import add_contrib_configs
+from .internal.compat import PY3
 from .internal.logger import get_logger
 from .settings import _config as config
 from .utils import formats
@@ -81,7 +85,68 @@ PATCH_MODULES = {
 _LOCK = threading.Lock()
 _PATCHED_MODULES = set()
 
-# Modules which are patched on first use
+# Modules of the libraries instrumented by the integrations
+# DEV: <contrib name> => <list of module names of the library>
+# DEV: The integrations whose library is not installed are skipped by `patch_all()` without being imported
+# DEV: `patch_all()` patches every integration when one of these modules is first imported
+_MODULES_FOR_CONTRIB = {
+    "asyncio": ("asyncio",),
+    "aiohttp": ("aiohttp",),
+    "aiobotocore": ("aiobotocore",),
+    "aiopg": ("aiopg",),
+    "algoliasearch": ("algoliasearch",),
+    "boto": ("boto",),
+    "botocore": ("botocore",),
+    "bottle": ("bottle",),
+    "cassandra": ("cassandra.cluster",),
+    "celery": ("celery",),
+    "consul": ("consul",),
+    "django": ("django",),
+    "dogpile_cache": ("dogpile.cache",),
+    "elasticsearch": (
+        "elasticsearch",
+        "elasticsearch2",
+        "elasticsearch5",
+        "elasticsearch6",
+        "elasticsearch7",
+    ),
+    "falcon": ("falcon",),
+    "fastapi": ("fastapi",),
+    "flask": ("flask",),
+    "futures": ("concurrent.futures",),
+    "gevent": ("gevent",),
+    "grpc": ("grpc",),
+    "httplib": ("http.client",) if PY3 else ("httplib",),
+    "jinja2": ("jinja2",),
+    "kombu": ("kombu",),
+    "logging": ("logging",),
+    "mako": ("mako",),
+    "mariadb": ("mariadb",),
+    "molten": ("molten",),
+    "mongoengine": ("mongoengine",),
+    "mysql": ("mysql.connector",),
+    "mysqldb": ("MySQLdb",),
+    "psycopg": ("psycopg2",),
+    "pylibmc": ("pylibmc",),
+    "pylons": ("pylons.wsgiapp",),
+    "pymemcache": ("pymemcache",),
+    "pymongo": ("pymongo",),
+    "pymysql": ("pymysql",),
+    "pynamodb": ("pynamodb",),
+    "pyodbc": ("pyodbc",),
+    "pyramid": ("pyramid",),
+    "redis": ("redis",),
+    "rediscluster": ("rediscluster",),
+    "requests": ("requests",),
+    "sanic": ("sanic",),
+    "sqlalchemy": ("sqlalchemy",),
+    "sqlite3": ("sqlite3",),
+    "starlette": ("starlette",),
+    "urllib3": ("urllib3",),
+    "vertica": ("vertica_python",),
+}
+
+# Modules which are patched on first use by `patch()`, the other ones are patched right away
 # DEV: These modules are patched when the user first imports them, rather than
 #      explicitly importing and patching them on application startup `ddtrace.patch_all(module=True)`
 # DEV: This ensures we do not patch a module until it is needed
@@ -105,6 +170,21 @@ _PATCH_ON_IMPORT = {
 }
 
 
+def _is_installed(module):
+    # type: (str) -> bool
+    """Return whether one of the modules of the library instrumented by the integration can be imported.
+
+    Only the top-level packages are looked up so that nothing is imported.
+    """
+    for name in _MODULES_FOR_CONTRIB[module]:
+        try:
+            if pkgutil.find_loader(name.split(".", 1)[0]) is not None:
+                return True
+        except (ImportError, ValueError):
+            pass
+    return False
+
+
 class PatchException(Exception):
     """Wraps regular `Exception` class when patching modules"""
 
@@ -115,11 +195,31 @@ class ModuleNotFoundException(PatchException):
     pass
 
 
+# Import hooks deferred while an integration is being imported, per thread
+_ON_IMPORT_STATE = threading.local()
+
+
 def _on_import_factory(module, raise_errors=True):
     # type: (str, bool) -> Callable[[Any], None]
     """Factory to create an import hook for the provided module name"""
 
     def on_import(hook):
+        pending = getattr(_ON_IMPORT_STATE, "pending", None)
+        if pending is not None:
+            # The import of an integration can import another instrumented module (e.g. ddtrace.ext.sql imports
+            # psycopg2): patching it now would import the integrations in a circular way, so wait until the
+            # current integration is patched.
+            pending.append(patch_module)
+            return
+
+        _ON_IMPORT_STATE.pending = pending = [patch_module]
+        try:
+            while pending:
+                pending.pop(0)()
+        finally:
+            del _ON_IMPORT_STATE.pending
+
+    def patch_module():
         # Import and patch module
         path = "ddtrace.contrib.%s" % module
         try:
@@ -128,8 +228,23 @@ def _on_import_factory(module, raise_errors=True):
             if raise_errors:
                 raise
             log.error("failed to import ddtrace module %r when patching on import", path, exc_info=True)
+            return
+
+        # patch() is not available when a module required by the integration is missing
+        patch = getattr(imported_module, "patch", None)
+        if patch is None:
+            log.debug("%s.patch is not found, %r is not configured for this environment", path, module)
+            return
+
+        try:
+            patch()
+        except Exception:
+            if raise_errors:
+                raise
+            log.debug("failed to patch %s on import", module, exc_info=True)
         else:
-            imported_module.patch()
+            with _LOCK:
+                _PATCHED_MODULES.add(module)
 
     return on_import
 
@@ -161,11 +276,12 @@ def patch_all(**patch_modules):
     # Arguments take precedence over the environment and the defaults.
     modules.update(patch_modules)
 
-    patch(raise_errors=False, **modules)
+    # Every integration is patched when its library is first imported
+    _patch(modules, _MODULES_FOR_CONTRIB, raise_errors=False)
 
 
 def patch(raise_errors=True, **patch_modules):
-    # type: (bool, Dict[str, bool]) -> None
+    # type: (bool, bool) -> None
     """Patch only a set of given modules.
 
     :param bool raise_errors: Raise error if one patch fail.
@@ -173,10 +289,33 @@ def patch(raise_errors=True, **patch_modules):
 
         >>> patch(psycopg=True, elasticsearch=True)
     """
+    _patch(patch_modules, _PATCH_ON_IMPORT, raise_errors=raise_errors)
+
+
+def _patch(patch_modules, on_import, raise_errors=True):
+    # type: (Dict[str, bool], Dict[str, Tuple[str, ...]], bool) -> None
+    """Patch a set of given modules, the ones in ``on_import`` when one of their modules is first imported."""
     modules = [m for (m, should_patch) in patch_modules.items() if should_patch]
     for module in modules:
-        if module in _PATCH_ON_IMPORT:
-            modules_to_poi = _PATCH_ON_IMPORT[module]
+        if (
+            module in _MODULES_FOR_CONTRIB
+            and not any(m in sys.modules for m in _MODULES_FOR_CONTRIB[module])
+            and not _is_installed(module)
+        ):
+            if raise_errors:
+                # Patch now to report why the integration is not available
+                _patch_module(module, raise_errors=raise_errors)
+            else:
+                # Do not import the integrations of the libraries that are not installed
+                log.debug("the library of %r is not installed, it will not be patched", module)
+            continue
+
+        if module in on_import:
+            # Register the settings of the integration without importing it so that they can be read and
+            # configured before the library is imported
+            add_contrib_configs(module)
+
+            modules_to_poi = on_import[module]
             for m in modules_to_poi:
                 # If the module has already been imported then patch immediately
                 if m in sys.modules:
@@ -186,10 +325,6 @@ def patch(raise_errors=True, **patch_modules):
                 else:
                     # Use factory to create handler to close over `module` and `raise_errors` values from this loop
                     when_imported(m)(_on_import_factory(module, raise_errors))
-
-            # manually add module to patched modules
-            with _LOCK:
-                _PATCHED_MODULES.add(module)
         else:
             _patch_module(module, raise_errors=raise_errors)
 
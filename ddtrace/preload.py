@@ -0,0 +1,86 @@
+"""
+Support for the applications loaded in a parent process that forks the workers, e.g. with gunicorn ``--preload`` or
+uWSGI without ``lazy-apps``.
+
+The memory pages of the parent process are shared with the workers until they write to them. CPython writes to the
+objects it inspects while collecting garbage, so each worker ends up with a private copy of most of the memory of the
+parent. As recommended by the documentation of ``gc.freeze``, call :obj:`disable_gc` as early as possible in the
+parent, so that the objects it frees do not leave holes in the shared pages, and :obj:`freeze` once the application is
+loaded, right before forking the workers, to keep the objects created so far out of the reach of the garbage collector
+of the workers::
+
+    # gunicorn.conf.py
+    import ddtrace.preload
+
+    ddtrace.preload.disable_gc()
+
+    def when_ready(server):
+        ddtrace.preload.freeze()
+
+The only value of the tracer computed ahead by :obj:`freeze` is the hostname. The integration configs and the compiled
+regular expressions are created when their modules are imported, so they are frozen with the other objects, but the
+workers still write to the reference counts of the ones they use, which copies their pages.
+"""
+import gc
+
+from .internal import forksafe
+from .internal import hostname
+from .internal.logger import get_logger
+
+
+log = get_logger(__name__)
+
+_gc_disabled = False
+_gc_enabled_in_child = False
+
+
+def _warm_up():
+    # type: () -> None
+    """Compute in the parent process the values that each worker would compute on first use.
+
+    Only the hostname is computed lazily by the tracer.
+    """
+    hostname.get_hostname()
+
+
+def disable_gc():
+    # type: () -> None
+    """Disable the garbage collector of the parent process until the workers are forked.
+
+    :obj:`freeze` enables it again in the workers.
+    """
+    global _gc_disabled
+
+    gc.disable()
+    _gc_disabled = True
+
+
+def _enable_gc():
+    # type: () -> None
+    # Do not enable the garbage collector of the applications that disable it themselves
+    if _gc_disabled:
+        gc.enable()
+
+
+def freeze():
+    # type: () -> None
+    """Prepare the state of the parent process to be shared with the workers it forks.
+
+    This moves all the objects to the permanent generation of the garbage collector with ``gc.freeze``, which is
+    only available on Python 3.7 and later, and enables the garbage collector in the processes forked afterwards if it
+    was disabled with :obj:`disable_gc`. The objects frozen are never collected, even in the parent process: only call
+    this once the application is loaded.
+    """
+    global _gc_enabled_in_child
+
+    _warm_up()
+    if hasattr(gc, "freeze"):
+        gc.freeze()
+        if hasattr(gc, "get_freeze_count"):
+            log.debug("Froze %d objects", gc.get_freeze_count())
+    else:
+        log.debug("gc.freeze is not available: the objects were not frozen")
+
+    if not _gc_enabled_in_child:
+        forksafe.register(_enable_gc)
+        _gc_enabled_in_child = True
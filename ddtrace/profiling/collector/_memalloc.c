@@ -250,6 +250,25 @@ memalloc_heap_py(PyObject* Py_UNUSED(module), PyObject* Py_UNUSED(args))
     return memalloc_heap();
 }
 
+PyDoc_STRVAR(memalloc_heap_size_classes_py__doc__,
+             "heap_size_classes($module, /)\n"
+             "--\n"
+             "\n"
+             "Get the allocation size class histogram and reset it.\n"
+             "\n"
+             "Returns a list of (upper bound in bytes, number of allocations, allocated bytes) for each\n"
+             "non-empty size class. The upper bound of the last size class is None.\n");
+static PyObject*
+memalloc_heap_size_classes_py(PyObject* Py_UNUSED(module), PyObject* Py_UNUSED(args))
+{
+    if (!global_alloc_tracker) {
+        PyErr_SetString(PyExc_RuntimeError, "the memalloc module was not started");
+        return NULL;
+    }
+
+    return memalloc_heap_size_classes();
+}
+
 typedef struct
 {
     PyObject_HEAD alloc_tracker_t* alloc_tracker;
@@ -377,6 +396,10 @@ static PyTypeObject MemallocIterEvents_Type = {
 static PyMethodDef module_methods[] = { { "start", (PyCFunction)memalloc_start, METH_VARARGS, memalloc_start__doc__ },
                                         { "stop", (PyCFunction)memalloc_stop, METH_NOARGS, memalloc_stop__doc__ },
                                         { "heap", (PyCFunction)memalloc_heap_py, METH_NOARGS, memalloc_heap_py__doc__ },
+                                        { "heap_size_classes",
+                                          (PyCFunction)memalloc_heap_size_classes_py,
+                                          METH_NOARGS,
+                                          memalloc_heap_size_classes_py__doc__ },
                                         /* sentinel */
                                         { NULL, NULL, 0, NULL } };
 
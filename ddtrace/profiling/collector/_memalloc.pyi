@@ -11,4 +11,5 @@ TracebackType = typing.Tuple[StackType, int, int]
 def start(max_nframe: int, max_events: int, heap_sample_size: int) -> None: ...
 def stop() -> None: ...
 def heap() -> typing.List[typing.Tuple[TracebackType, int]]: ...
+def heap_size_classes() -> typing.List[typing.Tuple[typing.Optional[int], int, int]]: ...
 def iter_events() -> typing.Iterator[typing.Tuple[TracebackType, int]]: ...
@@ -1,5 +1,6 @@
 #include <math.h>
 #include <stdlib.h>
+#include <string.h>
 
 #define PY_SSIZE_T_CLEAN
 #include "_memalloc_heap.h"
@@ -17,6 +18,10 @@ typedef struct
     uint32_t allocated_memory;
     /* True if the heap tracker is frozen */
     bool frozen;
+    /* Number of allocations per size class since last reset */
+    uint64_t size_class_count[MEMALLOC_HEAP_SIZE_CLASS_COUNT];
+    /* Allocated memory per size class in bytes since last reset */
+    uint64_t size_class_size[MEMALLOC_HEAP_SIZE_CLASS_COUNT];
     /* Contains the ongoing heap allocation/deallocation while frozen */
     struct
     {
@@ -37,6 +42,31 @@ heap_tracker_next_sample_size(uint32_t sample_size)
     return (uint32_t)(log_val * (-log(2) * (sample_size + 1)));
 }
 
+/* Return the size class index of an allocation of `size` bytes.
+
+   Size classes are power of two buckets: the first one holds allocations up
+   to MEMALLOC_HEAP_SIZE_CLASS_MIN bytes, the last one holds everything that
+   does not fit in the previous ones. */
+static uint16_t
+heap_tracker_size_class(size_t size)
+{
+    uint16_t size_class = 0;
+
+    for (size_t bound = MEMALLOC_HEAP_SIZE_CLASS_MIN;
+         bound < size && size_class < MEMALLOC_HEAP_SIZE_CLASS_COUNT - 1;
+         bound <<= 1)
+        size_class++;
+
+    return size_class;
+}
+
+static void
+heap_tracker_size_classes_reset(heap_tracker_t* heap_tracker)
+{
+    memset(heap_tracker->size_class_count, 0, sizeof(heap_tracker->size_class_count));
+    memset(heap_tracker->size_class_size, 0, sizeof(heap_tracker->size_class_size));
+}
+
 static void
 heap_tracker_init(heap_tracker_t* heap_tracker)
 {
@@ -47,6 +77,7 @@ heap_tracker_init(heap_tracker_t* heap_tracker)
     heap_tracker->frozen = false;
     heap_tracker->sample_size = 0;
     heap_tracker->current_sample_size = 0;
+    heap_tracker_size_classes_reset(heap_tracker);
 }
 
 static void
@@ -167,6 +198,11 @@ memalloc_heap_track(uint16_t max_nframe, void* ptr, size_t size)
     if (global_heap_tracker.sample_size == 0)
         return false;
 
+    /* Account the allocation in its size class; this is cheap enough to be done for every allocation */
+    uint16_t size_class = heap_tracker_size_class(size);
+    global_heap_tracker.size_class_count[size_class]++;
+    global_heap_tracker.size_class_size[size_class] += size;
+
     /* Check for overflow */
     global_heap_tracker.allocated_memory = Py_MIN(global_heap_tracker.allocated_memory + size, MAX_HEAP_SAMPLE_SIZE);
 
@@ -217,3 +253,46 @@ memalloc_heap()
 
     return heap_list;
 }
+
+PyObject*
+memalloc_heap_size_classes()
+{
+    /* Copy the counters and reset them before building the result: creating
+       Python objects allocates memory, which updates the counters. */
+    uint64_t size_class_count[MEMALLOC_HEAP_SIZE_CLASS_COUNT];
+    uint64_t size_class_size[MEMALLOC_HEAP_SIZE_CLASS_COUNT];
+
+    memcpy(size_class_count, global_heap_tracker.size_class_count, sizeof(size_class_count));
+    memcpy(size_class_size, global_heap_tracker.size_class_size, sizeof(size_class_size));
+    heap_tracker_size_classes_reset(&global_heap_tracker);
+
+    PyObject* size_classes = PyList_New(0);
+    if (size_classes == NULL)
+        return NULL;
+
+    size_t bound = MEMALLOC_HEAP_SIZE_CLASS_MIN;
+
+    for (uint16_t i = 0; i < MEMALLOC_HEAP_SIZE_CLASS_COUNT; i++, bound <<= 1) {
+        if (size_class_count[i] == 0)
+            continue;
+
+        /* The last size class has no upper bound */
+        PyObject* upper_bound;
+        if (i == MEMALLOC_HEAP_SIZE_CLASS_COUNT - 1) {
+            Py_INCREF(Py_None);
+            upper_bound = Py_None;
+        } else
+            upper_bound = PyLong_FromSize_t(bound);
+
+        PyObject* size_class = Py_BuildValue(
+          "(NKK)", upper_bound, (unsigned long long)size_class_count[i], (unsigned long long)size_class_size[i]);
+        if (size_class == NULL || PyList_Append(size_classes, size_class) < 0) {
+            Py_XDECREF(size_class);
+            Py_DECREF(size_classes);
+            return NULL;
+        }
+        Py_DECREF(size_class);
+    }
+
+    return size_classes;
+}
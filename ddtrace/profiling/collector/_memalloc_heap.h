@@ -20,6 +20,13 @@ memalloc_heap_tracker_deinit(void);
 PyObject*
 memalloc_heap();
 
+/* Allocations are accounted in power of two size classes, starting at MEMALLOC_HEAP_SIZE_CLASS_MIN bytes */
+#define MEMALLOC_HEAP_SIZE_CLASS_MIN 8
+#define MEMALLOC_HEAP_SIZE_CLASS_COUNT 32
+
+PyObject*
+memalloc_heap_size_classes();
+
 bool
 memalloc_heap_track(uint16_t max_nframe, void* ptr, size_t size);
 void
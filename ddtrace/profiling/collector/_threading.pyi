@@ -1,2 +1,22 @@
+import typing
+
 def get_thread_name(thread_id: int) -> str: ...
 def get_thread_native_id(thread_id: int) -> int: ...
+
+class ContendedLock(object):
+    __wrapped__: typing.Any
+    name: str
+    def __init__(
+        self,
+        wrapped: typing.Any,
+        name: str,
+        on_contention: typing.Callable[["ContendedLock", int], None],
+        threshold_ns: int = ...,
+    ) -> None: ...
+    def acquire(self, *args: typing.Any, **kwargs: typing.Any) -> bool: ...
+    def acquire_lock(self, *args: typing.Any, **kwargs: typing.Any) -> bool: ...
+    def release(self) -> None: ...
+    def release_lock(self) -> None: ...
+    def __enter__(self) -> bool: ...
+    def __exit__(self, exc_type: typing.Any, exc_value: typing.Any, traceback: typing.Any) -> None: ...
+    def __getattr__(self, name: str) -> typing.Any: ...
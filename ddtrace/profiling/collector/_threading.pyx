@@ -2,6 +2,7 @@ from __future__ import absolute_import
 
 import threading
 
+from ddtrace.internal import compat
 from ddtrace.internal import nogevent
 
 
@@ -43,3 +44,66 @@ cpdef get_thread_native_id(thread_id):
         except AttributeError:
             # Python < 3.8
             return hash(thread_obj)
+
+
+cdef class ContendedLock(object):
+    """Lock proxy that only reports contended acquisitions.
+
+    The lock is first acquired without blocking: if that succeeds, the acquisition is not contended and nothing else
+    is done. Otherwise, the blocking acquisition is timed and `on_contention` is called with the lock and the time
+    waited in nanoseconds, if it is greater than or equal to `threshold_ns`. The non-blocking acquisitions, i.e. with
+    `blocking` false or a `timeout` of 0, never wait and are not reported.
+
+    As this class is compiled, no Python frame is pushed for its methods: `sys._getframe(1)` in `on_contention` is
+    the frame that acquired the lock.
+    """
+
+    cdef readonly object __wrapped__
+    cdef readonly object name
+    cdef object _on_contention
+    cdef long long _threshold_ns
+
+    def __init__(self, wrapped, name, on_contention, threshold_ns=0):
+        self.__wrapped__ = wrapped
+        self.name = name
+        self._on_contention = on_contention
+        self._threshold_ns = threshold_ns
+
+    def acquire(self, *args, **kwargs):
+        blocking = args[0] if args else kwargs.get("blocking", True)
+        timeout = args[1] if len(args) > 1 else kwargs.get("timeout", -1)
+        if not blocking or timeout == 0:
+            return self.__wrapped__.acquire(*args, **kwargs)
+
+        if self.__wrapped__.acquire(False):
+            return True
+
+        start = compat.monotonic_ns()
+        try:
+            return self.__wrapped__.acquire(*args, **kwargs)
+        finally:
+            wait_time_ns = compat.monotonic_ns() - start
+            if wait_time_ns >= self._threshold_ns:
+                try:
+                    self._on_contention(self, wait_time_ns)
+                except Exception:
+                    pass
+
+    acquire_lock = acquire
+
+    def release(self):
+        return self.__wrapped__.release()
+
+    release_lock = release
+
+    def __enter__(self):
+        return self.acquire()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.__wrapped__.release()
+
+    def __getattr__(self, name):
+        return getattr(self.__wrapped__, name)
+
+    def __repr__(self):
+        return "<%s %s for %r>" % (self.__class__.__name__, self.name, self.__wrapped__)
@@ -0,0 +1,165 @@
+"""asyncio task wall time profiling collector."""
+from __future__ import absolute_import
+
+import sys
+import typing
+
+import attr
+
+from ddtrace import provider
+from ddtrace import span as ddspan
+from ddtrace.internal import compat
+from ddtrace.profiling import collector
+from ddtrace.profiling.collector import _threading
+from ddtrace.profiling.collector import stack
+from ddtrace.utils import attr as attr_utils
+
+
+try:
+    import asyncio
+except ImportError:
+    asyncio = None  # type: ignore[assignment]
+
+
+FrameType = typing.Tuple[str, int, str]
+
+
+def _get_all_tasks():
+    # type: (...) -> typing.List[asyncio.Task]
+    """Return all the tasks of all the event loops.
+
+    This is called from a different thread than the event loops: the set of tasks might change while we iterate
+    over it, so retry like `asyncio.all_tasks` does.
+    """
+    all_tasks = getattr(asyncio.tasks, "_all_tasks", None)
+    if all_tasks is None:
+        # Python ≥ 3.12 keeps the tasks in `_scheduled_tasks`
+        all_tasks = getattr(asyncio.tasks, "_scheduled_tasks", None)
+        if all_tasks is None:
+            return []
+    for _ in range(1000):
+        try:
+            return list(all_tasks)
+        except RuntimeError:
+            continue
+    return []
+
+
+def _get_task_name(task):
+    # type: (asyncio.Task) -> typing.Optional[str]
+    try:
+        return task.get_name()
+    except AttributeError:
+        # Python < 3.8
+        return None
+
+
+def _coroutine_to_frames(coro, max_nframes):
+    # type: (typing.Any, int) -> typing.Tuple[typing.List[FrameType], int]
+    """Walk the chain of awaited coroutines and return the frames, innermost first."""
+    frames = []  # type: typing.List[FrameType]
+    while coro is not None:
+        # Coroutines and generator-based coroutines expose their frame and awaited object with different names
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None)
+        if frame is None:
+            break
+        code = frame.f_code
+        frames.append((code.co_filename, frame.f_lineno, code.co_name))
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None)
+    frames.reverse()
+    return frames[:max_nframes], len(frames)
+
+
+def _get_task_span(task):
+    # type: (asyncio.Task) -> typing.Optional[ddspan.Span]
+    """Return the active span of a task, if any.
+
+    The context of a task is only reachable from another thread with Python ≥ 3.12 or the pure Python `Task`
+    implementation.
+    """
+    get_context = getattr(task, "get_context", None)
+    if get_context is None:
+        task_context = getattr(task, "_context", None)
+        if task_context is None:
+            return None
+    else:
+        task_context = get_context()
+    span = task_context.get(provider._DD_CONTEXTVAR)
+    if isinstance(span, ddspan.Span) and not span.finished:
+        return span
+    return None
+
+
+@attr.s
+class AsyncioCollector(collector.PeriodicCollector):
+    """Attribute wall time to the suspended asyncio tasks.
+
+    The running task of an event loop is sampled by the stack collector like any other thread. This collector walks
+    the `cr_await` chain of the coroutines of the other pending tasks to report where they are waiting.
+    """
+
+    _interval = attr.ib(factory=attr_utils.from_env("DD_PROFILING_ASYNCIO_INTERVAL", 0.1, float), repr=False)
+    nframes = attr.ib(factory=attr_utils.from_env("DD_PROFILING_MAX_FRAMES", 64, int))
+    _last_wall_time = attr.ib(init=False, repr=False, eq=False)
+
+    def _start_service(self):  # type: ignore[override]
+        # type: (...) -> None
+        # asyncio.tasks._current_tasks is only available in Python ≥ 3.7
+        if asyncio is None or sys.version_info < (3, 7):
+            raise collector.CollectorUnavailable
+        self._last_wall_time = compat.monotonic_ns()
+        super(AsyncioCollector, self)._start_service()
+
+    def collect(self):
+        now = compat.monotonic_ns()
+        wall_time = now - self._last_wall_time
+        self._last_wall_time = now
+
+        # The running tasks are already sampled by the stack collector
+        running_tasks = set(getattr(asyncio.tasks, "_current_tasks", {}).values())
+
+        events = []
+        for task in _get_all_tasks():
+            if task.done() or task in running_tasks:
+                continue
+
+            # The loop is not running: it is not waiting on anything
+            thread_id = getattr(getattr(task, "_loop", None), "_thread_id", None)
+            if thread_id is None:
+                continue
+
+            frames, nframes = _coroutine_to_frames(getattr(task, "_coro", None), self.nframes)
+            if not frames:
+                continue
+
+            span = _get_task_span(task)
+            if span is None:
+                trace_id = span_id = trace_type = trace_resource = None
+            else:
+                trace_id = span.trace_id
+                span_id = span.span_id
+                if span._local_root is None:
+                    trace_type = trace_resource = None
+                else:
+                    trace_type = span._local_root.span_type
+                    trace_resource = span._local_root.resource
+
+            events.append(
+                stack.StackSampleEvent(
+                    thread_id=thread_id,
+                    thread_native_id=_threading.get_thread_native_id(thread_id),
+                    thread_name=_threading.get_thread_name(thread_id),
+                    task_id=id(task),
+                    task_name=_get_task_name(task),
+                    trace_id=trace_id,
+                    span_id=span_id,
+                    trace_resource=trace_resource,
+                    trace_type=trace_type,
+                    frames=frames,
+                    nframes=nframes,
+                    wall_time_ns=wall_time,
+                    sampling_period=int(self.interval * 1e9),
+                )
+            )
+
+        return (tuple(events),)
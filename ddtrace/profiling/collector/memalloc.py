@@ -48,6 +48,34 @@ class MemoryHeapSampleEvent(event.StackBasedEvent):
     """The sampling size."""
 
 
+@event.event_class
+class MemoryHeapGrowthEvent(event.StackBasedEvent):
+    """A sample storing the heap growth of a stack since the previous heap snapshot."""
+
+    size = attr.ib(default=None)
+    """Current heap size allocated by this stack in bytes."""
+
+    growth = attr.ib(default=None)
+    """Heap size growth since the previous snapshot in bytes."""
+
+    sample_size = attr.ib(default=None)
+    """The sampling size."""
+
+
+@event.event_class
+class MemorySizeClassEvent(event.Event):
+    """A histogram bucket of the allocations made since the previous snapshot."""
+
+    upper_bound = attr.ib(default=None, type=typing.Optional[int])
+    """The upper bound of the size class in bytes, or None for the last size class."""
+
+    count = attr.ib(default=None)
+    """Number of allocations in this size class."""
+
+    size = attr.ib(default=None)
+    """Allocated size in this size class in bytes."""
+
+
 def _get_default_heap_sample_size(
     default_heap_sample_size=512 * 1024,  # type: int
 ):
@@ -92,6 +120,8 @@ class MemoryCollector(collector.PeriodicCollector):
     max_nframe = attr.ib(factory=attr_utils.from_env("DD_PROFILING_MAX_FRAMES", 64, int))
     heap_sample_size = attr.ib(type=int, factory=_get_default_heap_sample_size)
     ignore_profiler = attr.ib(factory=attr_utils.from_env("DD_PROFILING_IGNORE_PROFILER", False, formats.asbool))
+    heap_diff = attr.ib(factory=attr_utils.from_env("DD_PROFILING_HEAP_DIFF_ENABLED", False, formats.asbool))
+    _heap_previous = attr.ib(init=False, repr=False, factory=dict)
 
     def _start_service(self):  # type: ignore[override]
         # type: (...) -> None
@@ -107,6 +137,8 @@ class MemoryCollector(collector.PeriodicCollector):
         # type: (...) -> None
         super(MemoryCollector, self)._stop_service()
 
+        self._heap_previous = {}
+
         if _memalloc is not None:
             try:
                 _memalloc.stop()
@@ -125,6 +157,19 @@ class MemoryCollector(collector.PeriodicCollector):
 
     def snapshot(self):
         thread_id_ignore_set = self._get_thread_id_ignore_set()
+        heap = (
+            (traceback, size)
+            for traceback, size in _memalloc.heap()
+            if not self.ignore_profiler or traceback[2] not in thread_id_ignore_set
+        )
+        size_classes = tuple(
+            MemorySizeClassEvent(upper_bound=upper_bound, count=count, size=size)
+            for upper_bound, count, size in _memalloc.heap_size_classes()
+        )
+
+        if self.heap_diff:
+            return (self._heap_growth(heap), size_classes)
+
         return (
             tuple(
                 MemoryHeapSampleEvent(
@@ -136,9 +181,32 @@ class MemoryCollector(collector.PeriodicCollector):
                     size=size,
                     sample_size=self.heap_sample_size,
                 )
-                for (stack, nframes, thread_id), size in _memalloc.heap()
-                if not self.ignore_profiler or thread_id not in thread_id_ignore_set
+                for (stack, nframes, thread_id), size in heap
             ),
+            size_classes,
+        )
+
+    def _heap_growth(self, heap):
+        """Compare the heap with the previous snapshot and return the stacks that grew."""
+        current = {}
+        for traceback, size in heap:
+            current[traceback] = current.get(traceback, 0) + size
+
+        previous, self._heap_previous = self._heap_previous, current
+
+        return tuple(
+            MemoryHeapGrowthEvent(
+                thread_id=thread_id,
+                thread_name=_threading.get_thread_name(thread_id),
+                thread_native_id=_threading.get_thread_native_id(thread_id),
+                frames=stack,
+                nframes=nframes,
+                size=size,
+                growth=size - previous.get((stack, nframes, thread_id), 0),
+                sample_size=self.heap_sample_size,
+            )
+            for (stack, nframes, thread_id), size in current.items()
+            if size > previous.get((stack, nframes, thread_id), 0)
         )
 
     def collect(self):
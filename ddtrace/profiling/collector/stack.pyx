@@ -15,6 +15,7 @@ from ddtrace.internal import compat
 from ddtrace.internal import nogevent
 from ddtrace.profiling import collector
 from ddtrace.profiling import event
+from ddtrace.profiling import recorder
 from ddtrace.profiling.collector import _threading
 from ddtrace.profiling.collector import _traceback
 from ddtrace.utils import attr as attr_utils
@@ -315,7 +316,7 @@ cdef collect_threads(thread_id_ignore_list, thread_time, thread_span_links) with
 
 
 
-cdef stack_collect(ignore_profiler, thread_time, max_nframes, interval, wall_time, thread_span_links):
+cdef stack_collect(ignore_profiler, thread_time, max_nframes, interval, wall_time, thread_span_links, push_sample):
 
     if ignore_profiler:
         # Do not use `threading.enumerate` to not mess with locking (gevent!)
@@ -333,6 +334,8 @@ cdef stack_collect(ignore_profiler, thread_time, max_nframes, interval, wall_tim
 
     stack_events = []
     exc_events = []
+    timestamp = compat.time_ns()
+    sampling_period = int(interval * 1e9)
 
     for thread_id, thread_native_id, thread_name, frame, exception, span, cpu_time in running_threads:
         task_id, task_name = get_task(thread_id)
@@ -360,23 +363,33 @@ cdef stack_collect(ignore_profiler, thread_time, max_nframes, interval, wall_tim
                 trace_type = span._local_root.span_type
                 trace_resource = span._local_root.resource
 
-        stack_events.append(
-            StackSampleEvent(
-                thread_id=thread_id,
-                thread_native_id=thread_native_id,
-                thread_name=thread_name,
-                task_id=task_id,
-                task_name=task_name,
-                trace_id=trace_id,
-                span_id=span_id,
-                trace_resource=trace_resource,
-                trace_type=trace_type,
-                nframes=nframes, frames=frames,
-                wall_time_ns=wall_time,
-                cpu_time_ns=cpu_time,
-                sampling_period=int(interval * 1e9),
-            ),
-        )
+        if push_sample is None:
+            stack_events.append(
+                StackSampleEvent(
+                    timestamp=timestamp,
+                    thread_id=thread_id,
+                    thread_native_id=thread_native_id,
+                    thread_name=thread_name,
+                    task_id=task_id,
+                    task_name=task_name,
+                    trace_id=trace_id,
+                    span_id=span_id,
+                    trace_resource=trace_resource,
+                    trace_type=trace_type,
+                    nframes=nframes, frames=frames,
+                    wall_time_ns=wall_time,
+                    cpu_time_ns=cpu_time,
+                    sampling_period=sampling_period,
+                ),
+            )
+        else:
+            # The recorder stores the samples as columns: do not create any event object
+            push_sample(
+                StackSampleEvent, timestamp, thread_id, tuple(frames), nframes,
+                (thread_name, thread_native_id, task_id, task_name, trace_id, span_id, trace_resource, trace_type,
+                 sampling_period),
+                (wall_time, cpu_time),
+            )
 
         if exception is not None:
             exc_type, exc_traceback = exception
@@ -394,7 +407,7 @@ cdef stack_collect(ignore_profiler, thread_time, max_nframes, interval, wall_tim
                     trace_type=trace_type,
                     nframes=nframes,
                     frames=frames,
-                    sampling_period=int(interval * 1e9),
+                    sampling_period=sampling_period,
                     exc_type=exc_type,
                 ),
             )
@@ -480,6 +493,7 @@ class StackCollector(collector.PeriodicCollector):
     _thread_time = attr.ib(init=False, repr=False, eq=False)
     _last_wall_time = attr.ib(init=False, repr=False, eq=False)
     _thread_span_links = attr.ib(default=None, init=False, repr=False, eq=False)
+    _columnar = attr.ib(default=False, init=False, repr=False, eq=False)
 
     @max_time_usage_pct.validator
     def _check_max_time_usage(self, attribute, value):
@@ -488,6 +502,9 @@ class StackCollector(collector.PeriodicCollector):
 
     def _init(self):
         self._thread_time = _ThreadTime()
+        self._columnar = (
+            isinstance(self.recorder, recorder.ColumnarRecorder) and StackSampleEvent in self.recorder.columns
+        )
         self._last_wall_time = compat.monotonic_ns()
         if self.tracer is not None:
             self._thread_span_links = _ThreadSpanLinks()
@@ -515,6 +532,7 @@ class StackCollector(collector.PeriodicCollector):
 
         all_events = stack_collect(
             self.ignore_profiler, self._thread_time, self.nframes, self.interval, wall_time, self._thread_span_links,
+            self.recorder.push_sample if self._columnar else None,
         )
 
         used_wall_time_ns = compat.monotonic_ns() - now
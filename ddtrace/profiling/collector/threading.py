@@ -3,7 +3,9 @@ from __future__ import absolute_import
 import os.path
 import sys
 import threading
+from typing import Dict
 from typing import Optional
+from typing import Set
 from typing import Tuple
 
 import attr
@@ -12,8 +14,10 @@ from six.moves import _thread
 from ddtrace.internal import compat
 from ddtrace.profiling import collector
 from ddtrace.profiling import event
+from ddtrace.profiling.collector import _threading
 from ddtrace.profiling.collector import _traceback
 from ddtrace.utils import attr as attr_utils
+from ddtrace.utils import formats
 from ddtrace.vendor import wrapt
 
 
@@ -66,6 +70,60 @@ else:
         del _w
 
 
+class _LockIdentityTable(object):
+    """Map lock allocation sites to stable lock names.
+
+    All the locks allocated at the same site share the same name object, so events are aggregated per lock in the
+    exported profiles. Names are `<file basename>:<line>`; if two different files share the same basename and line,
+    the full path is used for the latter one so they are not merged.
+    """
+
+    def __init__(self):
+        # type: (...) -> None
+        self._names = {}  # type: Dict[Tuple[str, int], str]
+        self._used_names = set()  # type: Set[str]
+
+    def get_name(self, frame):
+        # type: (...) -> str
+        """Return the lock name for the lock allocated in `frame`."""
+        key = (frame.f_code.co_filename, frame.f_lineno)
+        try:
+            return self._names[key]
+        except KeyError:
+            pass
+
+        name = "%s:%d" % (os.path.basename(key[0]), key[1])
+        if name in self._used_names:
+            name = "%s:%d" % key
+        self._used_names.add(name)
+        # Several threads could race here: this is fine since they would compute the same name
+        return self._names.setdefault(key, name)
+
+
+_lock_identities = _LockIdentityTable()
+
+
+def _get_trace_and_span_info(tracer):
+    # type: (...) -> Tuple[Optional[int], Optional[int], Optional[str], Optional[str]]
+    """Return current trace id, span id and trace resource and type."""
+    if tracer is None:
+        return (None, None, None, None)
+
+    ctxt = tracer.current_trace_context()
+    if ctxt is None:
+        return (None, None, None, None)
+
+    root = tracer.current_root_span()
+    if root is None:
+        resource = None
+        span_type = None
+    else:
+        resource = root.resource
+        span_type = root.span_type
+
+    return (ctxt.trace_id, ctxt.span_id, resource, span_type)
+
+
 class _ProfiledLock(wrapt.ObjectProxy):
     def __init__(self, wrapped, recorder, tracer, max_nframes, capture_sampler):
         wrapt.ObjectProxy.__init__(self, wrapped)
@@ -73,29 +131,12 @@ class _ProfiledLock(wrapt.ObjectProxy):
         self._self_tracer = tracer
         self._self_max_nframes = max_nframes
         self._self_capture_sampler = capture_sampler
-        frame = sys._getframe(2 if WRAPT_C_EXT else 3)
-        code = frame.f_code
-        self._self_name = "%s:%d" % (os.path.basename(code.co_filename), frame.f_lineno)
+        self._self_name = _lock_identities.get_name(sys._getframe(2 if WRAPT_C_EXT else 3))
 
     def _get_trace_and_span_info(self):
         # type: (...) -> Tuple[Optional[int], Optional[int], Optional[str], Optional[str]]
         """Return current trace id, span id and trace resource and type."""
-        if self._self_tracer is None:
-            return (None, None, None, None)
-
-        ctxt = self._self_tracer.current_trace_context()
-        if ctxt is None:
-            return (None, None, None, None)
-
-        root = self._self_tracer.current_root_span()
-        if root is None:
-            resource = None
-            span_type = None
-        else:
-            resource = root.resource
-            span_type = root.span_type
-
-        return (ctxt.trace_id, ctxt.span_id, resource, span_type)
+        return _get_trace_and_span_info(self._self_tracer)
 
     def acquire(self, *args, **kwargs):
         if not self._self_capture_sampler.capture():
@@ -176,6 +217,8 @@ class LockCollector(collector.CaptureSamplerCollector):
 
     nframes = attr.ib(factory=attr_utils.from_env("DD_PROFILING_MAX_FRAMES", 64, int))
     tracer = attr.ib(default=None)
+    contended_only = attr.ib(factory=attr_utils.from_env("DD_PROFILING_LOCK_CONTENDED_ONLY", False, formats.asbool))
+    contention_threshold_ns = attr.ib(factory=attr_utils.from_env("DD_PROFILING_LOCK_CONTENTION_THRESHOLD_NS", 0, int))
 
     def _start_service(self):  # type: ignore[override]
         # type: (...) -> None
@@ -196,12 +239,46 @@ class LockCollector(collector.CaptureSamplerCollector):
         # Nobody should use locks from `_thread`; if they do so, then it's deliberate and we don't profile.
         self.original = threading.Lock
 
-        def _allocate_lock(wrapped, instance, args, kwargs):
-            lock = wrapped(*args, **kwargs)
-            return _ProfiledLock(lock, self.recorder, self.tracer, self.nframes, self._capture_sampler)
+        if self.contended_only:
+
+            def _allocate_lock(wrapped, instance, args, kwargs):
+                lock = wrapped(*args, **kwargs)
+                name = _lock_identities.get_name(sys._getframe(1 if WRAPT_C_EXT else 2))
+                return _threading.ContendedLock(lock, name, self._on_contention, self.contention_threshold_ns)
+
+        else:
+
+            def _allocate_lock(wrapped, instance, args, kwargs):
+                lock = wrapped(*args, **kwargs)
+                return _ProfiledLock(lock, self.recorder, self.tracer, self.nframes, self._capture_sampler)
 
         threading.Lock = FunctionWrapper(self.original, _allocate_lock)  # type: ignore[misc]
 
+    def _on_contention(self, lock, wait_time_ns):
+        """Record a contended lock acquisition."""
+        if not self._capture_sampler.capture():
+            return
+
+        thread_id, thread_name = _current_thread()
+        # ContendedLock is compiled and does not push any frame: the caller frame acquired the lock
+        frames, nframes = _traceback.pyframe_to_frames(sys._getframe(1), self.nframes)
+        trace_id, span_id, trace_resource, trace_type = _get_trace_and_span_info(self.tracer)
+        self.recorder.push_event(
+            LockAcquireEvent(
+                lock_name=lock.name,
+                frames=frames,
+                nframes=nframes,
+                thread_id=thread_id,
+                thread_name=thread_name,
+                trace_id=trace_id,
+                span_id=span_id,
+                trace_resource=trace_resource,
+                trace_type=trace_type,
+                wait_time_ns=wait_time_ns,
+                sampling_pct=self._capture_sampler.capture_pct,
+            )
+        )
+
     def unpatch(self):
         # type: (...) -> None
         """Unpatch the threading module for tracking lock allocation."""
@@ -1,9 +1,15 @@
+import collections
+import errno
 import gzip
+import io
 import os
+import struct
+import typing
 
 import attr
 
 from ddtrace.profiling.exporter import pprof
+from ddtrace.utils import attr as attr_utils
 
 
 @attr.s
@@ -28,3 +34,295 @@ class PprofFileExporter(pprof.PprofExporter):
         with gzip.open(self.prefix + (".%d.%d" % (os.getpid(), self._increment)), "wb") as f:
             f.write(profile.SerializeToString())
         self._increment += 1
+
+
+_SEGMENT_SUFFIX = ".seg"
+_INDEX_SUFFIX = ".idx"
+
+# Index entry: profile start time, profile end time, offset and size of the compressed profile in the segment
+_INDEX_ENTRY = struct.Struct("<qqQI")
+
+
+def _gzip_compress(data):
+    # type: (bytes) -> bytes
+    buf = io.BytesIO()
+    with gzip.GzipFile(fileobj=buf, mode="wb") as f:
+        f.write(data)
+    return buf.getvalue()
+
+
+def _gzip_decompress(data):
+    # type: (bytes) -> bytes
+    with gzip.GzipFile(fileobj=io.BytesIO(data), mode="rb") as f:
+        return f.read()
+
+
+def _pid_alive(pid):
+    # type: (int) -> bool
+    if pid == os.getpid():
+        return True
+    if os.name == "nt":
+        # os.kill terminates the process on Windows
+        return True
+    try:
+        os.kill(pid, 0)
+    except OSError as e:
+        return e.errno == errno.EPERM
+    return True
+
+
+@attr.s
+class PprofSegmentFileExporter(pprof.PprofExporter):
+    """PProf exporter appending the profiles to rotating segment files.
+
+    Each profile is gzip-compressed and appended to the current segment file of the process. An index file next to
+    each segment stores the time range and position of each profile, so a time window can be read back with
+    `read_profiles` without decompressing the whole history.
+
+    Once a segment is larger than `max_segment_size` bytes, a new one is started. Only the `max_segments` most recent
+    segments of the directory are kept, but the segments the live processes are writing to are never removed.
+    """
+
+    directory = attr.ib()
+    max_segment_size = attr.ib(
+        factory=attr_utils.from_env("DD_PROFILING_OUTPUT_PPROF_SEGMENT_SIZE", 64 * 1024 * 1024, int)
+    )
+    max_segments = attr.ib(factory=attr_utils.from_env("DD_PROFILING_OUTPUT_PPROF_MAX_SEGMENTS", 16, int))
+    _segment = attr.ib(default=None, init=False, repr=False)
+    _increment = attr.ib(default=0, init=False, repr=False)
+
+    def __attrs_post_init__(self):
+        # type: (...) -> None
+        try:
+            os.makedirs(self.directory)
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+
+    def _new_segment(self):
+        # type: (...) -> str
+        self._increment += 1
+        return os.path.join(self.directory, "profile.%d.%06d" % (os.getpid(), self._increment))
+
+    def _rotate(self):
+        # type: (...) -> None
+        segments = []
+        # The current segment of each process, i.e. its latest one
+        current_segments = {}  # type: typing.Dict[int, typing.Tuple[int, str]]
+        for name in os.listdir(self.directory):
+            if not name.endswith(_SEGMENT_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                mtime = os.path.getmtime(path)
+            except OSError:
+                # Rotated by another process in the meantime
+                continue
+            segments.append((mtime, path))
+            try:
+                _, pid, increment = name[: -len(_SEGMENT_SUFFIX)].split(".")
+                key = (int(increment), path)
+                if key > current_segments.get(int(pid), (-1, "")):
+                    current_segments[int(pid)] = key
+            except ValueError:
+                continue
+
+        excess = len(segments) - self.max_segments
+        if excess <= 0:
+            return
+
+        # Never remove the segment a live process is writing to
+        live_segments = {path for pid, (_, path) in current_segments.items() if _pid_alive(pid)}
+        live_segments.add(self._segment + _SEGMENT_SUFFIX)
+        removable = sorted(segment for segment in segments if segment[1] not in live_segments)
+        for _, path in removable[:excess]:
+            for filename in (path, path[: -len(_SEGMENT_SUFFIX)] + _INDEX_SUFFIX):
+                try:
+                    os.unlink(filename)
+                except OSError:
+                    pass
+
+    def export(self, events, start_time_ns, end_time_ns):
+        # type: (...) -> None
+        """Export events to the current segment file.
+
+        :param events: The event dictionary from a `ddtrace.profiling.recorder.Recorder`.
+        :param start_time_ns: The start time of recording.
+        :param end_time_ns: The end time of recording.
+        """
+        profile = super(PprofSegmentFileExporter, self).export(events, start_time_ns, end_time_ns)
+        data = _gzip_compress(profile.SerializeToString())
+
+        # Start a new segment after a fork, too: the segment names are based on the PID
+        if self._segment is None or not self._segment.startswith(
+            os.path.join(self.directory, "profile.%d." % os.getpid())
+        ):
+            self._increment = 0
+            self._segment = self._new_segment()
+        else:
+            try:
+                segment_size = os.path.getsize(self._segment + _SEGMENT_SUFFIX)
+            except OSError:
+                # The segment has been removed, e.g. by hand
+                self._segment = self._new_segment()
+            else:
+                if segment_size + len(data) > self.max_segment_size:
+                    self._segment = self._new_segment()
+
+        with open(self._segment + _SEGMENT_SUFFIX, "ab") as f:
+            offset = f.tell()
+            f.write(data)
+        # Write the index entry last so that readers never see an entry without its data
+        with open(self._segment + _INDEX_SUFFIX, "ab") as f:
+            f.write(_INDEX_ENTRY.pack(start_time_ns, end_time_ns, offset, len(data)))
+
+        self._rotate()
+
+
+def read_profiles(
+    directory,  # type: str
+    start_time_ns=None,  # type: typing.Optional[int]
+    end_time_ns=None,  # type: typing.Optional[int]
+):
+    # type: (...) -> typing.List[typing.Any]
+    """Read the profiles written by `PprofSegmentFileExporter` in a time window.
+
+    :param directory: The directory of the segment files.
+    :param start_time_ns: Only return profiles ending after this time.
+    :param end_time_ns: Only return profiles starting before this time.
+    :return: The profiles, ordered by start time.
+    """
+    entries = []
+    for name in os.listdir(directory):
+        if not name.endswith(_INDEX_SUFFIX):
+            continue
+        segment = os.path.join(directory, name[: -len(_INDEX_SUFFIX)] + _SEGMENT_SUFFIX)
+        with open(os.path.join(directory, name), "rb") as f:
+            index = f.read()
+        # Ignore a possibly truncated last entry
+        for i in range(len(index) // _INDEX_ENTRY.size):
+            start, end, offset, size = _INDEX_ENTRY.unpack_from(index, i * _INDEX_ENTRY.size)
+            if (start_time_ns is None or end >= start_time_ns) and (end_time_ns is None or start <= end_time_ns):
+                entries.append((start, segment, offset, size))
+
+    pprof_pb2 = pprof.pprof_pb2  # type: typing.Any
+    profiles = []
+    for _, segment, offset, size in sorted(entries):
+        try:
+            with open(segment, "rb") as f:
+                f.seek(offset)
+                data = f.read(size)
+        except IOError:
+            # The segment has been rotated in the meantime
+            continue
+        profile = pprof_pb2.Profile()
+        profile.ParseFromString(_gzip_decompress(data))
+        profiles.append(profile)
+    return profiles
+
+
+def merge_profiles(
+    profiles,  # type: typing.Iterable[typing.Any]
+):
+    # type: (...) -> typing.Any
+    """Merge several profiles into one.
+
+    Samples with the same locations and labels are summed up.
+    """
+    pprof_pb2 = pprof.pprof_pb2  # type: typing.Any
+    strings = pprof._StringTable()
+    sample_types = []  # type: typing.List[typing.Tuple[str, str]]
+    functions = {}  # type: typing.Dict[typing.Tuple[str, str, str, int], int]
+    locations = {}  # type: typing.Dict[typing.Tuple[typing.Tuple[int, int], ...], int]
+    samples = collections.defaultdict(
+        lambda: collections.defaultdict(int)
+    )  # type: typing.DefaultDict[typing.Tuple, typing.DefaultDict[int, int]]
+    start = end = None  # type: typing.Optional[int]
+    period = period_type = program_name = None
+
+    for profile in profiles:
+        string_table = profile.string_table
+
+        sample_type_indexes = []
+        for value_type in profile.sample_type:
+            key = (string_table[value_type.type], string_table[value_type.unit])
+            if key not in sample_types:
+                sample_types.append(key)
+            sample_type_indexes.append(sample_types.index(key))
+
+        function_ids = {
+            function.id: functions.setdefault(
+                (
+                    string_table[function.name],
+                    string_table[function.system_name],
+                    string_table[function.filename],
+                    function.start_line,
+                ),
+                len(functions) + 1,
+            )
+            for function in profile.function
+        }
+        location_ids = {
+            location.id: locations.setdefault(
+                tuple((function_ids[line.function_id], line.line) for line in location.line), len(locations) + 1
+            )
+            for location in profile.location
+        }
+
+        for sample in profile.sample:
+            key = (
+                tuple(location_ids[location_id] for location_id in sample.location_id),
+                tuple((string_table[label.key], string_table[label.str], label.num) for label in sample.label),
+            )
+            values = samples[key]
+            for index, value in zip(sample_type_indexes, sample.value):
+                values[index] += value
+
+        profile_end = profile.time_nanos + profile.duration_nanos
+        start = profile.time_nanos if start is None else min(start, profile.time_nanos)
+        end = profile_end if end is None else max(end, profile_end)
+        if period is None:
+            period = profile.period
+            period_type = (string_table[profile.period_type.type], string_table[profile.period_type.unit])
+            program_name = string_table[profile.mapping[0].filename] if profile.mapping else ""
+
+    merged = pprof_pb2.Profile(
+        sample_type=[pprof_pb2.ValueType(type=strings.to_id(t), unit=strings.to_id(u)) for t, u in sample_types],
+        sample=[
+            pprof_pb2.Sample(
+                location_id=sample_location_ids,
+                value=[values.get(i, 0) for i in range(len(sample_types))],
+                label=[pprof_pb2.Label(key=strings.to_id(k), str=strings.to_id(s), num=n) for k, s, n in labels],
+            )
+            for (sample_location_ids, labels), values in samples.items()
+        ],
+        location=[
+            pprof_pb2.Location(
+                id=location_id,
+                mapping_id=1,
+                line=[pprof_pb2.Line(function_id=function_id, line=line) for function_id, line in lines],
+            )
+            for lines, location_id in locations.items()
+        ],
+        function=[
+            pprof_pb2.Function(
+                id=function_id,
+                name=strings.to_id(name),
+                system_name=strings.to_id(system_name),
+                filename=strings.to_id(filename),
+                start_line=start_line,
+            )
+            for (name, system_name, filename, start_line), function_id in functions.items()
+        ],
+        mapping=[pprof_pb2.Mapping(id=1, filename=strings.to_id(program_name or ""))],
+        time_nanos=start or 0,
+        duration_nanos=(end or 0) - (start or 0),
+        period=period or 0,
+    )
+    if period_type is not None:
+        merged.period_type.CopyFrom(
+            pprof_pb2.ValueType(type=strings.to_id(period_type[0]), unit=strings.to_id(period_type[1]))
+        )
+    # The string table must be set last: all the strings must have been added to it
+    merged.string_table.extend(strings)
+    return merged
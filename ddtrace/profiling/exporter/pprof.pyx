@@ -202,6 +202,26 @@ class _PprofConverter(object):
 
         self._location_values[location_key]["heap-space"] += event.size
 
+    def convert_memalloc_heap_growth_event(self, event):
+        location_key = (
+            self._to_locations(event.frames, event.nframes),
+            (
+                ("thread id", str(event.thread_id)),
+                ("thread native id", str(event.thread_native_id)),
+                ("thread name", event.thread_name),
+            ),
+        )
+
+        self._location_values[location_key]["heap-space"] += event.size
+        self._location_values[location_key]["heap-growth"] += event.growth
+
+    def convert_memalloc_size_class_event(self, event):
+        size_class = "inf" if event.upper_bound is None else str(event.upper_bound)
+        location_key = (tuple(), (("allocation size class", size_class),))
+
+        self._location_values[location_key]["size-class-samples"] += event.count
+        self._location_values[location_key]["size-class-space"] += event.size
+
     def convert_lock_acquire_event(
         self,
         lock_name,
@@ -611,6 +631,16 @@ class PprofExporter(exporter.Exporter):
             for event in events.get(memalloc.MemoryHeapSampleEvent, []):
                 converter.convert_memalloc_heap_event(event)
 
+            heap_growth_events = events.get(memalloc.MemoryHeapGrowthEvent, [])
+            for event in heap_growth_events:
+                converter.convert_memalloc_heap_growth_event(event)
+
+            size_class_events = events.get(memalloc.MemorySizeClassEvent, [])
+            for event in size_class_events:
+                converter.convert_memalloc_size_class_event(event)
+        else:
+            heap_growth_events = size_class_events = []
+
         # Compute some metadata
         if nb_event:
             period = int(sum_period / nb_event)
@@ -633,6 +663,12 @@ class PprofExporter(exporter.Exporter):
             ("heap-space", "bytes"),
         )
 
+        # Only advertise the optional heap sample types when they are collected, so the profile stays compact
+        if heap_growth_events:
+            sample_types += (("heap-growth", "bytes"),)
+        if size_class_events:
+            sample_types += (("size-class-samples", "count"), ("size-class-space", "bytes"))
+
         return converter._build_profile(
             start_time_ns=start_time_ns,
             duration_ns=duration_ns,
@@ -1,4 +1,5 @@
 # -*- encoding: utf-8 -*-
+import functools
 import logging
 import os
 from typing import List
@@ -157,6 +158,12 @@ class _ProfilerInstance(service.Service):
                 file.PprofFileExporter(_OUTPUT_PPROF),
             ]
 
+        _OUTPUT_PPROF_SEGMENTS = os.environ.get("DD_PROFILING_OUTPUT_PPROF_SEGMENTS")
+        if _OUTPUT_PPROF_SEGMENTS:
+            return [
+                file.PprofSegmentFileExporter(_OUTPUT_PPROF_SEGMENTS),
+            ]
+
         if self.url is not None:
             endpoint = self.url
         elif self.agentless:
@@ -192,7 +199,12 @@ class _ProfilerInstance(service.Service):
         ]
 
     def __attrs_post_init__(self):
-        r = self._recorder = recorder.Recorder(
+        if formats.asbool(os.environ.get("DD_PROFILING_COLUMNAR_RECORDER", "False")):
+            recorder_class = functools.partial(recorder.ColumnarRecorder, columns=(stack.StackSampleEvent,))
+        else:
+            recorder_class = recorder.Recorder
+
+        r = self._recorder = recorder_class(
             max_events={
                 # Allow to store up to 10 threads for 60 seconds at 100 Hz
                 stack.StackSampleEvent: 10 * 60 * 100,
@@ -203,6 +215,8 @@ class _ProfilerInstance(service.Service):
                 ),
                 # Do not limit the heap sample size as the number of events is relative to allocated memory anyway
                 memalloc.MemoryHeapSampleEvent: None,
+                memalloc.MemoryHeapGrowthEvent: None,
+                memalloc.MemorySizeClassEvent: None,
             },
             default_max_events=int(os.environ.get("DD_PROFILING_MAX_EVENTS", recorder.Recorder._DEFAULT_MAX_EVENTS)),
         )
@@ -213,6 +227,11 @@ class _ProfilerInstance(service.Service):
             threading.LockCollector(r, tracer=self.tracer),
         ]
 
+        if formats.asbool(os.environ.get("DD_PROFILING_ASYNCIO_ENABLED", "False")):
+            from ddtrace.profiling.collector import asyncio
+
+            self._collectors.append(asyncio.AsyncioCollector(r))
+
         exporters = self._build_default_exporters()
 
         if exporters:
@@ -1,10 +1,14 @@
 # -*- encoding: utf-8 -*-
+import array
 import collections
+import typing
 
 import attr
+import six
 
 from ddtrace.internal import forksafe
 from ddtrace.internal import nogevent
+from ddtrace.profiling import event as event_mod
 
 
 class _defaultdictkey(dict):
@@ -88,3 +92,244 @@ class Recorder(object):
             events = self.events
             self._reset_events()
         return events
+
+
+class _InternTable(object):
+    """Assign a stable integer id to hashable values.
+
+    This is only safe to use with a single writer.
+    """
+
+    __slots__ = ("_ids", "values")
+
+    def __init__(self):
+        # type: (...) -> None
+        self._ids = {}  # type: typing.Dict[typing.Hashable, int]
+        self.values = []  # type: typing.List[typing.Hashable]
+
+    def get_id(self, value):
+        # type: (typing.Hashable) -> int
+        try:
+            return self._ids[value]
+        except KeyError:
+            # Append the value before publishing the id so readers never see an id without its value
+            self.values.append(value)
+            value_id = self._ids[value] = len(self.values) - 1
+            return value_id
+
+
+def _column(typecode, capacity):
+    # type: (str, int) -> array.array
+    return array.array(typecode, [0]) * capacity
+
+
+def _column_view(column, count):
+    # type: (array.array, int) -> typing.Union[memoryview, array.array]
+    if six.PY2:
+        # Python 2 arrays do not support the new buffer protocol
+        return column[:count]
+    return memoryview(column)[:count]
+
+
+class _EventColumns(object):
+    """Preallocated ring buffer storing the events of one type as columns.
+
+    Appending is lock-free and only safe with a single writer: the samples are written in all the columns before the
+    number of samples is increased, so a reader never sees a partially written sample. Once the buffer is full, the
+    oldest samples are overwritten. The columns are reused once cleared, rather than allocated again.
+    """
+
+    __slots__ = (
+        "event_type",
+        "value_fields",
+        "capacity",
+        "count",
+        "timestamps",
+        "thread_ids",
+        "stack_ids",
+        "label_ids",
+        "values",
+        "stacks",
+        "labels",
+    )
+
+    def __init__(self, event_type, value_fields, capacity):
+        # type: (typing.Type[event_mod.StackBasedEvent], typing.Tuple[str, ...], int) -> None
+        self.event_type = event_type
+        self.value_fields = value_fields
+        self.capacity = capacity
+        self.count = 0
+        self.timestamps = _column("q", capacity)
+        self.thread_ids = _column("Q", capacity)
+        self.stack_ids = _column("q", capacity)
+        self.label_ids = _column("q", capacity)
+        self.values = tuple(_column("q", capacity) for _ in value_fields)
+        self.stacks = _InternTable()
+        self.labels = _InternTable()
+
+    def clear(self):
+        # type: (...) -> None
+        self.count = 0
+        # The tables of the views of the previous samples are kept as they are
+        self.stacks = _InternTable()
+        self.labels = _InternTable()
+
+    def append(self, timestamp, thread_id, frames, nframes, labels, values):
+        # type: (int, int, typing.Tuple, int, typing.Tuple, typing.Tuple[int, ...]) -> None
+        index = self.count % self.capacity
+        self.timestamps[index] = timestamp
+        self.thread_ids[index] = thread_id
+        self.stack_ids[index] = self.stacks.get_id((frames, nframes))
+        self.label_ids[index] = self.labels.get_id(labels)
+        for column, value in zip(self.values, values):
+            column[index] = value
+        self.count += 1
+
+
+class EventColumnsView(object):
+    """A read-only view on the events of one type stored by a `ColumnarRecorder`.
+
+    The columns are exposed without copy; they are not ordered by timestamp once the buffer wrapped around. They are
+    reused by the recorder after the next reset: the view must not be used past it. Iterating over the view creates
+    the event objects, followed by the events pushed as objects with `ColumnarRecorder.push_events`.
+    """
+
+    def __init__(self, columns, events=()):
+        # type: (_EventColumns, typing.Sequence[event_mod.StackBasedEvent]) -> None
+        count = min(columns.count, columns.capacity)
+        self.event_type = columns.event_type
+        self.timestamps = _column_view(columns.timestamps, count)
+        self.thread_ids = _column_view(columns.thread_ids, count)
+        self.stack_ids = _column_view(columns.stack_ids, count)
+        self.label_ids = _column_view(columns.label_ids, count)
+        self.values = {
+            field: _column_view(column, count) for field, column in zip(columns.value_fields, columns.values)
+        }
+        self.stacks = columns.stacks.values
+        self.labels = columns.labels.values
+        self.dropped = columns.count - count
+        self.events = events
+
+    def __len__(self):
+        # type: (...) -> int
+        return len(self.timestamps) + len(self.events)
+
+    def __iter__(self):
+        values = list(self.values.items())
+        for i in range(len(self.timestamps)):
+            frames, nframes = self.stacks[self.stack_ids[i]]
+            kwargs = dict(zip(ColumnarRecorder.LABEL_FIELDS, self.labels[self.label_ids[i]]))
+            for field, column in values:
+                kwargs[field] = column[i]
+            yield self.event_type(
+                timestamp=self.timestamps[i],
+                thread_id=self.thread_ids[i],
+                frames=list(frames),
+                nframes=nframes,
+                **kwargs
+            )
+        for e in self.events:
+            yield e
+
+
+@attr.s
+class ColumnarRecorder(Recorder):
+    """A recorder storing some event types in preallocated columns rather than as event objects.
+
+    The event types stored as columns must be `StackBasedEvent` whose own attributes are integer values. Samples are
+    pushed with `push_sample`, which does not create any event object; each event type must have a single writer
+    of samples. The events of these types pushed with `push_events`, e.g. by the asyncio collector, and the other
+    event types are recorded like with `Recorder`.
+
+    Two sets of columns are allocated and used in turn: the columns returned by `reset` are cleared and reused by the
+    next one.
+    """
+
+    LABEL_FIELDS = (
+        "thread_name",
+        "thread_native_id",
+        "task_id",
+        "task_name",
+        "trace_id",
+        "span_id",
+        "trace_resource",
+        "trace_type",
+        "sampling_period",
+    )
+
+    columns = attr.ib(factory=tuple)
+    """The event types to store as columns."""
+
+    _value_fields = attr.ib(init=False, repr=False, eq=False)
+    _columns = attr.ib(init=False, repr=False, eq=False, default=None)
+    _spare_columns = attr.ib(init=False, repr=False, eq=False, default=None)
+
+    def __attrs_post_init__(self):
+        base_fields = {f.name for f in attr.fields(event_mod.StackBasedEvent)}
+        self._value_fields = {
+            event_type: tuple(f.name for f in attr.fields(event_type) if f.name not in base_fields)
+            for event_type in self.columns
+        }
+        super(ColumnarRecorder, self).__attrs_post_init__()
+
+    def _after_fork(self):
+        # type: (...) -> None
+        super(ColumnarRecorder, self)._after_fork()
+        self.push_sample = self._push_sample_noop  # type: ignore[assignment]
+
+    def _push_sample_noop(self, *args, **kwargs):
+        pass
+
+    def _reset_events(self):
+        super(ColumnarRecorder, self)._reset_events()
+        columns = self._spare_columns
+        # The current columns are returned by reset: reuse them on the next one
+        self._spare_columns = self._columns
+        if columns is None:
+            columns = {
+                event_type: _EventColumns(
+                    event_type, value_fields, self.max_events.get(event_type) or self.default_max_events
+                )
+                for event_type, value_fields in self._value_fields.items()
+            }
+        else:
+            for event_columns in columns.values():
+                event_columns.clear()
+        self._columns = columns
+
+    def push_sample(
+        self,
+        event_type,  # type: typing.Type[event_mod.StackBasedEvent]
+        timestamp,  # type: int
+        thread_id,  # type: int
+        frames,  # type: typing.Tuple
+        nframes,  # type: int
+        labels,  # type: typing.Tuple
+        values,  # type: typing.Tuple[int, ...]
+    ):
+        # type: (...) -> None
+        """Push a sample without creating an event object.
+
+        :param event_type: The event type, which must be one of `columns`.
+        :param timestamp: The timestamp of the sample in nanoseconds.
+        :param thread_id: The thread id.
+        :param frames: The frames of the sample stack, as a tuple.
+        :param nframes: The total number of frames in the stack.
+        :param labels: The values of the `LABEL_FIELDS` attributes.
+        :param values: The values of the event type own attributes, in the order they are defined.
+        """
+        self._columns[event_type].append(timestamp, thread_id, frames, nframes, labels, values)
+
+    def reset(self):
+        """Reset the recorder.
+
+        :return: The events that have been removed. The event types stored as columns are returned as
+                 `EventColumnsView`.
+        """
+        with self._events_lock:
+            events = self.events
+            columns = self._columns
+            self._reset_events()
+        for event_type, event_columns in columns.items():
+            events[event_type] = EventColumnsView(event_columns, events.get(event_type, ()))
+        return events
@@ -24,6 +24,9 @@ class Scheduler(periodic.PeriodicService):
     _configured_interval = attr.ib(init=False)
     _last_export = attr.ib(init=False, default=None, eq=False)
 
+    # The export sends the profiles over the network
+    _scheduler_name = periodic.IO_SCHEDULER
+
     def __attrs_post_init__(self):
         # Copy the value to use it later since we're going to adjust the real interval
         self._configured_interval = self.interval
@@ -1,6 +1,8 @@
+from typing import Dict
 from typing import List
 from typing import Optional
 from typing import Set
+from typing import Tuple
 from typing import Union
 
 from ..internal.logger import get_logger
@@ -20,6 +22,8 @@ class HttpConfig(object):
     def __init__(self):
         # type: () -> None
         self._whitelist_headers = set()  # type: Set[str]
+        # The tag names of the whitelisted headers, computed by ``trace_utils`` for each kind of headers
+        self._header_tags = {}  # type: Dict[str, Tuple[Set[str], Dict[Union[str, bytes], str]]]
         self.trace_query_string = None
 
     @property
@@ -48,6 +52,7 @@ class HttpConfig(object):
 
         # Mypy can't catch cached method's invalidate()
         self.header_is_traced.invalidate()  # type: ignore[attr-defined]
+        self._header_tags = {}
 
         return self
 
@@ -75,6 +75,7 @@ class Span(object):
         "_parent",
         "_ignored_exceptions",
         "_on_finish_callbacks",
+        "_lazy_resource",
         "__weakref__",
     ]
 
@@ -150,6 +151,8 @@ class Span(object):
         self._parent = None  # type: Optional[Span]
         self._ignored_exceptions = None  # type: Optional[List[Exception]]
         self._local_root = None  # type: Optional[Span]
+        # Computes the resource of the span when its trace is kept, see TraceLazyResourceProcessor
+        self._lazy_resource = None  # type: Optional[Callable[[Span], str]]
 
     def _ignore_exception(self, exc):
         # type: (Exception) -> None
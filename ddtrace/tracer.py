@@ -41,6 +41,7 @@ from .internal.logger import get_logger
 from .internal.logger import hasHandlers
 from .internal.processor import SpanProcessor
 from .internal.processor.trace import SpanAggregator
+from .internal.processor.trace import TraceLazyResourceProcessor
 from .internal.processor.trace import TraceProcessor
 from .internal.processor.trace import TraceSamplingProcessor
 from .internal.processor.trace import TraceTagsProcessor
@@ -48,6 +49,7 @@ from .internal.runtime import get_runtime_id
 from .internal.writer import AgentWriter
 from .internal.writer import LogWriter
 from .internal.writer import TraceWriter
+from .internal.writer import get_log_writer_buffer_size
 from .provider import DefaultContextProvider
 from .sampler import BasePrioritySampler
 from .sampler import BaseSampler
@@ -129,7 +131,7 @@ class Tracer(object):
         self._dogstatsd_url = agent.get_stats_url() if dogstatsd_url is None else dogstatsd_url
 
         if self._use_log_writer() and url is None:
-            writer = LogWriter()  # type: TraceWriter
+            writer = LogWriter(buffer_size=get_log_writer_buffer_size())  # type: TraceWriter
         else:
             url = url or agent.get_trace_url()
             agent.verify_url(url)
@@ -641,6 +643,7 @@ class Tracer(object):
         trace_processors = []  # type: List[TraceProcessor]
         trace_processors += [TraceTagsProcessor()]
         trace_processors += [TraceSamplingProcessor()]
+        trace_processors += [TraceLazyResourceProcessor()]
         trace_processors += self._filters
 
         self._span_processors = [
@@ -946,6 +949,16 @@ class Tracer(object):
             self.start_span = self._shutdown_start_span  # type: ignore[assignment]
             self.trace = self._shutdown_trace  # type: ignore[assignment]
 
+    def flush(self):
+        # type: () -> None
+        """Write the finished traces buffered by the writer.
+
+        In AWS Lambda without the Datadog Agent extension, the traces are written to the logs in batches: call this
+        at the end of each invocation of the function if it is not traced with the Datadog Lambda library, whose
+        invocation span flushes the traces when it finishes.
+        """
+        self.writer.flush_queue()
+
     @staticmethod
     def _use_log_writer():
         # type: () -> bool
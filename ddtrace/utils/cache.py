@@ -2,8 +2,8 @@ from threading import RLock
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import List
 from typing import Optional
-from typing import Tuple
 from typing import Type
 from typing import TypeVar
 
@@ -15,48 +15,103 @@ S = TypeVar("S")
 F = Callable[[T], S]
 M = Callable[[Any, T], S]
 
+# The maximum value of the usage counter of a cache entry
+_MAX_FREQUENCY = 3
+
+
+class CacheStats(object):
+    """Statistics of a cache.
+
+    The number of hits is best effort when the cache is used from several threads, as hits are not serialized.
+    """
+
+    __slots__ = ("hits", "misses", "evictions")
+
+    def __init__(self):
+        # type: () -> None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __repr__(self):
+        # type: () -> str
+        return "%s(hits=%d, misses=%d, evictions=%d)" % (
+            self.__class__.__name__,
+            self.hits,
+            self.misses,
+            self.evictions,
+        )
+
 
 def cached(maxsize=256):
     # type: (int) -> Callable[[F], F]
     """
     Decorator for caching the result of functions with a single argument.
 
-    The strategy is MFU, meaning that only the most frequently used values are
-    retained. The amortized cost of shrinking the cache when it grows beyond
-    the requested size is O(log(size)).
+    The strategy approximates LFU with the GCLOCK algorithm: each entry has a
+    small usage counter that is increased on hits. When the cache is full, a
+    clock hand sweeps over the entries, decreasing their counter, and evicts
+    the first entry whose counter is zero. Hits and misses are O(1), and so
+    are evictions, amortized.
+
+    Hits do not acquire any lock. Misses are serialized so that the function
+    is only called once per key.
     """
 
     def cached_wrapper(f):
         # type: (F) -> F
-        cache = {}  # type: Dict[Any, Tuple[Any, int]]
+        cache = {}  # type: Dict[Any, List[Any]]
+        # The clock: keys in insertion slot order, and the position of the hand
+        keys = []  # type: List[Any]
+        hand = [0]
         lock = RLock()
+        stats = CacheStats()
 
         def cached_f(key):
             # type: (T) -> S
-            if len(cache) >= maxsize:
-                for _, h in zip(range(maxsize >> 1), sorted(cache, key=lambda h: cache[h][1])):
-                    del cache[h]
-
-            _ = cache.get(key, miss)
-            if _ is not miss:
-                value, count = _
-                cache[key] = (value, count + 1)
-                return value
+            entry = cache.get(key)
+            if entry is not None:
+                if entry[1] < _MAX_FREQUENCY:
+                    entry[1] += 1
+                stats.hits += 1
+                return entry[0]
 
             with lock:
-                _ = cache.get(key, miss)
-                if _ is not miss:
-                    value, count = _
-                    cache[key] = (value, count + 1)
-                    return value
+                entry = cache.get(key)
+                if entry is not None:
+                    stats.hits += 1
+                    return entry[0]
 
                 result = f(key)
-
-                cache[key] = (result, 1)
+                stats.misses += 1
+
+                if len(keys) < maxsize:
+                    keys.append(key)
+                else:
+                    i = hand[0]
+                    victim = cache[keys[i]]
+                    while victim[1]:
+                        victim[1] -= 1
+                        i = (i + 1) % maxsize
+                        victim = cache[keys[i]]
+                    del cache[keys[i]]
+                    keys[i] = key
+                    hand[0] = (i + 1) % maxsize
+                    stats.evictions += 1
+
+                cache[key] = [result, 0]
 
                 return result
 
-        cached_f.invalidate = cache.clear  # type: ignore[attr-defined]
+        def invalidate():
+            # type: () -> None
+            with lock:
+                cache.clear()
+                del keys[:]
+                hand[0] = 0
+
+        cached_f.invalidate = invalidate  # type: ignore[attr-defined]
+        cached_f.stats = stats  # type: ignore[attr-defined]
 
         return cached_f
 
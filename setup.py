@@ -176,6 +176,8 @@ setup(
         # users can include opentracing by having:
         # install_requires=['ddtrace[opentracing]', ...]
         "opentracing": ["opentracing>=2.0.0"],
+        # faster JSON serialization of the logs and of the traces written to the standard output
+        "orjson": ["orjson; python_version>='3.6'"],
     },
     # plugin tox
     tests_require=["tox", "flake8"],
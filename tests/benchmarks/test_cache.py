@@ -0,0 +1,39 @@
+import pytest
+
+from ddtrace.utils.cache import cached
+
+
+CACHE_SIZE = 256
+
+
+@pytest.mark.benchmark(group="cache", min_time=0.005)
+def test_cache_hit(benchmark):
+    @cached(CACHE_SIZE)
+    def f(key):
+        return key
+
+    keys = ["key%d" % i for i in range(CACHE_SIZE >> 1)]
+    for key in keys:
+        f(key)
+
+    def _():
+        for key in keys:
+            f(key)
+
+    benchmark(_)
+
+
+@pytest.mark.benchmark(group="cache", min_time=0.005)
+def test_cache_high_cardinality(benchmark):
+    @cached(CACHE_SIZE)
+    def f(key):
+        return key
+
+    # Many more distinct keys than the cache can hold, with a small set of hot keys
+    keys = ["key%d" % (i if i % 2 else i % 16) for i in range(CACHE_SIZE * 8)]
+
+    def _():
+        for key in keys:
+            f(key)
+
+    benchmark(_)
@@ -0,0 +1,61 @@
+import pytest
+
+from ddtrace import Pin
+from ddtrace.contrib.redis.patch import patch
+from ddtrace.contrib.redis.patch import unpatch
+from tests.utils import DummyTracer
+
+
+redis = pytest.importorskip("redis")
+
+
+class FakeConnection(redis.Connection):
+    """Connection that does not talk to a server, to measure the overhead of the integration only."""
+
+    def connect(self):
+        pass
+
+    def disconnect(self):
+        pass
+
+    def can_read(self, timeout=0):
+        return False
+
+    def send_packed_command(self, command, check_health=True):
+        pass
+
+    def read_response(self):
+        return b"OK"
+
+
+@pytest.fixture
+def client():
+    patch()
+    try:
+        client = redis.Redis(connection_pool=redis.ConnectionPool(connection_class=FakeConnection))
+        Pin.override(client, tracer=DummyTracer())
+        yield client
+    finally:
+        unpatch()
+
+
+@pytest.mark.benchmark(group="redis", min_time=0.005)
+def test_redis_command(benchmark, client):
+    benchmark(client.get, "key")
+
+
+@pytest.mark.benchmark(group="redis", min_time=0.005)
+def test_redis_mset(benchmark, client):
+    mapping = dict(("key%d" % i, "value%d" % i) for i in range(100))
+    benchmark(client.mset, mapping)
+
+
+@pytest.mark.benchmark(group="redis", min_time=0.005)
+def test_redis_pipeline(benchmark, client):
+    def _():
+        pipeline = client.pipeline(transaction=False)
+        for i in range(100):
+            pipeline.set("key%d" % i, "value%d" % i)
+        pipeline.execute()
+
+    benchmark(_)
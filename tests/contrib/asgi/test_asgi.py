@@ -10,6 +10,7 @@ import pytest
 from ddtrace.contrib.asgi import TraceMiddleware
 from ddtrace.propagation import http as http_propagation
 from tests.utils import DummyTracer
+from tests.utils import override_config
 from tests.utils import override_http_config
 
 
@@ -304,6 +305,56 @@ async def test_distributed_tracing(scope, tracer, test_spans):
     _check_span_tags(scope, request_span)
 
 
+async def streaming_app(scope, receive, send):
+    message = await receive()
+    if message.get("type") == "http.request":
+        await send({"type": "http.response.start", "status": 200, "headers": [[b"content-type", b"text/plain"]]})
+        for _ in range(3):
+            await send({"type": "http.response.body", "body": b"*", "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+
+@pytest.mark.asyncio
+async def test_fast_path(tracer, test_spans):
+    scope = {
+        "headers": [
+            (http_propagation.HTTP_HEADER_PARENT_ID.encode(), b"1234"),
+            (http_propagation.HTTP_HEADER_TRACE_ID.encode(), b"5678"),
+            (b"my-header", b"my-value"),
+            (b"other-header", b"other-value"),
+        ],
+        "method": "GET",
+        "path": "/",
+        "query_string": b"",
+        "scheme": "http",
+        "server": ("127.0.0.1", 80),
+        "type": "http",
+    }
+    with override_config("asgi", dict(fast_path=True)), override_http_config(
+        "asgi", dict(_whitelist_headers=set(["my-header", "content-type"]))
+    ):
+        app = TraceMiddleware(streaming_app, tracer=tracer)
+        instance = ApplicationCommunicator(app, scope)
+        await instance.send_input({"type": "http.request", "body": b""})
+        response_start = await instance.receive_output(1)
+        assert response_start["status"] == 200
+        bodies = [await instance.receive_output(1) for _ in range(4)]
+        assert b"".join(b["body"] for b in bodies) == b"***"
+
+    spans = test_spans.pop_traces()
+    assert len(spans) == 1
+    assert len(spans[0]) == 1
+    request_span = spans[0][0]
+    assert request_span.name == "asgi.request"
+    assert request_span.parent_id == 1234
+    assert request_span.trace_id == 5678
+    assert request_span.get_tag("http.status_code") == "200"
+    assert request_span.get_tag("http.url") == "http://127.0.0.1/"
+    assert request_span.get_tag("http.request.headers.my-header") == "my-value"
+    assert request_span.get_tag("http.request.headers.other-header") is None
+    assert request_span.get_tag("http.response.headers.content-type") == "text/plain"
+
+
 @pytest.mark.asyncio
 async def test_multiple_requests(tracer, test_spans):
     with override_http_config("asgi", dict(trace_query_string=True)):
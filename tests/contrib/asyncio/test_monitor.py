@@ -0,0 +1,112 @@
+import asyncio
+import sys
+import time
+
+import pytest
+
+from ddtrace.contrib.asyncio import LoopMonitor
+from ddtrace.contrib.asyncio import monitor as monitor_module
+from ddtrace.internal.runtime.constants import ASYNCIO_LOOP_LAG
+from ddtrace.internal.runtime.constants import ASYNCIO_SLOW_CALLBACK
+from ddtrace.internal.runtime.constants import ASYNCIO_TASK_COUNT
+from ddtrace.internal.runtime.runtime_metrics import RuntimeDistributions
+
+
+@pytest.fixture
+def loop():
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+def test_loop_lag_and_tasks(loop):
+    monitor = LoopMonitor(interval=0.01)
+    monitor.start(loop)
+    try:
+
+        async def main():
+            tasks = [loop.create_task(asyncio.sleep(0.1)) for _ in range(5)]
+            await asyncio.sleep(0.02)
+            # Block the loop
+            time.sleep(0.05)
+            await asyncio.gather(*tasks)
+
+        loop.run_until_complete(main())
+    finally:
+        monitor.stop()
+
+    samples = monitor.collect()
+    lags = [value for key, value in samples if key == ASYNCIO_LOOP_LAG]
+    task_counts = [value for key, value in samples if key == ASYNCIO_TASK_COUNT]
+    assert lags and task_counts
+    assert max(lags) >= 0.03
+    # The main task and the sleeping ones
+    assert max(task_counts) == 6
+    assert monitor.collect() == []
+
+
+def test_slow_callbacks(loop):
+    monitor = LoopMonitor(interval=10, slow_callback_threshold=0.02)
+    monitor.start(loop)
+    try:
+
+        async def main():
+            time.sleep(0.03)
+            await asyncio.sleep(0)
+
+        loop.run_until_complete(main())
+    finally:
+        monitor.stop()
+
+    assert asyncio.events.Handle._run is monitor_module._handle_run
+    slow_callbacks = [value for key, value in monitor.collect() if key == ASYNCIO_SLOW_CALLBACK]
+    assert len(slow_callbacks) == 1
+    assert slow_callbacks[0] >= 0.03
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="the context of the handles requires Python 3.7")
+def test_slow_callbacks_root_span(loop, tracer):
+    monitor = LoopMonitor(interval=10, slow_callback_threshold=0.02, tag_root_span=True)
+    monitor.start(loop)
+    try:
+
+        async def main():
+            with tracer.trace("root") as root:
+                with tracer.trace("child") as child:
+                    time.sleep(0.03)
+                    await asyncio.sleep(0)
+                    # Not slow
+                    await asyncio.sleep(0)
+            return root, child
+
+        root, child = loop.run_until_complete(main())
+    finally:
+        monitor.stop()
+
+    assert root.get_metric("asyncio.slow_callback.count") == 1
+    assert root.get_metric("asyncio.slow_callback.duration") >= 0.03e9
+    assert child.get_metric("asyncio.slow_callback.count") is None
+
+
+def test_start_twice(loop):
+    monitor = LoopMonitor()
+    monitor.start(loop)
+    try:
+        with pytest.raises(RuntimeError):
+            LoopMonitor().start(loop)
+    finally:
+        monitor.stop()
+
+
+def test_runtime_distributions(loop):
+    monitor = LoopMonitor(interval=0.01)
+    monitor.start(loop)
+    distributions = RuntimeDistributions(enabled=[ASYNCIO_LOOP_LAG, ASYNCIO_TASK_COUNT])
+    try:
+        loop.run_until_complete(asyncio.sleep(0.05))
+        metrics = set(key for key, _ in distributions)
+    finally:
+        distributions.close()
+        monitor.stop()
+
+    assert metrics == {ASYNCIO_LOOP_LAG, ASYNCIO_TASK_COUNT}
@@ -277,6 +277,23 @@ class TestTracedCursor(TracerTestCase):
         span = self.pop_spans()[0]
         self.assertIsNone(span.get_metric(ANALYTICS_SAMPLE_RATE_KEY))
 
+    def test_sql_obfuscation(self):
+        cursor = self.cursor
+        cursor.rowcount = 0
+
+        pin = Pin("pin_name", tracer=self.tracer)
+        traced_cursor = TracedCursor(cursor, pin, {})
+        query = "SELECT * FROM users WHERE id IN (1, 2, 3) AND name = 'dog'"
+        with self.override_global_config(dict(sql_obfuscation=True)):
+            traced_cursor.execute(query)
+        traced_cursor.execute(query)
+
+        obfuscated, raw = self.pop_spans()
+        assert obfuscated.resource == "SELECT * FROM users WHERE id IN (?) AND name = ?"
+        assert raw.resource == query
+        # The query is passed unchanged to the database
+        cursor.execute.assert_called_with(query)
+
 
 class TestFetchTracedCursor(TracerTestCase):
     def setUp(self):
@@ -500,6 +517,99 @@ class TestFetchTracedCursor(TracerTestCase):
             span = self.pop_spans()[0]
             self.assertIsNone(span.get_metric(ANALYTICS_SAMPLE_RATE_KEY))
 
+    def test_fetch_aggregation(self):
+        cursor = self.cursor
+        cursor.rowcount = 0
+        cursor.fetchone.side_effect = [(1,), (2,), (3,), (4,), (5,), None]
+        cursor.fetchmany.side_effect = [[(1,), (2,)], [(3,), (4,)], [(5,), (6,)], [(7,)]]
+        pin = Pin("pin_name", tracer=self.tracer)
+        traced_cursor = FetchTracedCursor(cursor, pin, {})
+
+        with self.override_config("dbapi2", dict(fetch_aggregation_threshold=2)):
+            with self.tracer.trace("parent") as parent:
+                traced_cursor.execute("SELECT 1")
+                while traced_cursor.fetchone() is not None:
+                    pass
+                traced_cursor.execute("SELECT 2")
+                traced_cursor.fetchmany(2)
+                traced_cursor.fetchmany(2)
+                traced_cursor.fetchmany(2)
+                traced_cursor.fetchmany(2)
+                # The next query finishes the aggregated span of the current one
+                traced_cursor.execute("SELECT 3")
+
+        spans = self.pop_spans()
+        assert [(s.name, s.resource) for s in spans] == [
+            ("parent", "parent"),
+            ("sql.query", "SELECT 1"),
+            ("sql.query.fetchone", "SELECT 1"),
+            ("sql.query.fetchone", "SELECT 1"),
+            ("sql.query.fetch", "SELECT 1"),
+            ("sql.query", "SELECT 2"),
+            ("sql.query.fetchmany", "SELECT 2"),
+            ("sql.query.fetchmany", "SELECT 2"),
+            ("sql.query.fetch", "SELECT 2"),
+            ("sql.query", "SELECT 3"),
+        ]
+        for span in spans[1:]:
+            assert span.parent_id == parent.span_id
+
+        fetch_one = spans[4]
+        assert fetch_one.get_metric("db.fetch.count") == 4
+        assert fetch_one.get_metric("db.fetch.rows") == 3
+        assert 0 <= fetch_one.get_metric("db.fetch.duration.min") <= fetch_one.get_metric("db.fetch.duration.avg")
+        assert fetch_one.get_metric("db.fetch.duration.avg") <= fetch_one.get_metric("db.fetch.duration.max")
+        assert fetch_one.start_ns >= spans[3].start_ns + spans[3].duration_ns
+
+        fetch_many = spans[8]
+        assert fetch_many.get_metric("db.fetch.count") == 2
+        assert fetch_many.get_metric("db.fetch.rows") == 3
+
+    def test_fetch_aggregation_close(self):
+        cursor = self.cursor
+        cursor.rowcount = 0
+        cursor.fetchone.return_value = (1,)
+        pin = Pin("pin_name", tracer=self.tracer)
+        traced_cursor = FetchTracedCursor(cursor, pin, {})
+
+        with self.override_config("dbapi2", dict(fetch_aggregation_threshold=1)):
+            traced_cursor.execute("SELECT 1")
+            for _ in range(10):
+                traced_cursor.fetchone()
+            assert [s.name for s in self.pop_spans()] == ["sql.query", "sql.query.fetchone"]
+            traced_cursor.close()
+
+        (span,) = self.pop_spans()
+        assert span.name == "sql.query.fetch"
+        assert span.get_metric("db.fetch.count") == 9
+        assert span.get_metric("db.fetch.rows") == 9
+        cursor.close.assert_called_once_with()
+
+    def test_fetch_aggregation_parent_finish(self):
+        cursor = self.cursor
+        cursor.rowcount = 0
+        cursor.fetchone.return_value = (1,)
+        pin = Pin("pin_name", tracer=self.tracer)
+        traced_cursor = FetchTracedCursor(cursor, pin, {})
+
+        with self.override_config("dbapi2", dict(fetch_aggregation_threshold=1)):
+            with self.tracer.trace("parent") as parent:
+                traced_cursor.execute("SELECT 1")
+                for _ in range(5):
+                    traced_cursor.fetchone()
+
+        # The cursor is never closed: the aggregated span is reported with its parent
+        spans = self.pop_spans()
+        assert [s.name for s in spans] == ["parent", "sql.query", "sql.query.fetchone", "sql.query.fetch"]
+        fetch = spans[3]
+        assert fetch.parent_id == parent.span_id
+        assert fetch.get_metric("db.fetch.count") == 4
+        assert traced_cursor._self_fetch_aggregate is None
+
+        # Closing the cursor afterwards does not report it again
+        traced_cursor.close()
+        assert self.pop_spans() == []
+
     def test_unknown_rowcount(self):
         class Unknown(object):
             pass
@@ -17,6 +17,7 @@ from six import ensure_text
 from ddtrace import config
 from ddtrace.constants import ANALYTICS_SAMPLE_RATE_KEY
 from ddtrace.constants import SAMPLING_PRIORITY_KEY
+from ddtrace.contrib.django import utils as django_utils
 from ddtrace.contrib.django.patch import instrument_view
 from ddtrace.contrib.django.utils import get_request_uri
 from ddtrace.ext import errors
@@ -29,6 +30,7 @@ from ddtrace.propagation.http import HTTP_HEADER_PARENT_ID
 from ddtrace.propagation.http import HTTP_HEADER_SAMPLING_PRIORITY
 from ddtrace.propagation.http import HTTP_HEADER_TRACE_ID
 from ddtrace.propagation.utils import get_wsgi_header
+from ddtrace.sampler import DatadogSampler
 from ddtrace.vendor import wrapt
 from tests.opentracer.utils import init_tracer
 from tests.utils import assert_dict_issuperset
@@ -253,6 +255,49 @@ def test_v2XX_middleware(client, test_spans):
     assert first_middleware.parent_id == root_span.span_id
 
 
+@pytest.mark.skipif(django.VERSION < (2, 0, 0), reason="")
+def test_middleware_tracing_mode_aggregate(client, test_spans):
+    """
+    When making a request to a Django app
+        When the middleware tracing mode is aggregate
+            We create a single `django.middleware` span with the duration of each middleware hook
+    """
+    with override_config("django", dict(middleware_tracing_mode="aggregate")):
+        resp = client.get("/")
+    assert resp.status_code == 200
+    assert resp.content == b"Hello, test app."
+
+    test_spans.assert_span_count(3)
+    root_span = test_spans.get_root_span()
+    middleware_span = test_spans.find_span(name="django.middleware")
+    assert middleware_span.parent_id == root_span.span_id
+    assert middleware_span.resource == "django.middleware"
+
+    durations = {k: v for k, v in middleware_span.metrics.items() if k.endswith(".duration")}
+    assert len(durations) == 24
+    assert durations["django.middleware.csrf.CsrfViewMiddleware.process_view.duration"] > 0
+    assert durations["tests.contrib.django.middleware.EverythingMiddleware.duration"] > 0
+
+
+@pytest.mark.skipif(django.VERSION < (2, 0, 0), reason="")
+def test_middleware_tracing_mode_sampled(client, tracer, test_spans):
+    """
+    When making a request to a Django app
+        When the middleware tracing mode is sampled
+            We only create the `django.middleware` spans for sampled traces
+    """
+    with override_config("django", dict(middleware_tracing_mode="sampled")):
+        with mock.patch.object(tracer, "sampler", DatadogSampler(default_sample_rate=0.0)):
+            assert client.get("/").status_code == 200
+        test_spans.assert_span_count(2)
+        assert len(list(test_spans.filter_spans(name="django.middleware"))) == 0
+        test_spans.reset()
+
+        assert client.get("/").status_code == 200
+        test_spans.assert_span_count(26)
+        assert len(list(test_spans.filter_spans(name="django.middleware"))) == 24
+
+
 def test_django_request_not_found(client, test_spans):
     """
     When making a request to a Django app
@@ -448,6 +493,49 @@ def test_lambda_based_view(client, test_spans):
         assert span.resource == "GET tests.contrib.django.views.<lambda>"
 
 
+@pytest.mark.skipif(django.VERSION < (2, 2, 0), reason="")
+def test_resource_name_cache(client, test_spans):
+    """
+    When making requests to a Django app
+        The handler names and routes of the views are cached
+    """
+    with mock.patch(
+        "ddtrace.contrib.django.utils._resolve_resource_names", wraps=django_utils._resolve_resource_names
+    ) as resolve:
+        # Top level URL patterns are cached when they are created
+        assert client.get("/fn-view/").status_code == 200
+        assert resolve.call_count == 0
+
+        # Nested URL patterns are cached on their first request
+        assert client.get("/include/test/").status_code == 200
+        assert client.get("/include/test/").status_code == 200
+        assert resolve.call_count == 1
+
+        with override_config("django", dict(resource_name_cache=False)):
+            assert client.get("/fn-view/").status_code == 200
+        assert resolve.call_count == 2
+
+    resources = [s.resource for s in test_spans.filter_spans(name="django.request")]
+    assert resources == ["GET ^fn-view/$", "GET include/test/", "GET include/test/", "GET ^fn-view/$"]
+
+
+@pytest.mark.skipif(django.VERSION < (2, 2, 0), reason="")
+def test_resource_name_cache_max_size(client, test_spans):
+    """
+    When the resource names of more routes than the max size of the cache are resolved
+        The routes above the max size are not cached
+    """
+    with mock.patch.object(django_utils, "_RESOURCE_NAMES", {}), mock.patch.object(
+        django_utils, "_RESOURCE_NAMES_MAX_SIZE", 1
+    ):
+        assert client.get("/fn-view/").status_code == 200
+        assert client.get("/include/test/").status_code == 200
+        assert len(django_utils._RESOURCE_NAMES) == 1
+
+    resources = [s.resource for s in test_spans.filter_spans(name="django.request")]
+    assert resources == ["GET ^fn-view/$", "GET include/test/"]
+
+
 def test_template_view(client, test_spans):
     resp = client.get("/template-view/")
     assert resp.status_code == 200
@@ -0,0 +1,96 @@
+import concurrent.futures
+import threading
+import time
+
+import mock
+
+from ddtrace.contrib.futures import patch
+from ddtrace.contrib.futures import threading as futures_threading
+from ddtrace.contrib.futures import unpatch
+from ddtrace.internal.runtime.constants import FUTURES_EXECUTION_TIME
+from ddtrace.internal.runtime.constants import FUTURES_QUEUE_SIZE
+from ddtrace.internal.runtime.constants import FUTURES_QUEUE_WAIT
+from ddtrace.internal.runtime.constants import FUTURES_SATURATION
+from ddtrace.internal.runtime.runtime_metrics import RuntimeWorker
+from tests.utils import TracerTestCase
+
+
+class FuturesMetricsTestCase(TracerTestCase):
+    def setUp(self):
+        super(FuturesMetricsTestCase, self).setUp()
+        patch()
+        futures_threading.collect()
+
+    def tearDown(self):
+        unpatch()
+        super(FuturesMetricsTestCase, self).tearDown()
+
+    def _samples(self):
+        samples = {}
+        for key, value in futures_threading.collect():
+            samples.setdefault(key, []).append(value)
+        return samples
+
+    def test_queue_metrics(self):
+        started = threading.Event()
+        event = threading.Event()
+
+        def block():
+            started.set()
+            event.wait()
+
+        with mock.patch.object(RuntimeWorker, "enabled", True):
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                blocking = executor.submit(block)
+                started.wait()
+                queued = [executor.submit(lambda: 42) for _ in range(3)]
+                event.set()
+                assert [f.result() for f in queued] == [42, 42, 42]
+                blocking.result()
+
+        samples = self._samples()
+        assert len(samples[FUTURES_QUEUE_WAIT]) == 4
+        assert len(samples[FUTURES_EXECUTION_TIME]) == 4
+        assert all(value >= 0 for value in samples[FUTURES_QUEUE_WAIT] + samples[FUTURES_EXECUTION_TIME])
+        # The tasks pile up behind the blocked worker
+        assert samples[FUTURES_QUEUE_SIZE][-1] == 3
+        assert samples[FUTURES_SATURATION][-1] == 3.0
+
+    def test_no_metrics_without_runtime_metrics(self):
+        with mock.patch.object(RuntimeWorker, "enabled", False):
+            with self.override_global_tracer():
+                with self.tracer.trace("main.thread") as span:
+                    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                        assert executor.submit(lambda: time.sleep(0.01) or 42).result() == 42
+
+        assert futures_threading.collect() == []
+        assert span.get_metric("futures.wait") is None
+
+    def test_metrics_disabled(self):
+        with self.override_config("futures", dict(metrics_enabled=False)):
+            with mock.patch.object(RuntimeWorker, "enabled", True):
+                with self.override_global_tracer():
+                    with self.tracer.trace("main.thread") as span:
+                        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                            assert executor.submit(lambda: 42).result() == 42
+
+        assert futures_threading.collect() == []
+        assert span.get_metric("futures.wait") is None
+
+    def test_futures_wait(self):
+        event = threading.Event()
+
+        def fn():
+            event.wait()
+            return 42
+
+        with mock.patch.object(RuntimeWorker, "enabled", True), self.override_global_tracer():
+            with self.tracer.trace("main.thread") as span:
+                with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                    future = executor.submit(fn)
+                    threading.Timer(0.05, event.set).start()
+                    assert future.result() == 42
+                    # The result is already available
+                    assert future.result() == 42
+
+        assert span.get_metric("futures.wait") >= 0.04e9
@@ -1,4 +1,7 @@
+import json
 import logging
+import logging.config
+import logging.handlers
 
 import pytest
 import six
@@ -6,6 +9,7 @@ import six
 import ddtrace
 from ddtrace.constants import ENV_KEY
 from ddtrace.constants import VERSION_KEY
+from ddtrace.contrib.logging import JSONFormatter
 from ddtrace.contrib.logging import patch
 from ddtrace.contrib.logging import unpatch
 from ddtrace.contrib.logging.patch import RECORD_ATTR_SPAN_ID
@@ -18,6 +22,9 @@ from tests.utils import TracerTestCase
 logger = logging.getLogger()
 logger.level = logging.INFO
 
+lazy_logger = logging.getLogger("tests.contrib.logging.lazy")
+lazy_logger.level = logging.INFO
+
 DEFAULT_FORMAT = (
     "%(message)s - dd.service=%(dd.service)s dd.version=%(dd.version)s dd.env=%(dd.env)s"
     " dd.trace_id=%(dd.trace_id)s dd.span_id=%(dd.span_id)s"
@@ -253,3 +260,234 @@ class LoggingTestCase(TracerTestCase):
                 assert not hasattr(record, "dd")
                 assert getattr(record, RECORD_ATTR_TRACE_ID) == str(span.trace_id)
                 assert getattr(record, RECORD_ATTR_SPAN_ID) == str(span.span_id)
+
+
+class LazyLoggingTestCase(TracerTestCase):
+    def setUp(self):
+        with self.override_config("logging", dict(lazy=True)):
+            patch()
+        super(LazyLoggingTestCase, self).setUp()
+
+    def tearDown(self):
+        unpatch()
+        super(LazyLoggingTestCase, self).tearDown()
+
+    def _capture(self, func, formatter):
+        out = StringIO()
+        sh = logging.StreamHandler(out)
+        sh.setFormatter(formatter)
+        # Do not propagate the records to the handlers of the root logger, which may use any formatter
+        lazy_logger.propagate = False
+        lazy_logger.addHandler(sh)
+        try:
+            with self.override_config("logging", dict(tracer=self.tracer)):
+                result = func()
+        finally:
+            lazy_logger.removeHandler(sh)
+            lazy_logger.propagate = True
+        return out.getvalue().strip().splitlines(), result
+
+    def test_patch(self):
+        assert isinstance(logging.Handler.format, wrapt.ObjectProxy)
+        assert isinstance(logging.getLogger().makeRecord, wrapt.BoundFunctionWrapper)
+
+        unpatch()
+        assert not isinstance(logging.Handler.format, wrapt.ObjectProxy)
+        assert not isinstance(logging.getLogger().makeRecord, wrapt.BoundFunctionWrapper)
+
+    def test_log_trace(self):
+        def func():
+            with self.tracer.trace("test.logging") as span:
+                lazy_logger.info("Hello!")
+                lazy_logger.info("World!")
+            lazy_logger.info("No trace")
+            return span
+
+        with self.override_global_config(dict(service="my.service", version="my.version", env="my.env")):
+            lines, span = self._capture(func, logging.Formatter(DEFAULT_FORMAT))
+
+        fields = "dd.service=my.service dd.version=my.version dd.env=my.env dd.trace_id={} dd.span_id={}"
+        assert lines == [
+            "Hello! - " + fields.format(span.trace_id, span.span_id),
+            "World! - " + fields.format(span.trace_id, span.span_id),
+            "No trace - " + fields.format(0, 0),
+        ]
+
+    def test_no_correlation_fields(self):
+        records = []
+
+        class RecordingFilter(logging.Filter):
+            def filter(self, record):
+                records.append(record)
+                return True
+
+        def func():
+            with self.tracer.trace("test.logging"):
+                lazy_logger.info("Hello!")
+
+        record_filter = RecordingFilter()
+        lazy_logger.addFilter(record_filter)
+        try:
+            # The format does not reference the correlation fields: they are not computed
+            lines, _ = self._capture(func, logging.Formatter("%(message)s"))
+        finally:
+            lazy_logger.removeFilter(record_filter)
+
+        assert lines == ["Hello!"]
+        assert len(records) == 1
+        assert not hasattr(records[0], RECORD_ATTR_TRACE_ID)
+
+    def test_custom_formatter(self):
+        class DictFormatter(logging.Formatter):
+            def format(self, record):
+                return repr({k: v for k, v in record.__dict__.items() if k.startswith("dd.")})
+
+        def func():
+            with self.tracer.trace("test.logging") as span:
+                lazy_logger.info("Hello!")
+                return span
+
+        lines, span = self._capture(func, DictFormatter())
+        assert lines == [
+            repr(
+                {
+                    "dd.version": "",
+                    "dd.env": "",
+                    "dd.service": "",
+                    "dd.trace_id": str(span.trace_id),
+                    "dd.span_id": str(span.span_id),
+                }
+            )
+        ]
+
+    def test_format_in_another_span(self):
+        formatter = logging.Formatter(DEFAULT_FORMAT)
+        out = StringIO()
+        target = logging.StreamHandler(out)
+        target.setFormatter(formatter)
+        # The buffered records are formatted by the target when the buffer is flushed
+        memory_handler = logging.handlers.MemoryHandler(capacity=100, target=target)
+
+        lazy_logger.propagate = False
+        lazy_logger.addHandler(memory_handler)
+        try:
+            with self.override_config("logging", dict(tracer=self.tracer)):
+                with self.tracer.trace("span.a") as span_a:
+                    lazy_logger.info("Hello!")
+                with self.tracer.trace("span.b"):
+                    memory_handler.flush()
+        finally:
+            lazy_logger.removeHandler(memory_handler)
+            lazy_logger.propagate = True
+
+        fields = "dd.service= dd.version= dd.env= dd.trace_id={} dd.span_id={}"
+        assert out.getvalue().strip().splitlines() == ["Hello! - " + fields.format(span_a.trace_id, span_a.span_id)]
+
+
+class JSONFormatterTestCase(TracerTestCase):
+    def _format(self, func, formatter):
+        out = StringIO()
+        sh = logging.StreamHandler(out)
+        sh.setFormatter(formatter)
+        lazy_logger.propagate = False
+        lazy_logger.addHandler(sh)
+        try:
+            with self.override_config("logging", dict(tracer=self.tracer)):
+                result = func()
+        finally:
+            lazy_logger.removeHandler(sh)
+            lazy_logger.propagate = True
+        return [json.loads(line) for line in out.getvalue().splitlines()], result
+
+    def _test_json_formatter(self):
+        def func():
+            with self.tracer.trace("test.logging") as span:
+                lazy_logger.info("Hello %s!", "World", extra=dict(user="me"))
+                try:
+                    1 / 0
+                except ZeroDivisionError:
+                    lazy_logger.exception("Failed")
+            lazy_logger.info("No trace")
+            return span
+
+        with self.override_global_config(dict(service="my.service", version="my.version", env="my.env")):
+            records, span = self._format(func, JSONFormatter(extra_attrs=("user",)))
+
+        assert len(records) == 3
+        assert all(isinstance(r.pop("timestamp"), int) for r in records)
+        correlation = {"dd.service": "my.service", "dd.version": "my.version", "dd.env": "my.env"}
+        assert records[0] == dict(
+            correlation,
+            level="INFO",
+            logger="tests.contrib.logging.lazy",
+            message="Hello World!",
+            user="me",
+            **{"dd.trace_id": str(span.trace_id), "dd.span_id": str(span.span_id)}
+        )
+        assert records[1]["message"] == "Failed"
+        assert records[1]["error.kind"] == "ZeroDivisionError"
+        assert records[1]["error.message"] == str(ZeroDivisionError("division by zero"))
+        assert records[1]["error.stack"].startswith("Traceback")
+        assert records[1]["dd.span_id"] == str(span.span_id)
+        assert records[2] == dict(
+            correlation,
+            level="INFO",
+            logger="tests.contrib.logging.lazy",
+            message="No trace",
+            **{"dd.trace_id": "0", "dd.span_id": "0"}
+        )
+
+    def test_json_formatter(self):
+        patch()
+        try:
+            self._test_json_formatter()
+        finally:
+            unpatch()
+
+    def test_json_formatter_lazy(self):
+        with self.override_config("logging", dict(lazy=True)):
+            patch()
+        try:
+            self._test_json_formatter()
+        finally:
+            unpatch()
+
+    def test_json_formatter_unpatched(self):
+        self._test_json_formatter()
+
+    def test_json_formatter_unserializable_attr(self):
+        def func():
+            lazy_logger.info("Hello!", extra=dict(obj=object))
+
+        records, _ = self._format(func, JSONFormatter(extra_attrs=("obj",)))
+        assert records[0]["obj"] == repr(object)
+
+    def test_json_formatter_dict_config(self):
+        logging.config.dictConfig(
+            {
+                "version": 1,
+                "disable_existing_loggers": False,
+                "formatters": {
+                    "json": {"class": "ddtrace.contrib.logging.JSONFormatter", "datefmt": "%Y"},
+                    "json_extra": {"()": "ddtrace.contrib.logging.JSONFormatter", "extra_attrs": ["user"]},
+                },
+                "handlers": {
+                    "json": {"class": "logging.NullHandler", "formatter": "json"},
+                    "json_extra": {"class": "logging.NullHandler", "formatter": "json_extra"},
+                },
+                "loggers": {"tests.contrib.logging.dict_config": {"handlers": ["json", "json_extra"]}},
+            }
+        )
+        handlers = logging.getLogger("tests.contrib.logging.dict_config").handlers
+        try:
+            formatter, formatter_extra = [h.formatter for h in handlers]
+            assert isinstance(formatter, JSONFormatter)
+            assert formatter.datefmt == "%Y"
+            assert isinstance(formatter_extra, JSONFormatter)
+            assert formatter_extra.extra_attrs == ("user",)
+
+            record = logging.makeLogRecord(dict(msg="Hello!", user="me"))
+            assert json.loads(formatter_extra.format(record))["user"] == "me"
+        finally:
+            for h in handlers:
+                logging.getLogger("tests.contrib.logging.dict_config").removeHandler(h)
@@ -1,3 +1,5 @@
+import inspect
+
 import pytest
 import six
 from webtest import TestApp
@@ -220,3 +222,180 @@ def test_500():
     app = TestApp(wsgi.DDWSGIMiddleware(application))
     with pytest.raises(Exception):
         app.get("/error")
+
+
+def test_lazy_middleware(tracer, test_spans):
+    with override_config("wsgi", dict(lazy=True)), override_http_config(
+        "wsgi", dict(_whitelist_headers=set(["my-header"]))
+    ):
+        app = TestApp(wsgi.DDWSGIMiddleware(application, tracer=tracer))
+        resp = app.get("/chunked?foo=bar", headers={"my-header": "test_value"})
+    assert resp.status_int == 200
+    assert resp.text.endswith("999")
+    assert tracer.current_span() is None
+
+    spans = test_spans.pop()
+    # The generator of the response only starts the response once iterated over
+    assert [s.name for s in spans] == ["wsgi.request", "wsgi.application", "wsgi.response", "wsgi.start_response"]
+    request_span = spans[0]
+    for span in spans[1:]:
+        assert span.parent_id == request_span.span_id
+        assert span.finished
+    assert request_span.resource == "GET /chunked"
+    assert request_span.get_tag("http.status_code") == "200"
+    assert request_span.get_tag("http.url") == "http://localhost:80/chunked"
+    assert request_span.get_tag("http.method") == "GET"
+    assert request_span.get_tag("http.request.headers.my-header") == "test_value"
+    assert spans[2].get_tag("result_class") == "generator"
+
+
+def test_lazy_middleware_error(tracer, test_spans):
+    with override_config("wsgi", dict(lazy=True)):
+        app = TestApp(wsgi.DDWSGIMiddleware(application, tracer=tracer))
+        with pytest.raises(Exception):
+            app.get("/error")
+    assert tracer.current_span() is None
+
+    spans = test_spans.pop()
+    assert [s.name for s in spans] == ["wsgi.request", "wsgi.application"]
+    assert spans[0].error == 1
+    assert spans[0].resource == "GET /error"
+    assert spans[1].error == 1
+
+
+def test_lazy_middleware_not_sampled(tracer, test_spans):
+    def rejecting_application(environ, start_response):
+        tracer.current_root_span().context.sampling_priority = 0
+        return application(environ, start_response)
+
+    with override_config("wsgi", dict(lazy=True)), override_http_config(
+        "wsgi", dict(_whitelist_headers=set(["my-header"]))
+    ):
+        app = TestApp(wsgi.DDWSGIMiddleware(rejecting_application, tracer=tracer))
+        resp = app.get("/", headers={"my-header": "test_value"})
+    assert resp.status_int == 200
+
+    request_span = test_spans.pop()[0]
+    assert request_span.resource == "GET /"
+    assert request_span.get_tag("http.status_code") == "200"
+    assert request_span.get_tag("http.url") is None
+    assert request_span.get_tag("http.request.headers.my-header") is None
+
+
+def test_lazy_middleware_file_wrapper(tracer, test_spans):
+    class FileWrapper(object):
+        def __init__(self, filelike, block_size=8192):
+            self.filelike = filelike
+            self.closed = False
+
+        def __iter__(self):
+            return iter([self.filelike])
+
+        def close(self):
+            self.closed = True
+
+    def file_application(environ, start_response):
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return environ["wsgi.file_wrapper"](b"content")
+
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": "/file",
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "80",
+        "wsgi.url_scheme": "http",
+        "wsgi.file_wrapper": FileWrapper,
+    }
+    with override_config("wsgi", dict(lazy=True)):
+        app = wsgi.DDWSGIMiddleware(file_application, tracer=tracer)
+        result = app(environ, lambda status, headers, exc_info=None: None)
+
+    # The server gets the file wrapper
+    assert isinstance(result, FileWrapper)
+    assert list(result) == [b"content"]
+    assert test_spans.pop() == []
+    result.close()
+    assert result.closed
+
+    spans = test_spans.pop()
+    assert [s.name for s in spans] == ["wsgi.request", "wsgi.application", "wsgi.start_response", "wsgi.response"]
+    assert spans[0].resource == "GET /file"
+    assert spans[3].get_tag("result_class") == "FileWrapper"
+
+
+def test_lazy_middleware_iteration(tracer, test_spans):
+    def streaming_application(environ, start_response):
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        for i in range(3):
+            yield b"%d" % i
+        raise ValueError("stream error")
+
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": "/stream",
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "80",
+        "wsgi.url_scheme": "http",
+    }
+    with override_config("wsgi", dict(lazy=True)):
+        app = wsgi.DDWSGIMiddleware(streaming_application, tracer=tracer)
+        result = app(environ, lambda status, headers, exc_info=None: None)
+
+    # The server iterates directly over the response of the application
+    iterator = iter(result)
+    assert inspect.isgenerator(iterator)
+    assert [next(iterator) for _ in range(3)] == [b"0", b"1", b"2"]
+    with pytest.raises(ValueError):
+        next(iterator)
+    assert tracer.current_span() is None
+    assert test_spans.pop() == []
+
+    # The spans are finished when the server closes the response
+    result.close()
+    spans = test_spans.pop()
+    # The generator of the application calls start_response when it is first iterated over
+    assert [s.name for s in spans] == ["wsgi.request", "wsgi.application", "wsgi.response", "wsgi.start_response"]
+    assert all(s.finished for s in spans)
+
+
+def test_lazy_middleware_file_wrapper_function(tracer, test_spans):
+    class File(object):
+        def __init__(self, content):
+            self.content = content
+            self.closed = False
+
+        def __iter__(self):
+            return iter([self.content])
+
+        def close(self):
+            self.closed = True
+
+    def file_wrapper(filelike, block_size=8192):
+        # Like uWSGI, the file wrapper is a function
+        return File(filelike)
+
+    def file_application(environ, start_response):
+        start_response("200 OK", [("Content-Type", "text/plain")])
+        return environ["wsgi.file_wrapper"](b"content")
+
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": "/file",
+        "SERVER_NAME": "localhost",
+        "SERVER_PORT": "80",
+        "wsgi.url_scheme": "http",
+        "wsgi.file_wrapper": file_wrapper,
+    }
+    with override_config("wsgi", dict(lazy=True)):
+        app = wsgi.DDWSGIMiddleware(file_application, tracer=tracer)
+        result = app(environ, lambda status, headers, exc_info=None: None)
+
+    # The server gets the object returned by its file wrapper
+    assert isinstance(result, File)
+    assert environ["wsgi.file_wrapper"] is file_wrapper
+    assert list(result) == [b"content"]
+    result.close()
+    assert result.closed
+
+    spans = test_spans.pop()
+    assert [s.name for s in spans] == ["wsgi.request", "wsgi.application", "wsgi.start_response", "wsgi.response"]
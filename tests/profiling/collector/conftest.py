@@ -1,9 +1,14 @@
 import pytest
+import six
 
 import ddtrace
 from ddtrace.profiling import Profiler
 
 
+if six.PY2:
+    collect_ignore = ["test_asyncio.py"]
+
+
 @pytest.fixture
 def tracer(monkeypatch):
     monkeypatch.setenv("DD_TRACE_STARTUP_LOGS", "0")
@@ -0,0 +1,101 @@
+import asyncio
+import sys
+import weakref
+
+import mock
+import pytest
+
+from ddtrace.profiling import recorder
+from ddtrace.profiling.collector import asyncio as collector_asyncio
+from ddtrace.profiling.collector import stack
+
+
+pytestmark = pytest.mark.skipif(sys.version_info < (3, 7), reason="asyncio task introspection requires Python ≥ 3.7")
+
+
+async def _wait_for(event):
+    await event.wait()
+
+
+async def _waiter(event):
+    await _wait_for(event)
+
+
+def test_coroutine_to_frames():
+    async def _test():
+        event = asyncio.Event()
+        task = asyncio.ensure_future(_waiter(event))
+        await asyncio.sleep(0)
+        frames, nframes = collector_asyncio._coroutine_to_frames(task._coro, 64)
+        assert nframes >= 2
+        assert [frame[2] for frame in frames[-2:]] == ["_wait_for", "_waiter"]
+        assert all(frame[0] == __file__ for frame in frames[-2:])
+        frames, nframes = collector_asyncio._coroutine_to_frames(task._coro, 1)
+        assert len(frames) == 1
+        assert nframes >= 2
+        event.set()
+        await task
+
+    asyncio.get_event_loop().run_until_complete(_test())
+
+
+def test_get_all_tasks_empty():
+    with mock.patch.object(asyncio.tasks, "_all_tasks", weakref.WeakSet(), create=True):
+        assert collector_asyncio._get_all_tasks() == []
+
+
+def test_collect_suspended_tasks():
+    r = recorder.Recorder()
+    c = collector_asyncio.AsyncioCollector(r)
+
+    async def _test():
+        event = asyncio.Event()
+        task = asyncio.ensure_future(_waiter(event))
+        await asyncio.sleep(0)
+        with c:
+            (events,) = c.collect()
+        event.set()
+        await task
+        return task, events
+
+    task, events = asyncio.get_event_loop().run_until_complete(_test())
+
+    task_events = [e for e in events if e.task_id == id(task)]
+    assert len(task_events) == 1
+    event = task_events[0]
+    assert isinstance(event, stack.StackSampleEvent)
+    assert event.frames[-1][2] == "_waiter"
+    assert event.wall_time_ns > 0
+    assert event.cpu_time_ns == 0
+    assert event.thread_name == "MainThread"
+    if sys.version_info >= (3, 8):
+        assert event.task_name == task.get_name()
+    # The running task is sampled by the stack collector and must not be reported
+    assert not [e for e in events if e.frames[-1][2] == "_test"]
+
+
+def test_collect_task_span(tracer):
+    r = recorder.Recorder()
+    c = collector_asyncio.AsyncioCollector(r)
+
+    async def _traced(event):
+        with tracer.trace("foobar", resource="resource", span_type="web") as span:
+            await _wait_for(event)
+        return span
+
+    async def _test():
+        event = asyncio.Event()
+        # The context of the C Task implementation is only reachable with Python ≥ 3.12
+        task = asyncio.tasks._PyTask(_traced(event))
+        await asyncio.sleep(0)
+        with c:
+            (events,) = c.collect()
+        event.set()
+        return await task, [e for e in events if e.task_id == id(task)]
+
+    span, events = asyncio.get_event_loop().run_until_complete(_test())
+    assert len(events) == 1
+    assert events[0].trace_id == span.trace_id
+    assert events[0].span_id == span.span_id
+    assert events[0].trace_resource == "resource"
+    assert events[0].trace_type == "web"
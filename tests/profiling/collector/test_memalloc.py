@@ -178,10 +178,12 @@ def test_memory_collector():
 )
 def test_memory_collector_ignore_profiler(ignore_profiler):
     r = recorder.Recorder()
-    mc = memalloc.MemoryCollector(r, ignore_profiler=ignore_profiler)
+    mc = memalloc.MemoryCollector(r, ignore_profiler=ignore_profiler, interval=0.01)
     with mc:
         thread_id = mc._worker.ident
         object()
+        # The collector runs in the thread shared by the periodic services: let it allocate
+        nogevent.sleep(0.1)
         # Make sure we collect at least once
         mc.periodic()
 
@@ -286,7 +288,7 @@ def test_heap_collector():
         keep_me = _allocate_1k()
         events = mc.snapshot()
 
-    assert len(events) == 1
+    assert len(events) == 2
     assert len(events[0]) >= 1
 
     del keep_me
@@ -301,6 +303,72 @@ def test_heap_collector():
         assert isinstance(event.thread_name, str)
 
 
+def test_heap_collector_diff():
+    r = recorder.Recorder()
+    mc = memalloc.MemoryCollector(r, heap_sample_size=1024, heap_diff=True)
+    with mc:
+        keep_me = _allocate_1k()
+        first, _ = mc.snapshot()
+        second, _ = mc.snapshot()
+        keep_me_too = _pre_allocate_1k()
+        third, _ = mc.snapshot()
+
+    del keep_me, keep_me_too
+
+    assert len(first) >= 1
+    for event in first:
+        assert isinstance(event, memalloc.MemoryHeapGrowthEvent)
+        assert event.growth == event.size > 0
+        assert event.sample_size == 1024
+
+    first_allocate_frames = next(
+        event.frames[:3]
+        for event in first
+        if event.frames[1][2] == "_allocate_1k" and event.frames[2][2] == "test_heap_collector_diff"
+    )
+
+    # The allocations that were already reported did not grow
+    for event in second:
+        assert event.growth > 0
+        assert event.frames[:3] != first_allocate_frames
+
+    for event in third:
+        assert event.growth > 0
+        assert event.size >= event.growth
+        if len(event.frames) > 2 and event.frames[2][2] == "_pre_allocate_1k":
+            break
+    else:
+        pytest.fail("No heap growth reported for _pre_allocate_1k")
+
+
+def test_heap_size_classes():
+    _memalloc.start(32, 10, 1024)
+    _memalloc.heap_size_classes()
+    x = [bytearray(5000) for _ in range(100)]
+    size_classes = _memalloc.heap_size_classes()
+    _memalloc.stop()
+
+    del x
+
+    bounds = [upper_bound for upper_bound, count, size in size_classes]
+    assert bounds == sorted(bounds, key=lambda b: float("inf") if b is None else b)
+    for upper_bound, count, size in size_classes:
+        assert count > 0
+        assert size > 0
+        if upper_bound is not None:
+            assert size <= count * upper_bound
+    # bytearray(5000) allocates a bit more than 5000 bytes
+    assert dict((b, c) for b, c, _ in size_classes).get(8192, 0) >= 100
+
+
+def test_heap_size_classes_disabled():
+    _memalloc.start(32, 10, 0)
+    try:
+        assert _memalloc.heap_size_classes() == []
+    finally:
+        _memalloc.stop()
+
+
 def test_heap_stress():
     # This should run for a few seconds, and is enough to spot potential segfaults.
     _memalloc.start(64, 64, 1024)
@@ -1,3 +1,4 @@
+import sys
 import threading
 import uuid
 
@@ -5,6 +6,7 @@ import pytest
 from six.moves import _thread
 
 from ddtrace.profiling import recorder
+from ddtrace.profiling.collector import _threading
 from ddtrace.profiling.collector import threading as collector_threading
 
 from . import test_collector
@@ -14,7 +16,8 @@ def test_repr():
     test_collector._test_repr(
         collector_threading.LockCollector,
         "LockCollector(status=<ServiceStatus.STOPPED: 'stopped'>, "
-        "recorder=Recorder(default_max_events=32768, max_events={}), capture_pct=2.0, nframes=64, tracer=None)",
+        "recorder=Recorder(default_max_events=32768, max_events={}), capture_pct=2.0, nframes=64, tracer=None, "
+        "contended_only=False, contention_threshold_ns=0)",
     )
 
 
@@ -61,13 +64,13 @@ def test_lock_acquire_events():
     assert len(r.events[collector_threading.LockAcquireEvent]) == 1
     assert len(r.events[collector_threading.LockReleaseEvent]) == 0
     event = r.events[collector_threading.LockAcquireEvent][0]
-    assert event.lock_name == "test_threading.py:59"
+    assert event.lock_name == "test_threading.py:61"
     assert event.thread_id == _thread.get_ident()
     assert event.wait_time_ns > 0
     # It's called through pytest so I'm sure it's gonna be that long, right?
     assert len(event.frames) > 3
     assert event.nframes > 3
-    assert event.frames[0] == (__file__, 60, "test_lock_acquire_events")
+    assert event.frames[0] == (__file__, 62, "test_lock_acquire_events")
     assert event.sampling_pct == 100
 
 
@@ -88,14 +91,14 @@ def test_lock_events_tracer(tracer):
     events = r.reset()
     # The tracer might use locks, so we need to look into every event to assert we got ours
     for event_type in (collector_threading.LockAcquireEvent, collector_threading.LockReleaseEvent):
-        assert {"test_threading.py:79", "test_threading.py:82"}.issubset({e.lock_name for e in events[event_type]})
+        assert {"test_threading.py:81", "test_threading.py:84"}.issubset({e.lock_name for e in events[event_type]})
         for event in events[event_type]:
-            if event.name == "test_threading.py:79":
+            if event.name == "test_threading.py:81":
                 assert event.trace_id is None
                 assert event.span_id is None
                 assert event.trace_resource is None
                 assert event.trace_type is None
-            elif event.name == "test_threading.py:82":
+            elif event.name == "test_threading.py:84":
                 assert event.trace_id == trace_id
                 assert event.span_id == span_id
                 assert event.trace_resource == t.resource
@@ -111,16 +114,106 @@ def test_lock_release_events():
     assert len(r.events[collector_threading.LockAcquireEvent]) == 1
     assert len(r.events[collector_threading.LockReleaseEvent]) == 1
     event = r.events[collector_threading.LockReleaseEvent][0]
-    assert event.lock_name == "test_threading.py:108"
+    assert event.lock_name == "test_threading.py:110"
     assert event.thread_id == _thread.get_ident()
     assert event.locked_for_ns >= 0.1
     # It's called through pytest so I'm sure it's gonna be that long, right?
     assert len(event.frames) > 3
     assert event.nframes > 3
-    assert event.frames[0] == (__file__, 110, "test_lock_release_events")
+    assert event.frames[0] == (__file__, 112, "test_lock_release_events")
     assert event.sampling_pct == 100
 
 
+def test_lock_contended_only_uncontended():
+    r = recorder.Recorder()
+    with collector_threading.LockCollector(r, capture_pct=100, contended_only=True):
+        lock = threading.Lock()
+        assert isinstance(lock, _threading.ContendedLock)
+        assert lock.acquire()
+        assert lock.locked()
+        lock.release()
+        with lock:
+            pass
+    assert not lock.locked()
+    assert len(r.events[collector_threading.LockAcquireEvent]) == 0
+    assert len(r.events[collector_threading.LockReleaseEvent]) == 0
+
+
+def test_lock_contended_only():
+    r = recorder.Recorder()
+    with collector_threading.LockCollector(r, capture_pct=100, contended_only=True):
+        lock = threading.Lock()
+        lock.acquire()
+        t = threading.Timer(0.1, lock.release)
+        t.start()
+        lock.acquire()  # !CONTENDED
+        lock.release()
+        t.join()
+    assert len(r.events[collector_threading.LockReleaseEvent]) == 0
+    [event] = [e for e in r.events[collector_threading.LockAcquireEvent] if e.lock_name == lock.name]
+    assert event.lock_name.startswith("test_threading.py:")
+    assert event.wait_time_ns >= 50000000
+    assert event.frames[0][0] == __file__
+    assert event.frames[0][2] == "test_lock_contended_only"
+    assert event.sampling_pct == 100
+
+
+def test_lock_contended_only_threshold():
+    r = recorder.Recorder()
+    with collector_threading.LockCollector(
+        r, capture_pct=100, contended_only=True, contention_threshold_ns=60 * 1000000000
+    ):
+        lock = threading.Lock()
+        lock.acquire()
+        t = threading.Timer(0.05, lock.release)
+        t.start()
+        lock.acquire()
+        lock.release()
+        t.join()
+    assert not [e for e in r.events[collector_threading.LockAcquireEvent] if e.lock_name == lock.name]
+
+
+def test_lock_contended_only_non_blocking():
+    r = recorder.Recorder()
+    with collector_threading.LockCollector(r, capture_pct=100, contended_only=True):
+        lock = threading.Lock()
+        assert lock.acquire(False)
+        assert not lock.acquire(False)
+        if sys.version_info[0] >= 3:
+            assert not lock.acquire(blocking=False)
+            assert not lock.acquire(True, 0)
+            assert not lock.acquire(timeout=0)
+        lock.release()
+    assert not [e for e in r.events[collector_threading.LockAcquireEvent] if e.lock_name == lock.name]
+
+
+def _allocate_lock():
+    return threading.Lock()
+
+
+def test_lock_identity():
+    r = recorder.Recorder()
+    with collector_threading.LockCollector(r, capture_pct=100, contended_only=True):
+        lock1 = _allocate_lock()
+        lock2 = _allocate_lock()
+        lock3 = threading.Lock()
+    assert lock1.name is lock2.name
+    assert lock1.name != lock3.name
+
+
+def test_lock_identity_table():
+    class Frame(object):
+        def __init__(self, filename, lineno):
+            self.f_code = type("Code", (object,), {"co_filename": filename})
+            self.f_lineno = lineno
+
+    table = collector_threading._LockIdentityTable()
+    assert table.get_name(Frame("/a/foo.py", 1)) == "foo.py:1"
+    assert table.get_name(Frame("/a/foo.py", 2)) == "foo.py:2"
+    assert table.get_name(Frame("/b/foo.py", 1)) == "/b/foo.py:1"
+    assert table.get_name(Frame("/a/foo.py", 1)) == "foo.py:1"
+
+
 @pytest.mark.benchmark(
     group="threading-lock-create",
 )
@@ -155,6 +248,15 @@ def test_lock_acquire_release_speed_patched(benchmark, pct):
         benchmark(_lock_acquire_release, threading.Lock())
 
 
+@pytest.mark.benchmark(
+    group="threading-lock-acquire-release",
+)
+def test_lock_acquire_release_speed_contended_only(benchmark):
+    r = recorder.Recorder()
+    with collector_threading.LockCollector(r, contended_only=True):
+        benchmark(_lock_acquire_release, threading.Lock())
+
+
 @pytest.mark.benchmark(
     group="threading-lock-acquire-release",
 )
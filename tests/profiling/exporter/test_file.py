@@ -1,4 +1,6 @@
 import os
+import subprocess
+import sys
 
 from ddtrace.profiling.exporter import file
 
@@ -11,3 +13,99 @@ def test_export(tmp_path):
     exp = file.PprofFileExporter(filename)
     exp.export(test_pprof.TEST_EVENTS, 0, 1)
     utils.check_pprof_file(filename + "." + str(os.getpid()) + ".1")
+
+
+def test_export_segments(tmp_path):
+    directory = str(tmp_path)
+    exp = file.PprofSegmentFileExporter(directory)
+    exp.export(test_pprof.TEST_EVENTS, 0, 10)
+    exp.export(test_pprof.TEST_EVENTS, 10, 20)
+    exp.export(test_pprof.TEST_EVENTS, 20, 30)
+    assert sorted(os.listdir(directory)) == [
+        "profile.%d.000001.idx" % os.getpid(),
+        "profile.%d.000001.seg" % os.getpid(),
+    ]
+
+    profiles = file.read_profiles(directory)
+    assert [p.time_nanos for p in profiles] == [0, 10, 20]
+    assert [p.time_nanos for p in file.read_profiles(directory, 11, 19)] == [10]
+    assert [p.time_nanos for p in file.read_profiles(directory, 15, 25)] == [10, 20]
+    assert file.read_profiles(directory, 31) == []
+
+
+def test_export_segments_new_directory(tmp_path):
+    directory = str(tmp_path / "profiles" / "app")
+    exp = file.PprofSegmentFileExporter(directory)
+    exp.export(test_pprof.TEST_EVENTS, 0, 10)
+    assert [p.time_nanos for p in file.read_profiles(directory)] == [0]
+
+
+def test_export_segments_rotation(tmp_path):
+    directory = str(tmp_path)
+    exp = file.PprofSegmentFileExporter(directory, max_segment_size=1, max_segments=2)
+    for i in range(4):
+        exp.export(test_pprof.TEST_EVENTS, i * 10, (i + 1) * 10)
+        # Make sure mtimes are ordered
+        os.utime(os.path.join(directory, "profile.%d.%06d.seg" % (os.getpid(), i + 1)), (i, i))
+    assert len(os.listdir(directory)) == 4
+    assert [p.time_nanos for p in file.read_profiles(directory)] == [20, 30]
+
+
+def test_export_segments_rotation_live_process(tmp_path):
+    directory = str(tmp_path)
+    dead = subprocess.Popen([sys.executable, "-c", "pass"])
+    dead.wait()
+    for pid in (os.getppid(), dead.pid):
+        for suffix in (".seg", ".idx"):
+            path = os.path.join(directory, "profile.%d.000001%s" % (pid, suffix))
+            open(path, "wb").close()
+            os.utime(path, (0, 0))
+
+    exp = file.PprofSegmentFileExporter(directory, max_segments=1)
+    exp.export(test_pprof.TEST_EVENTS, 0, 10)
+    # The segment of the dead process is removed, the current segments of the live processes are kept
+    assert sorted(os.listdir(directory)) == sorted(
+        "profile.%d.000001%s" % (pid, suffix) for pid in (os.getpid(), os.getppid()) for suffix in (".idx", ".seg")
+    )
+
+    # The current segment has been removed by another process
+    os.unlink(os.path.join(directory, "profile.%d.000001.seg" % os.getpid()))
+    exp.export(test_pprof.TEST_EVENTS, 10, 20)
+    assert [p.time_nanos for p in file.read_profiles(directory)] == [10]
+
+
+def test_merge_profiles(tmp_path):
+    directory = str(tmp_path)
+    exp = file.PprofSegmentFileExporter(directory)
+    exp.export(test_pprof.TEST_EVENTS, 0, 10)
+    exp.export(test_pprof.TEST_EVENTS, 10, 20)
+    single = file.read_profiles(directory)[0]
+    merged = file.merge_profiles(file.read_profiles(directory))
+
+    assert merged.time_nanos == 0
+    assert merged.duration_nanos == 20
+    assert [merged.string_table[st.type] for st in merged.sample_type] == [
+        single.string_table[st.type] for st in single.sample_type
+    ]
+    assert len(merged.sample) == len(single.sample)
+    assert len(merged.location) == len(single.location)
+    assert len(merged.function) == len(single.function)
+
+    def totals(profile):
+        return [sum(sample.value[i] for sample in profile.sample) for i in range(len(profile.sample_type))]
+
+    assert totals(merged) == [2 * v for v in totals(single)]
+
+    def stacks(profile):
+        functions = {f.id: profile.string_table[f.name] for f in profile.function}
+        locations = {loc.id: tuple(functions[line.function_id] for line in loc.line) for loc in profile.location}
+        return sorted(tuple(locations[loc_id] for loc_id in sample.location_id) for sample in profile.sample)
+
+    assert stacks(merged) == stacks(single)
+    # Re-serializing works
+    assert merged.SerializeToString()
+
+
+def test_merge_profiles_empty():
+    merged = file.merge_profiles([])
+    assert len(merged.sample) == 0
@@ -701,3 +701,33 @@ def test_pprof_exporter_empty():
     exp = pprof.PprofExporter()
     export = exp.export({}, 0, 1)
     assert len(export.sample) == 0
+
+
+def test_pprof_exporter_heap_growth_and_size_classes():
+    exp = pprof.PprofExporter()
+    export = exp.export(
+        {
+            memalloc.MemoryHeapGrowthEvent: [
+                memalloc.MemoryHeapGrowthEvent(
+                    thread_id=67892304,
+                    thread_native_id=123987,
+                    thread_name="MainThread",
+                    frames=[("foobar.py", 23, "func1")],
+                    nframes=1,
+                    size=4096,
+                    growth=1024,
+                    sample_size=512,
+                ),
+            ],
+            memalloc.MemorySizeClassEvent: [
+                memalloc.MemorySizeClassEvent(upper_bound=64, count=10, size=400),
+                memalloc.MemorySizeClassEvent(upper_bound=None, count=1, size=2 ** 40),
+            ],
+        },
+        0,
+        1,
+    )
+    sample_types = [export.string_table[st.type] for st in export.sample_type]
+    assert sample_types[-3:] == ["heap-growth", "size-class-samples", "size-class-space"]
+    values = sorted(list(sample.value[-4:]) for sample in export.sample)
+    assert values == [[0, 0, 1, 2 ** 40], [0, 0, 10, 400], [4096, 1024, 0, 0]]
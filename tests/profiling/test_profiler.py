@@ -9,6 +9,7 @@ from ddtrace.profiling import collector
 from ddtrace.profiling import event
 from ddtrace.profiling import exporter
 from ddtrace.profiling import profiler
+from ddtrace.profiling import recorder
 from ddtrace.profiling.collector import stack
 from ddtrace.profiling.exporter import http
 
@@ -312,3 +313,10 @@ def test_failed_start_collector(caplog, monkeypatch):
     assert caplog.record_tuples == [
         (("ddtrace.profiling.profiler", logging.ERROR, "Failed to start collector %r, disabling." % err_collector))
     ]
+
+
+def test_columnar_recorder(monkeypatch):
+    monkeypatch.setenv("DD_PROFILING_COLUMNAR_RECORDER", "true")
+    p = profiler._ProfilerInstance()
+    assert isinstance(p._recorder, recorder.ColumnarRecorder)
+    assert p._recorder.columns == (stack.StackSampleEvent,)
@@ -57,3 +57,123 @@ def test_limit():
 def test_fork():
     stdout, stderr, exitcode, pid = call_program("python", os.path.join(os.path.dirname(__file__), "recorder_fork.py"))
     assert exitcode == 0, (stdout, stderr)
+
+
+def test_intern_table():
+    t = recorder._InternTable()
+    assert t.get_id(("a", 1)) == 0
+    assert t.get_id(("b", 2)) == 1
+    assert t.get_id(("a", 1)) == 0
+    assert t.values == [("a", 1), ("b", 2)]
+
+
+def test_columnar_push_sample():
+    r = recorder.ColumnarRecorder(columns=(stack.StackSampleEvent,))
+    frames = (("foo.py", 1, "foo"), ("bar.py", 2, "bar"))
+    labels = ("MainThread", 123, None, None, 1, 2, "resource", "web", 10)
+    r.push_sample(stack.StackSampleEvent, 1000, 42, frames, 2, labels, (10, 20))
+    r.push_sample(stack.StackSampleEvent, 2000, 43, frames, 2, labels, (30, 40))
+    view = r.reset()[stack.StackSampleEvent]
+    assert isinstance(view, recorder.EventColumnsView)
+    assert len(view) == 2
+    assert list(view.timestamps) == [1000, 2000]
+    assert list(view.thread_ids) == [42, 43]
+    assert list(view.stack_ids) == [0, 0]
+    assert list(view.label_ids) == [0, 0]
+    assert list(view.values["wall_time_ns"]) == [10, 30]
+    assert list(view.values["cpu_time_ns"]) == [20, 40]
+    assert view.stacks == [(frames, 2)]
+    assert view.dropped == 0
+
+    e1, e2 = list(view)
+    assert e1 == stack.StackSampleEvent(
+        timestamp=1000,
+        thread_id=42,
+        thread_name="MainThread",
+        thread_native_id=123,
+        trace_id=1,
+        span_id=2,
+        trace_resource="resource",
+        trace_type="web",
+        sampling_period=10,
+        frames=list(frames),
+        nframes=2,
+        wall_time_ns=10,
+        cpu_time_ns=20,
+    )
+    assert e2.thread_id == 43
+    assert e2.wall_time_ns == 30
+
+    assert len(r.reset()[stack.StackSampleEvent]) == 0
+
+
+def test_columnar_ring_buffer():
+    r = recorder.ColumnarRecorder(columns=(stack.StackSampleEvent,), max_events={stack.StackSampleEvent: 3})
+    labels = (None,) * len(recorder.ColumnarRecorder.LABEL_FIELDS)
+    for i in range(5):
+        r.push_sample(stack.StackSampleEvent, i, 1, (), 0, labels, (i, 0))
+    view = r.reset()[stack.StackSampleEvent]
+    assert len(view) == 3
+    assert view.dropped == 2
+    assert sorted(view.timestamps) == [2, 3, 4]
+
+
+def test_columnar_push_events():
+    r = recorder.ColumnarRecorder(columns=(stack.StackSampleEvent,))
+    e = stack.StackSampleEvent(thread_id=1, frames=[("foo.py", 1, "foo")], nframes=1, wall_time_ns=5)
+    r.push_events([e])
+    r.push_event(event.Event())
+    events = r.reset()
+    assert list(events[stack.StackSampleEvent]) == [e]
+    assert len(events[event.Event]) == 1
+
+
+def test_columnar_push_sample_and_events():
+    r = recorder.ColumnarRecorder(columns=(stack.StackSampleEvent,))
+    labels = (None,) * len(recorder.ColumnarRecorder.LABEL_FIELDS)
+    r.push_sample(stack.StackSampleEvent, 1000, 1, (("sample.py", 1, "sample"),), 1, labels, (0, 0))
+    e = stack.StackSampleEvent(thread_id=2, frames=[("event.py", 1, "event")], nframes=1)
+    r.push_events([e])
+    view = r.reset()[stack.StackSampleEvent]
+    # The events pushed as objects are not stored in the columns
+    assert list(view.thread_ids) == [1]
+    assert len(view) == 2
+    sample, event = list(view)
+    assert sample.frames == [("sample.py", 1, "sample")]
+    assert event is e
+
+
+def test_columnar_reuse_columns():
+    r = recorder.ColumnarRecorder(columns=(stack.StackSampleEvent,))
+    labels = (None,) * len(recorder.ColumnarRecorder.LABEL_FIELDS)
+    columns = r._columns[stack.StackSampleEvent]
+    r.push_sample(stack.StackSampleEvent, 1000, 1, (("foo.py", 1, "foo"),), 1, labels, (0, 0))
+    view = r.reset()[stack.StackSampleEvent]
+    assert list(view.timestamps) == [1000]
+    assert r._columns[stack.StackSampleEvent] is not columns
+
+    # The columns returned by the previous reset are cleared and reused
+    r.reset()
+    assert r._columns[stack.StackSampleEvent] is columns
+    r.push_sample(stack.StackSampleEvent, 2000, 2, (("bar.py", 2, "bar"),), 1, labels, (0, 0))
+    [e] = list(r.reset()[stack.StackSampleEvent])
+    assert e.timestamp == 2000
+    assert e.frames == [("bar.py", 2, "bar")]
+    # The tables of the previous views are not cleared
+    assert view.stacks == [((("foo.py", 1, "foo"),), 1)]
+
+
+def test_columnar_stack_collector():
+    r = recorder.ColumnarRecorder(columns=(stack.StackSampleEvent,))
+    c = stack.StackCollector(r)
+    c._init()
+    stack_events, exc_events = c.collect()
+    assert stack_events == []
+    view = r.reset()[stack.StackSampleEvent]
+    assert len(view) >= 1
+    for e in view:
+        if e.thread_name == "MainThread":
+            assert e.frames[0][2] == "test_columnar_stack_collector"
+            break
+    else:
+        pytest.fail("Unable to find the main thread")
@@ -0,0 +1,54 @@
+import gc
+
+import pytest
+
+from ddtrace.internal.runtime import gc_pauses
+
+
+pytestmark = pytest.mark.skipif(not gc_pauses.AVAILABLE, reason="gc.callbacks is only available on Python 3")
+
+
+def test_register_unregister():
+    pauses = []
+
+    def listener(generation, duration):
+        pauses.append((generation, duration))
+
+    assert gc_pauses.register(listener)
+    # Registering twice is a no-op
+    assert gc_pauses.register(listener)
+    try:
+        assert gc.callbacks.count(gc_pauses._on_gc) == 1
+        gc.collect()
+        gc.collect(0)
+    finally:
+        gc_pauses.unregister(listener)
+
+    assert gc_pauses._on_gc not in gc.callbacks
+    assert pauses[-2][0] == 2
+    assert pauses[-1][0] == 0
+    assert all(duration > 0 for _, duration in pauses)
+
+    del pauses[:]
+    gc.collect()
+    assert pauses == []
+
+
+def test_listener_error():
+    pauses = []
+
+    def failing(generation, duration):
+        raise ValueError()
+
+    def listener(generation, duration):
+        pauses.append(generation)
+
+    gc_pauses.register(failing)
+    gc_pauses.register(listener)
+    try:
+        gc.collect()
+    finally:
+        gc_pauses.unregister(failing)
+        gc_pauses.unregister(listener)
+
+    assert pauses[-1] == 2
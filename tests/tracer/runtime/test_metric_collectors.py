@@ -1,9 +1,28 @@
+import gc
+import sys
+import threading
+
+import pytest
+
+from ddtrace.internal.runtime import gc_pauses
+from ddtrace.internal.runtime.constants import FD_COUNT
 from ddtrace.internal.runtime.constants import GC_COUNT_GEN0
+from ddtrace.internal.runtime.constants import GC_PAUSE_GEN2
+from ddtrace.internal.runtime.constants import GC_PAUSE_RUNTIME_METRICS
 from ddtrace.internal.runtime.constants import GC_RUNTIME_METRICS
+from ddtrace.internal.runtime.constants import MEM_RSS
+from ddtrace.internal.runtime.constants import PROC_RUNTIME_METRICS
 from ddtrace.internal.runtime.constants import PSUTIL_RUNTIME_METRICS
+from ddtrace.internal.runtime.constants import THREAD_COUNT
+from ddtrace.internal.runtime.constants import THREAD_CPU_TIME
+from ddtrace.internal.runtime.metric_collectors import GCPauseRuntimeMetricCollector
 from ddtrace.internal.runtime.metric_collectors import GCRuntimeMetricCollector
+from ddtrace.internal.runtime.metric_collectors import PROCFS_AVAILABLE
 from ddtrace.internal.runtime.metric_collectors import PSUtilRuntimeMetricCollector
+from ddtrace.internal.runtime.metric_collectors import ProcRuntimeMetricCollector
 from ddtrace.internal.runtime.metric_collectors import RuntimeMetricCollector
+from ddtrace.internal.runtime.metric_collectors import ThreadCPURuntimeMetricCollector
+from ddtrace.vendor import psutil
 from tests.utils import BaseTestCase
 
 
@@ -29,6 +48,76 @@ class TestPSUtilRuntimeMetricCollector(BaseTestCase):
             self.assertIsNotNone(value)
 
 
+@pytest.mark.skipif(not PROCFS_AVAILABLE, reason="/proc is only available on Linux")
+class TestProcRuntimeMetricCollector(BaseTestCase):
+    def test_metrics(self):
+        collector = ProcRuntimeMetricCollector()
+        try:
+            metrics = dict(collector.collect(PROC_RUNTIME_METRICS))
+            assert set(metrics) == PROC_RUNTIME_METRICS
+
+            proc = psutil.Process()
+            assert metrics[THREAD_COUNT] == proc.num_threads()
+            assert metrics[FD_COUNT] > 0
+            # The memory might change between the two calls
+            assert abs(metrics[MEM_RSS] - proc.memory_info().rss) < 1024 * 1024
+        finally:
+            collector.close()
+
+    def test_deltas(self):
+        collector = ProcRuntimeMetricCollector()
+        try:
+            collector.collect(PROC_RUNTIME_METRICS)
+            sum(i * i for i in range(1000000))
+            metrics = dict(collector.collect(PROC_RUNTIME_METRICS))
+            for value in metrics.values():
+                assert value >= 0
+        finally:
+            collector.close()
+
+    def test_reuse_file_descriptors(self):
+        collector = ProcRuntimeMetricCollector()
+        try:
+            collector.collect(PROC_RUNTIME_METRICS)
+            fds = dict(collector.collect(PROC_RUNTIME_METRICS))[FD_COUNT]
+            assert dict(collector.collect(PROC_RUNTIME_METRICS))[FD_COUNT] == fds
+        finally:
+            collector.close()
+
+
+@pytest.mark.skipif(not PROCFS_AVAILABLE, reason="/proc is only available on Linux")
+def test_thread_cpu_time():
+    collector = ThreadCPURuntimeMetricCollector()
+    stop = threading.Event()
+    thread = threading.Thread(target=stop.wait)
+    thread.start()
+    try:
+        metrics = collector.collect([THREAD_CPU_TIME])
+    finally:
+        stop.set()
+        thread.join()
+
+    # One value per thread
+    assert len(metrics) >= 2
+    assert all(key == THREAD_CPU_TIME and value >= 0 for key, value in metrics)
+
+
+@pytest.mark.skipif(sys.version_info < (3,), reason="gc.callbacks is only available on Python 3")
+def test_gc_pauses():
+    collector = GCPauseRuntimeMetricCollector()
+    try:
+        assert gc_pauses._on_gc in gc.callbacks
+        collector.collect(GC_PAUSE_RUNTIME_METRICS)
+        gc.collect()
+        metrics = collector.collect(GC_PAUSE_RUNTIME_METRICS)
+        assert (GC_PAUSE_GEN2, metrics[-1][1]) in metrics
+        assert all(value > 0 for _, value in metrics)
+        assert collector.collect(GC_PAUSE_RUNTIME_METRICS) == []
+    finally:
+        collector.close()
+    assert gc_pauses._on_gc not in gc.callbacks
+
+
 class TestGCRuntimeMetricCollector(BaseTestCase):
     def test_metrics(self):
         collector = GCRuntimeMetricCollector()
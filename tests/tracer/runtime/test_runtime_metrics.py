@@ -1,15 +1,20 @@
 import contextlib
+import gc
 import os
 import time
 import warnings
 
 import mock
+import pytest
 
 from ddtrace.ext import SpanTypes
+from ddtrace.internal.runtime import gc_pauses
 from ddtrace.internal.runtime.constants import DEFAULT_RUNTIME_METRICS
 from ddtrace.internal.runtime.constants import ENV
 from ddtrace.internal.runtime.constants import GC_COUNT_GEN0
 from ddtrace.internal.runtime.constants import SERVICE
+from ddtrace.internal.runtime.constants import THREAD_CPU_TIME
+from ddtrace.internal.runtime.metric_collectors import PROCFS_AVAILABLE
 from ddtrace.internal.runtime.runtime_metrics import RuntimeMetrics
 from ddtrace.internal.runtime.runtime_metrics import RuntimeTags
 from ddtrace.internal.runtime.runtime_metrics import RuntimeWorker
@@ -111,6 +116,8 @@ class TestRuntimeWorker(TracerTestCase):
             DEFAULT_RUNTIME_METRICS & set([gauge.split(":")[0] for packet in received for gauge in packet.split("\n")])
             == DEFAULT_RUNTIME_METRICS
         )
+        if PROCFS_AVAILABLE:
+            assert any(THREAD_CPU_TIME + ":" in packet and "|d" in packet for packet in received)
 
         # check to last set of metrics returned to confirm tags were set
         for gauge in received[-1:]:
@@ -147,6 +154,20 @@ class TestRuntimeWorker(TracerTestCase):
             self.assertEqual(len(w), 2)
             self.assertTrue(all(issubclass(_.category, DeprecationWarning) for _ in w))
 
+    @pytest.mark.skipif(not gc_pauses.AVAILABLE, reason="gc.callbacks is only available on Python 3")
+    def test_gc_pauses_on_root_span(self):
+        with runtime_metrics_service(tracer=self.tracer):
+            with self.trace("root") as root:
+                with self.trace("child") as child:
+                    gc.collect()
+                    gc.collect()
+            # Collections that happen outside of a trace are ignored
+            gc.collect()
+
+        assert root.get_metric("gc.pause.gen2.count") == 2
+        assert root.get_metric("gc.pause.gen2.duration") > 0
+        assert child.get_metric("gc.pause.gen2.count") is None
+
     def test_span_no_runtime_tags(self):
         with self.start_span("root") as root:
             with self.start_span("child", child_of=root.context) as child:
@@ -0,0 +1,84 @@
+import threading
+
+import mock
+
+from ddtrace.internal.dogstatsd import AggregatingDogStatsd
+from ddtrace.internal.dogstatsd import get_dogstatsd_client
+
+
+def _client(**kwargs):
+    client = AggregatingDogStatsd(**kwargs)
+    client.disable_telemetry()
+    client.socket = mock.Mock()
+    return client
+
+
+def _sent(client):
+    return [c.args[0].decode("utf-8") for c in client.socket.send.mock_calls]
+
+
+def test_get_dogstatsd_client():
+    assert isinstance(get_dogstatsd_client("udp://localhost:8125"), AggregatingDogStatsd)
+    assert isinstance(get_dogstatsd_client("unix:///tmp/dsd.sock"), AggregatingDogStatsd)
+
+
+def test_aggregation():
+    client = _client(constant_tags=["lang:python"])
+    client.increment("count")
+    client.increment("count", 2)
+    client.decrement("count")
+    client.increment("count", tags=["a:b"])
+    client.gauge("gauge", 1)
+    client.gauge("gauge", 3)
+    client.distribution("dist", 1, tags=["a:b"])
+    client.distribution("dist", 2, tags=["a:b"])
+    assert client.socket.send.call_count == 0
+
+    client.flush()
+    assert _sent(client) == [
+        "\n".join(
+            [
+                "count:2|c|#lang:python",
+                "count:1|c|#a:b,lang:python",
+                "gauge:3|g|#lang:python",
+                "dist:1|d|#a:b,lang:python",
+                "dist:2|d|#a:b,lang:python",
+            ]
+        )
+    ]
+
+    # Nothing is sent once the metrics are flushed
+    client.flush()
+    assert client.socket.send.call_count == 1
+
+
+def test_flush_max_payload_size():
+    client = _client(max_buffer_len=64)
+    for i in range(10):
+        client.distribution("datadog.tracer.metric", i)
+    client.flush()
+
+    datagrams = _sent(client)
+    assert len(datagrams) == 5
+    assert all(len(d) <= 64 for d in datagrams)
+    assert "\n".join(datagrams).split("\n") == ["datadog.tracer.metric:%d|d" % i for i in range(10)]
+
+
+def test_threads():
+    client = _client()
+
+    def record():
+        for _ in range(1000):
+            client.increment("count")
+            client.distribution("dist", 1)
+
+    threads = [threading.Thread(target=record) for _ in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    client.flush()
+
+    packets = "\n".join(_sent(client)).split("\n")
+    assert packets.count("count:4000|c") == 1
+    assert packets.count("dist:1|d") == 4000
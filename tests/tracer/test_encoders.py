@@ -10,6 +10,7 @@ from hypothesis.strategies import dictionaries
 from hypothesis.strategies import floats
 from hypothesis.strategies import integers
 from hypothesis.strategies import text
+import mock
 import msgpack
 import pytest
 
@@ -22,6 +23,7 @@ from ddtrace.internal.encoding import JSONEncoder
 from ddtrace.internal.encoding import JSONEncoderV2
 from ddtrace.internal.encoding import MsgpackEncoder
 from ddtrace.internal.encoding import _EncoderBase
+from ddtrace.internal.encoding import json_dumps
 from ddtrace.span import Span
 from ddtrace.span import SpanTypes
 from ddtrace.tracer import Tracer
@@ -142,6 +144,16 @@ class TestEncoders(TestCase):
                 assert isinstance(items[i][j]["span_id"], string_type)
                 assert items[i][j]["span_id"] == "0000000000AAAAAA"
 
+    def test_json_dumps_orjson(self):
+        orjson = mock.Mock()
+        orjson.dumps.return_value = b'{"a":1}'
+        with mock.patch("ddtrace.internal.encoding.orjson", orjson):
+            assert json_dumps({"a": 1}) == '{"a":1}'
+
+            # Fall back to the standard library for the objects orjson does not support
+            orjson.dumps.side_effect = TypeError
+            assert json.loads(json_dumps({"a": 2 ** 64})) == {"a": 2 ** 64}
+
     def test_encode_traces_msgpack(self):
         # test encoding for MsgPack format
         encoder = MsgpackEncoder(2 << 10, 2 << 10)
@@ -1,4 +1,5 @@
 from ddtrace import monkey
+from ddtrace.vendor import wrapt
 from tests.subprocesstest import SubprocessTestCase
 from tests.subprocesstest import run_in_subprocess
 
@@ -18,6 +19,8 @@ class TestPatching(SubprocessTestCase):
     def test_patch_all_env_override_sqlite_none(self):
         # Make sure sqlite is enabled by default.
         monkey.patch_all()
+        import sqlite3  # noqa
+
         assert "sqlite3" in monkey._PATCHED_MODULES
 
     @run_in_subprocess(env_overrides=dict(DD_TRACE_SQLITE3_ENABLED="false"))
@@ -53,3 +56,62 @@ class TestPatching(SubprocessTestCase):
     def test_patch_all_env_override_httplib_enabled(self):
         monkey.patch_all()
         assert "httplib" in monkey._PATCHED_MODULES
+
+    @run_in_subprocess(env_overrides=dict())
+    def test_patch_all_library_not_installed(self):
+        # The integrations of the libraries that are not installed are not imported
+        import sys
+
+        monkey._MODULES_FOR_CONTRIB["sqlite3"] = ("module_dne",)
+        monkey.patch_all()
+        assert "sqlite3" not in monkey._PATCHED_MODULES
+        assert "ddtrace.contrib.sqlite3" not in sys.modules
+
+    @run_in_subprocess()
+    def test_patch_raise_exception_library_not_installed(self):
+        # Manual patching reports the libraries that are not installed, even for the modules patched on import
+        if monkey._is_installed("cassandra"):
+            self.skipTest("cassandra is installed")
+
+        monkey._PATCH_ON_IMPORT["cassandra"] = ("cassandra.cluster",)
+        with self.assertRaises(AttributeError) as e:
+            monkey.patch(cassandra=True)
+
+        assert "ddtrace.contrib.cassandra.patch is not found" in str(e.exception)
+        assert "cassandra" not in monkey._PATCHED_MODULES
+
+    @run_in_subprocess()
+    def test_patch_on_import(self):
+        # The modules patched on import are only reported as patched once imported
+        import sys
+
+        assert "sqlite3" not in sys.modules
+        monkey._PATCH_ON_IMPORT["sqlite3"] = ("sqlite3",)
+        monkey.patch(sqlite3=True)
+        assert "sqlite3" not in monkey._PATCHED_MODULES
+        assert "ddtrace.contrib.sqlite3" not in sys.modules
+
+        import sqlite3
+
+        assert "sqlite3" in monkey._PATCHED_MODULES
+        assert isinstance(sqlite3.connect, wrapt.ObjectProxy)
+
+    @run_in_subprocess(env_overrides=dict(DD_SQLITE_TRACE_FETCH_METHODS="true"))
+    def test_patch_all_on_import(self):
+        # patch_all() registers the settings of the integrations and only imports them with their library
+        import sys
+
+        from ddtrace import config
+
+        assert "sqlite3" not in sys.modules
+        monkey.patch_all()
+        assert "sqlite3" not in monkey._PATCHED_MODULES
+        assert "ddtrace.contrib.sqlite3" not in sys.modules
+        assert config.sqlite.trace_fetch_methods is True
+        config.sqlite._default_service = "my-sqlite"
+
+        import sqlite3
+
+        assert "sqlite3" in monkey._PATCHED_MODULES
+        assert isinstance(sqlite3.connect, wrapt.ObjectProxy)
+        assert config.sqlite._default_service == "my-sqlite"
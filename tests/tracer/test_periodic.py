@@ -139,3 +139,135 @@ def test_is_alive_before_start():
 
     t = periodic.PeriodicRealThreadClass()(1, x)
     assert not t.is_alive()
+
+
+def test_scheduled_task():
+    x = {"runs": 0}
+
+    task_run = Event()
+
+    def _run_periodic():
+        x["runs"] += 1
+        if x["runs"] == 3:
+            task_run.set()
+
+    def _on_shutdown():
+        x["DOWN"] = True
+
+    t = periodic.ScheduledPeriodicTask(0.001, _run_periodic, name="test", on_shutdown=_on_shutdown)
+    t.start()
+    with pytest.raises(RuntimeError):
+        t.start()
+    task_run.wait()
+    assert t.is_alive()
+    assert t.ident == periodic.get_scheduler().ident
+    t.stop()
+    t.join()
+    assert not t.is_alive()
+    assert x["DOWN"]
+
+
+def test_scheduled_task_error():
+    x = {}
+
+    task_run = Event()
+
+    def _run_periodic():
+        task_run.set()
+        raise ValueError
+
+    def _on_shutdown():
+        x["DOWN"] = True
+
+    t = periodic.ScheduledPeriodicTask(0.001, _run_periodic, on_shutdown=_on_shutdown)
+    t.start()
+    task_run.wait()
+    t.join()
+    t.stop()
+    assert not t.is_alive()
+    assert "DOWN" not in x
+
+
+def test_scheduled_tasks_deadline_order():
+    runs = []
+    done = Event()
+
+    def _periodic(name):
+        def _run():
+            runs.append(name)
+            if len(runs) == 4:
+                done.set()
+
+        return _run
+
+    tasks = [
+        periodic.ScheduledPeriodicTask(0.25, _periodic("slow")),
+        periodic.ScheduledPeriodicTask(0.1, _periodic("fast")),
+    ]
+    for t in tasks:
+        t.start()
+    done.wait()
+    for t in tasks:
+        t.stop()
+        t.join()
+
+    assert runs[:4] == ["fast", "fast", "slow", "fast"]
+
+
+def test_periodic_services_share_thread():
+    services = [periodic.PeriodicService(1), periodic.PeriodicService(2)]
+    for s in services:
+        s.start()
+    try:
+        assert all(isinstance(s._worker, periodic.ScheduledPeriodicTask) for s in services)
+        assert services[0]._worker.ident == services[1]._worker.ident == periodic.get_scheduler().ident
+    finally:
+        for s in services:
+            s.stop()
+            s.join()
+
+
+def test_periodic_service_io_thread():
+    class IOService(periodic.PeriodicService):
+        _scheduler_name = periodic.IO_SCHEDULER
+
+    services = [periodic.PeriodicService(1), IOService(1)]
+    for s in services:
+        s.start()
+    try:
+        # The services doing network I/O do not delay the others
+        assert services[0]._worker.ident == periodic.get_scheduler().ident
+        assert services[1]._worker.ident == periodic.get_scheduler(periodic.IO_SCHEDULER).ident
+        assert services[0]._worker.ident != services[1]._worker.ident
+    finally:
+        for s in services:
+            s.stop()
+            s.join()
+
+
+def test_periodic_service_dedicated_thread():
+    class DedicatedService(periodic.PeriodicService):
+        _shared_thread = False
+
+    s = DedicatedService(1)
+    s.start()
+    try:
+        assert isinstance(s._worker, periodic.PeriodicThread)
+    finally:
+        s.stop()
+        s.join()
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork not available")
+def test_scheduler_fork():
+    scheduler = periodic.get_scheduler()
+    pid = os.fork()
+    if pid == 0:
+        # The thread of the parent does not exist in the child
+        child_scheduler = periodic.get_scheduler()
+        ok = child_scheduler is not scheduler and child_scheduler.is_alive()
+        os._exit(0 if ok else 1)
+
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0
+    assert periodic.get_scheduler() is scheduler
@@ -0,0 +1,60 @@
+import gc
+import os
+import sys
+
+import mock
+import pytest
+
+from ddtrace.internal import hostname
+import ddtrace.preload
+
+
+def test_freeze_warm_up():
+    with mock.patch.object(hostname, "_hostname", None), mock.patch.object(
+        ddtrace.preload, "_gc_enabled_in_child", True
+    ):
+        with mock.patch("gc.freeze", create=True) as freeze:
+            ddtrace.preload.freeze()
+        freeze.assert_called_once_with()
+        assert hostname._hostname is not None
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="gc.freeze is only available on Python 3.7 and later")
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork not available")
+def test_freeze_fork():
+    pid = os.fork()
+    if pid == 0:
+        # Freeze in a child process not to leak the objects of the test process
+        ddtrace.preload.disable_gc()
+        ddtrace.preload.freeze()
+        if gc.get_freeze_count() == 0 or gc.isenabled():
+            os._exit(1)
+
+        # The garbage collector is enabled in the workers
+        worker = os.fork()
+        if worker == 0:
+            os._exit(0 if gc.isenabled() else 1)
+        _, status = os.waitpid(worker, 0)
+        os._exit(os.WEXITSTATUS(status))
+
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7), reason="gc.freeze is only available on Python 3.7 and later")
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork not available")
+def test_freeze_fork_gc_disabled_by_application():
+    pid = os.fork()
+    if pid == 0:
+        gc.disable()
+        ddtrace.preload.freeze()
+
+        # The garbage collector stays disabled in the workers
+        worker = os.fork()
+        if worker == 0:
+            os._exit(1 if gc.isenabled() else 0)
+        _, status = os.waitpid(worker, 0)
+        os._exit(os.WEXITSTATUS(status))
+
+    _, status = os.waitpid(pid, 0)
+    assert os.WEXITSTATUS(status) == 0
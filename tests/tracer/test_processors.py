@@ -7,7 +7,9 @@ import pytest
 from ddtrace import Span
 from ddtrace.internal.processor import SpanProcessor
 from ddtrace.internal.processor.trace import SpanAggregator
+from ddtrace.internal.processor.trace import TraceLazyResourceProcessor
 from ddtrace.internal.processor.trace import TraceProcessor
+from ddtrace.internal.processor.trace import TraceSamplingProcessor
 from tests.utils import DummyWriter
 
 
@@ -216,3 +218,48 @@ def test_aggregator_partial_flush_2_spans():
     assert writer.pop() == [child1, child2]
     parent.finish()
     assert writer.pop() == [parent]
+
+
+def test_lazy_resource_processor():
+    def resource(span):
+        span.set_tag("computed", "yes")
+        return "computed resource"
+
+    def bad_resource(span):
+        raise ValueError
+
+    lazy = Span(None, "lazy")
+    lazy._lazy_resource = resource
+    bad = Span(None, "bad")
+    bad._lazy_resource = bad_resource
+    regular = Span(None, "regular", resource="regular resource")
+
+    # The resource stays a string until the trace is processed
+    assert lazy.resource == "lazy"
+
+    assert TraceLazyResourceProcessor().process_trace([lazy, bad, regular]) == [lazy, bad, regular]
+    assert lazy.resource == "computed resource"
+    assert lazy.get_tag("computed") == "yes"
+    assert lazy._lazy_resource is None
+    assert bad.resource == "bad"
+    assert regular.resource == "regular resource"
+
+
+def test_lazy_resource_processor_dropped_trace():
+    resource = mock.Mock(return_value="resource")
+    writer = DummyWriter()
+    aggr = SpanAggregator(
+        partial_flush_enabled=False,
+        partial_flush_min_spans=0,
+        trace_processors=[TraceSamplingProcessor(), TraceLazyResourceProcessor()],
+        writer=writer,
+    )
+
+    span = Span(None, "span", on_finish=[aggr.on_span_finish])
+    span._lazy_resource = resource
+    span.sampled = False
+    aggr.on_span_start(span)
+    span.finish()
+
+    assert writer.pop() == []
+    resource.assert_not_called()
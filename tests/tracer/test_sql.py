@@ -0,0 +1,56 @@
+import pytest
+
+from ddtrace.internal.sql import _obfuscate_cached
+from ddtrace.internal.sql import obfuscate_query
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("SELECT * FROM users", "SELECT * FROM users"),
+        ("SELECT * FROM users WHERE id = 42", "SELECT * FROM users WHERE id = ?"),
+        ("SELECT * FROM users WHERE id IN (1, 2, 3)", "SELECT * FROM users WHERE id IN (?)"),
+        ("SELECT * FROM users WHERE id IN ( 'a' , 'b' )", "SELECT * FROM users WHERE id IN (?)"),
+        ("SELECT * FROM users WHERE name = 'it''s'", "SELECT * FROM users WHERE name = ?"),
+        ("SELECT * FROM users WHERE name = 'a -- b'", "SELECT * FROM users WHERE name = ?"),
+        ("SELECT a1, t2.b FROM t2 WHERE x > 1.5e3", "SELECT a1, t2.b FROM t2 WHERE x > ?"),
+        ('SELECT "col1" FROM `t` WHERE v = 0xFF', 'SELECT "col1" FROM `t` WHERE v = ?'),
+        ("SELECT x::int FROM t WHERE a = $1 AND b = %s AND c = %(c)s AND d = :d", None),
+        ("SELECT 1 -- comment\nFROM  t /* another\ncomment */ WHERE\n\ta = 2", "SELECT ? FROM t WHERE a = ?"),
+        ("INSERT INTO t (a, b) VALUES (1, 'a'), (2, 'b')", "INSERT INTO t (a, b) VALUES (?), (?)"),
+        ("SELECT 1x, 1.foo FROM t1x WHERE a = 12b", None),
+        ("SELECT * FROM t WHERE x > -1.5e3 AND y IN (-1, +2)", "SELECT * FROM t WHERE x > ? AND y IN (?)"),
+        ("SELECT -1, a-1, a - 1, a -1, (a) -1, f(-1)", "SELECT ?, a-?, a - ?, a -?, (a) -?, f(?)"),
+        ('SELECT "col1" FROM t WHERE v = "value"', None),
+    ],
+)
+def test_obfuscate_query(query, expected):
+    assert obfuscate_query(query) == (query if expected is None else expected)
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ('SELECT `col1` FROM t WHERE v = "value"', "SELECT `col1` FROM t WHERE v = ?"),
+        ('SELECT * FROM t WHERE v = "it\\"s" AND w = "a""b"', "SELECT * FROM t WHERE v = ? AND w = ?"),
+        ('SELECT * FROM t WHERE v IN ("a", "b")', "SELECT * FROM t WHERE v IN (?)"),
+    ],
+)
+def test_obfuscate_query_mysql(query, expected):
+    assert obfuscate_query(query, "mysql") == expected
+
+
+def test_obfuscate_query_cached():
+    query = "SELECT * FROM cached WHERE id = 1"
+    obfuscate_query(query)
+    hits = _obfuscate_cached.stats.hits
+    assert obfuscate_query(query) == "SELECT * FROM cached WHERE id = ?"
+    assert _obfuscate_cached.stats.hits == hits + 1
+
+
+def test_obfuscate_query_cached_lists():
+    obfuscate_query("SELECT * FROM cached WHERE id IN (1, 2, 3)")
+    hits = _obfuscate_cached.stats.hits
+    assert obfuscate_query("SELECT * FROM cached WHERE id IN (4, 5, 6, 7)") == "SELECT * FROM cached WHERE id IN (?)"
+    assert obfuscate_query("SELECT * FROM cached WHERE id IN ('a', 'b')") == "SELECT * FROM cached WHERE id IN (?)"
+    assert _obfuscate_cached.stats.hits == hits + 2
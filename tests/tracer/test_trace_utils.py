@@ -246,6 +246,60 @@ class TestHeaders(object):
         )
         assert span.get_tag("http.response.headers.content-type") == "some;value"
 
+    def test_asgi_headers(self, span, integration_config):
+        integration_config.http.trace_headers(["Content-Type", "x-custom"])
+        trace_utils._store_response_headers(
+            [(b"content-type", b"some;value"), (b"x-custom", b"\xc3\xa9"), (b"other", b"value")],
+            span,
+            integration_config,
+        )
+        assert span.get_tag("http.response.headers.content-type") == "some;value"
+        assert span.get_tag("http.response.headers.x-custom") == u"\xe9"
+        assert span.get_tag("http.response.headers.other") is None
+
+    def test_wsgi_environ(self, span, integration_config):
+        integration_config.http.trace_headers(["Content-Type", "X-Custom", "api.token"])
+        environ = {
+            "CONTENT_TYPE": "some;value",
+            "HTTP_X_CUSTOM": "custom",
+            "HTTP_OTHER": "other",
+            "REQUEST_METHOD": "GET",
+        }
+        trace_utils._store_wsgi_request_headers(environ, span, integration_config)
+        assert span.get_tag("http.request.headers.content-type") == "some;value"
+        assert span.get_tag("http.request.headers.x-custom") == "custom"
+        assert span.get_tag("http.request.headers.other") is None
+        assert span.get_tag("http.request.headers.api_token") is None
+
+    def test_global_whitelist(self, span, config, integration_config):
+        config.trace_headers("Content-Type")
+        trace_utils._store_request_headers({"Content-Type": "some;value"}, span, integration_config)
+        trace_utils._store_wsgi_request_headers({"CONTENT_TYPE": "other;value"}, span, integration_config)
+        assert span.get_tag("http.request.headers.content-type") == "other;value"
+
+        # The integration whitelist takes precedence
+        integration_config.http.trace_headers("Max-Age")
+        trace_utils._store_response_headers(
+            {"Content-Type": "some;value", "Max-Age": "1"},
+            span,
+            integration_config,
+        )
+        assert span.get_tag("http.response.headers.content-type") is None
+        assert span.get_tag("http.response.headers.max-age") == "1"
+
+    def test_whitelist_updated(self, span, integration_config):
+        integration_config.http.trace_headers("Content-Type")
+        trace_utils._store_response_headers({"Content-Type": "some;value", "Max-Age": "1"}, span, integration_config)
+        assert span.get_tag("http.response.headers.max-age") is None
+
+        integration_config.http.trace_headers("Max-Age")
+        trace_utils._store_response_headers({"Content-Type": "some;value", "Max-Age": "1"}, span, integration_config)
+        assert span.get_tag("http.response.headers.max-age") == "1"
+
+        integration_config.http._whitelist_headers = set(["content-type"])
+        trace_utils._store_response_headers({"Max-Age": "2"}, span, integration_config)
+        assert span.get_tag("http.response.headers.max-age") == "1"
+
 
 @pytest.mark.parametrize(
     "pin,config_val,default,global_service,expected",
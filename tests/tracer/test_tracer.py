@@ -804,9 +804,25 @@ class EnvTracerTestCase(TracerTestCase):
         assert not _has_aws_lambda_agent_extension()
         tracer = Tracer()
         assert isinstance(tracer.writer, LogWriter)
+        # The traces are not buffered by default
+        assert tracer.writer._buffer_size == 0
         tracer.configure(enabled=True)
         assert isinstance(tracer.writer, LogWriter)
 
+    @run_in_subprocess(
+        env_overrides=dict(AWS_LAMBDA_FUNCTION_NAME="my-func", DD_TRACE_LOG_WRITER_BUFFER_SIZE_BYTES="204800")
+    )
+    def test_flush_with_lambda(self):
+        tracer = Tracer()
+        with mock.patch("sys.stdout") as out:
+            tracer.writer.out = out
+            with tracer.trace("root"):
+                pass
+            out.write.assert_not_called()
+
+            tracer.flush()
+            out.write.assert_called_once()
+
     @run_in_subprocess(env_overrides=dict(AWS_LAMBDA_FUNCTION_NAME="my-func"))
     def test_detect_agent_config_with_lambda_extension(self):
         def mock_os_path_exists(path):
@@ -1,5 +1,6 @@
 from functools import partial
 import os
+import threading
 import typing
 import unittest
 import warnings
@@ -368,12 +369,15 @@ def cached_test_recipe(expensive, cheap, witness, cache_size):
 
     assert witness.call_count == 1 + cache_size
 
-    MAX_FOO = "Foo%d" % (cache_size - 1)
+    FIRST_ONCE_FOO = "Foo%d" % (cache_size >> 1)
 
     cheap("last drop")  # Forces least frequent elements out of the cache
     assert witness.call_count == 2 + cache_size
 
-    cheap(MAX_FOO)  # Check MAX_FOO was dropped
+    cheap(FIRST_ONCE_FOO)  # Check the oldest element only used once was dropped
+    assert witness.call_count == 3 + cache_size
+
+    cheap("Foo0")  # Check a more frequently used element was retained
     assert witness.call_count == 3 + cache_size
 
     cheap("last drop")  # Check last drop was retained
@@ -395,6 +399,72 @@ def test_cached():
     cached_test_recipe(expensive, cheap, witness, cache_size)
 
 
+def test_cached_stats():
+    @cached(4)
+    def cheap(key):
+        return key
+
+    for key in ("a", "a", "b", "c", "d", "e", "a"):
+        assert cheap(key) == key
+
+    assert cheap.stats.misses == 5
+    assert cheap.stats.hits == 2
+    assert cheap.stats.evictions == 1
+    assert repr(cheap.stats) == "CacheStats(hits=2, misses=5, evictions=1)"
+
+
+def test_cached_none():
+    witness = mock.Mock(return_value=None)
+
+    @cached(4)
+    def cheap(key):
+        return witness(key)
+
+    assert cheap("a") is None
+    assert cheap("a") is None
+    assert witness.call_count == 1
+
+
+def test_cached_bounded():
+    witness = mock.Mock()
+    cache_size = 16
+
+    @cached(cache_size)
+    def cheap(key):
+        witness(key)
+        return key
+
+    for i in range(10 * cache_size):
+        cheap(i)
+        cheap(i % 4)
+
+    # The frequently used keys are retained
+    witness.reset_mock()
+    for i in range(4):
+        cheap(i)
+    assert witness.call_count == 0
+
+    assert cheap.stats.misses - cheap.stats.evictions == cache_size
+
+
+def test_cached_threads():
+    @cached(64)
+    def cheap(key):
+        return key * 2
+
+    def target():
+        for i in range(1000):
+            assert cheap(i % 128) == (i % 128) * 2
+
+    threads = [threading.Thread(target=target) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert cheap.stats.misses - cheap.stats.evictions <= 64
+
+
 def test_cachedmethod():
     witness = mock.Mock()
     cache_size = 128
@@ -1,3 +1,4 @@
+import json
 import os
 import socket
 import tempfile
@@ -11,6 +12,7 @@ from six.moves import BaseHTTPServer
 from six.moves import socketserver
 
 from ddtrace.constants import KEEP_SPANS_RATE_KEY
+from ddtrace.ext import SpanTypes
 from ddtrace.internal.compat import PY3
 from ddtrace.internal.compat import get_connection_response
 from ddtrace.internal.compat import httplib
@@ -310,19 +312,72 @@ class AgentWriterTests(BaseTestCase):
 class LogWriterTests(BaseTestCase):
     N_TRACES = 11
 
-    def create_writer(self):
+    def create_writer(self, buffer_size=0):
         self.output = DummyOutput()
-        writer = LogWriter(out=self.output)
-        for i in range(self.N_TRACES):
-            writer.write(
-                [Span(tracer=None, name="name", trace_id=i, span_id=j, parent_id=j - 1 or None) for j in range(7)]
-            )
+        writer = LogWriter(out=self.output, buffer_size=buffer_size)
+        self.traces = [self.create_trace(i) for i in range(1, self.N_TRACES + 1)]
+        for trace in self.traces:
+            writer.write(trace)
         return writer
 
+    @staticmethod
+    def create_trace(trace_id, span_type=None):
+        return [
+            Span(tracer=None, name="name", trace_id=trace_id, span_id=j, parent_id=j - 1 or None, span_type=span_type)
+            for j in range(7)
+        ]
+
     def test_log_writer(self):
         self.create_writer()
         self.assertEqual(len(self.output.entries), self.N_TRACES)
 
+    def test_log_writer_buffered(self):
+        writer = self.create_writer(buffer_size=1 << 20)
+        assert self.output.entries == []
+
+        writer.flush_queue()
+        assert len(self.output.entries) == 1
+        # The traces are written like the ones of the unbuffered writer
+        assert self.output.entries[0] == writer.encoder.encode_traces(self.traces) + "\n"
+
+        # Nothing is written once the buffer is flushed
+        writer.stop()
+        assert len(self.output.entries) == 1
+
+    def test_log_writer_buffer_size(self):
+        trace_size = len(LogWriter().encoder.encode_trace(self.create_trace(1)))
+        self.create_writer(buffer_size=trace_size * 3)
+
+        traces = [json.loads(entry)["traces"] for entry in self.output.entries]
+        assert all(entry.endswith("\n") for entry in self.output.entries)
+        assert [len(t) for t in traces] == [3, 3, 3]
+        assert [t[0]["trace_id"] for trace in traces for t in trace] == ["%016X" % i for i in range(1, 10)]
+
+    def test_log_writer_invocation_end(self):
+        writer = LogWriter(out=DummyOutput(), buffer_size=1 << 20)
+        writer.write(self.create_trace(1))
+        writer.write(self.create_trace(2, span_type=SpanTypes.SERVERLESS.value))
+        assert len(writer.out.entries) == 1
+        assert len(json.loads(writer.out.entries[0])["traces"]) == 2
+
+    def test_log_writer_invocation_end_not_root(self):
+        writer = LogWriter(out=DummyOutput(), buffer_size=1 << 20)
+        trace = self.create_trace(1)
+        # The invocation span continues a trace started upstream
+        trace[0].parent_id = 1234
+        trace[3].span_type = SpanTypes.SERVERLESS.value
+        writer.write(trace)
+        assert len(writer.out.entries) == 1
+
+    def test_log_writer_buffer_size_bytes(self):
+        writer = LogWriter(out=DummyOutput(), buffer_size=300)
+        # 100 characters encoded in 200 bytes
+        with mock.patch.object(writer.encoder, "encode_trace", return_value=u"\u00e9" * 100):
+            writer.write(self.create_trace(1))
+            assert writer.out.entries == []
+            writer.write(self.create_trace(2))
+        assert len(writer.out.entries) == 1
+
 
 def test_humansize():
     assert _human_size(0) == "0B"
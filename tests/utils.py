@@ -86,6 +86,7 @@ def override_global_config(values):
         "analytics_enabled",
         "report_hostname",
         "health_metrics_enabled",
+        "sql_obfuscation",
         "env",
         "version",
         "service",